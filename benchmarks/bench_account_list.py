@@ -0,0 +1,81 @@
+"""
+    Dashboard.update_account_list render suresi ve RSS.
+
+    Olcer:
+        listeyi doldurup ilk ekrani cizme suresi
+        islem oncesi / sonrasi resident memory
+
+    Calistirma:
+        QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_account_list [rows ...]
+"""
+
+import gc
+import os
+import resource
+import sys
+import time
+
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.common import synthetic_accounts
+from models.account import Account
+from ui.dashboard import Dashboard
+
+DEFAULT_SIZES = [10_000, 100_000]
+
+
+def rss_mb() -> float:
+    # Linux'ta anlik RSS, digerlerinde tepe deger
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+
+def make_accounts(count: int) -> list[Account]:
+    return [
+        Account(
+            account_id=i + 1,
+            site=row[0],
+            username=row[1],
+            encrypted_password=row[2],
+            category_id=row[3]
+        )
+        for i, row in enumerate(synthetic_accounts(count))
+    ]
+
+
+def bench(app, count: int):
+    accounts = make_accounts(count)
+    dashboard = Dashboard()
+    dashboard.show()
+    app.processEvents()
+    gc.collect()
+
+    before = rss_mb()
+    start = time.perf_counter()
+    dashboard.update_account_list(accounts)
+    dashboard.repaint()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    after = rss_mb()
+
+    print(f"rows={count:<8} render={elapsed * 1000:10.1f}ms rss_delta={after - before:8.1f}MB rss={after:8.1f}MB")
+
+    dashboard.close()
+    dashboard.deleteLater()
+    app.processEvents()
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    app = QApplication(sys.argv[:1])
+    for count in sizes:
+        bench(app, count)
+
+
+if __name__ == "__main__":
+    main()
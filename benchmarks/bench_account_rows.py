@@ -0,0 +1,64 @@
+"""
+    100k satiri hesap nesnesine cevirme: Account.from_row vs AccountView.
+
+    Olculer: sure, tracemalloc ile ayrilan blok sayisi ve tutulan bellek
+    (sqlite satir tuple'lari haric, sadece mapping'in ekledigi).
+
+    Calistirma:
+        python -m benchmarks.bench_account_rows [rows]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import open_vault, populate_accounts, temp_db_path
+from models.account import Account, AccountView
+
+DEFAULT_ROWS = 100_000
+
+
+def measure(label: str, fn, rows: list):
+    gc.collect()
+    start = time.perf_counter()
+    fn(rows)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = fn(rows)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    print(f"{label:<28} {elapsed * 1000:8.1f}ms  blocks={blocks:>8}  retained={size / 1e6:6.1f}MB")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    storage = open_vault(temp_db_path())
+    populate_accounts(storage, count)
+    storage.execute("SELECT * FROM accounts")
+    rows = storage.fetchall()
+    print(f"rows={len(rows)}")
+
+    accounts = measure("Account.from_row", lambda r: [Account.from_row(row) for row in r], rows)
+    views = measure("AccountView.from_rows", AccountView.from_rows, rows)
+
+    # Erisim maliyeti: arama indexi / liste cizimi site + username okur
+    for label, items in (("Account attr access", accounts), ("AccountView attr access", views)):
+        start = time.perf_counter()
+        for item in items:
+            item.site, item.username
+        print(f"{label:<28} {(time.perf_counter() - start) * 1000:8.1f}ms")
+
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
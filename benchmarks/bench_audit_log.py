@@ -0,0 +1,60 @@
+"""
+    Hesap degisikligi basina commit sayisi: senkron log vs buffer'li LogService.
+
+    Her mutasyon = storage.save_account (kendi transaction'i) + logger.info.
+    Commit'ler SQLite trace callback'i ile her iki connection'da sayilir.
+
+    Calistirma:
+        python -m benchmarks.bench_audit_log [mutations]
+"""
+
+import sys
+import time
+
+from benchmarks.common import open_vault, synthetic_accounts, temp_db_path
+from models.account import Account
+from services.log_service import LogService
+from services.storage_service import StorageService
+
+DEFAULT_MUTATIONS = 2_000
+PRAGMAS = {"journal_mode": "WAL", "synchronous": "NORMAL"}
+
+
+def run(buffered: bool, mutations: int):
+    db_path = temp_db_path()
+    open_vault(db_path).close()
+
+    storage = StorageService(db_path, pragmas=PRAGMAS)
+    storage.connect()
+    main_commits = [0]
+    storage.conn.set_trace_callback(
+        lambda sql: main_commits.__setitem__(0, main_commits[0] + (sql.strip().upper() == "COMMIT"))
+    )
+    logger = LogService(storage, buffered=buffered)
+
+    start = time.perf_counter()
+    for row in synthetic_accounts(mutations):
+        account = Account(site=row[0], username=row[1], encrypted_password=row[2], category_id=row[3])
+        account_id = storage.save_account(account)
+        logger.info("ACCOUNT_ADDED", f"id={account_id}")
+    logger.close()
+    elapsed = time.perf_counter() - start
+
+    log_commits = 0 if not buffered else logger.commits
+    total = main_commits[0] + log_commits
+    label = "buffered" if buffered else "synchronous"
+    print(
+        f"{label:<12} mutations={mutations} commits={total:<6} "
+        f"commits/mutation={total / mutations:5.2f} throughput={mutations / elapsed:8.0f}/s"
+    )
+    storage.close()
+
+
+def main():
+    mutations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MUTATIONS
+    run(buffered=False, mutations=mutations)
+    run(buffered=True, mutations=mutations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+    Online backup: adim basina lock suresi ve backup sirasinda
+    ana connection'daki yazma gecikmesi, pages_per_step'e gore.
+
+    Calistirma:
+        python -m benchmarks.bench_backup [rows]
+"""
+
+import os
+import sys
+import threading
+import time
+
+from benchmarks.common import open_vault, populate_accounts, summarize, temp_db_path
+from services.backup_service import BackupService
+from services.storage_service import StorageService
+from utils.helpers import get_storage_profile, load_config
+
+DEFAULT_ROWS = 100_000
+STEP_SIZES = [64, 256, 1024, -1]
+
+
+def measure_writes(db_path: str, pragmas: dict, stop: threading.Event, samples: list[float]):
+    # GUI thread'indeki tek tek yazmalari taklit eder
+    storage = StorageService(db_path, pragmas=pragmas)
+    storage.connect()
+    while not stop.is_set():
+        start = time.perf_counter()
+        storage.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('bench_backup', ?)",
+            (str(start),), commit=True
+        )
+        samples.append(time.perf_counter() - start)
+        time.sleep(0.005)
+    storage.close()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    pragmas = get_storage_profile(load_config(os.path.join("data", "config.json")))
+
+    db_path = temp_db_path()
+    storage = open_vault(db_path)
+    storage.close()
+    storage = StorageService(db_path, pragmas=pragmas)
+    storage.connect()
+    populate_accounts(storage, rows)
+    print(f"db={os.path.getsize(db_path) / 1e6:.1f}MB pragmas={pragmas or 'default'}")
+
+    for pages in STEP_SIZES:
+        backup = BackupService(
+            storage, os.path.join(os.path.dirname(db_path), f"backups-{pages}"),
+            pages_per_step=pages
+        )
+        stop = threading.Event()
+        samples: list[float] = []
+        writer = threading.Thread(target=measure_writes, args=(db_path, pragmas, stop, samples))
+        writer.start()
+        run = backup.backup_now()
+        stop.set()
+        writer.join()
+
+        writes = summarize(samples)
+        print(
+            f"pages/step={pages:<5} ok={run.ok} steps={run.steps:<5} restarts={run.restarts:<2} "
+            f"step p95={run.p95_step_ms:7.2f}ms max={run.max_step_ms:7.2f}ms "
+            f"total={run.total_time * 1000:8.1f}ms integrity={run.integrity_time * 1000:7.1f}ms | "
+            f"write p95={writes['p95_ms']:6.2f}ms max={writes['max_ms']:6.2f}ms"
+        )
+
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
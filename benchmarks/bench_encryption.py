@@ -0,0 +1,69 @@
+"""
+    EncryptionService encrypt/decrypt maliyeti.
+
+    Karsilastirir:
+        her cagrida yeni Fernet kurmak (eski davranis)
+        cache'li Fernet ile encrypt/decrypt
+        encrypt_many / decrypt_many
+
+    Calistirma:
+        python -m benchmarks.bench_encryption [entries]
+"""
+
+import sys
+import time
+
+from cryptography.fernet import Fernet
+
+from services.encryption_service import EncryptionService
+
+DEFAULT_ENTRIES = 10_000
+
+
+def per_item_us(elapsed: float, count: int) -> float:
+    return elapsed / count * 1_000_000
+
+
+def bench(label: str, fn, count: int):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} total={elapsed * 1000:9.1f}ms per_item={per_item_us(elapsed, count):7.2f}us")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ENTRIES
+    key = Fernet.generate_key()
+    plain = [f"password-{i}-Xy!9" for i in range(count)]
+
+    encryption = EncryptionService(storage_service=None)
+    encryption.load_key(key)
+    cipher = encryption.encrypt_many(plain)
+
+    def uncached_encrypt():
+        for text in plain:
+            Fernet(key).encrypt(text.encode()).decode()
+
+    def uncached_decrypt():
+        for text in cipher:
+            Fernet(key).decrypt(text.encode()).decode()
+
+    def cached_encrypt():
+        for text in plain:
+            encryption.encrypt(text)
+
+    def cached_decrypt():
+        for text in cipher:
+            encryption.decrypt(text)
+
+    print(f"entries={count}")
+    bench("encrypt (new Fernet per call)", uncached_encrypt, count)
+    bench("encrypt (cached Fernet)", cached_encrypt, count)
+    bench("encrypt_many", lambda: encryption.encrypt_many(plain), count)
+    bench("decrypt (new Fernet per call)", uncached_decrypt, count)
+    bench("decrypt (cached Fernet)", cached_decrypt, count)
+    bench("decrypt_many", lambda: encryption.decrypt_many(cipher), count)
+
+
+if __name__ == "__main__":
+    main()
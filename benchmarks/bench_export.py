@@ -0,0 +1,61 @@
+"""
+    Sifreli export / restore hizi (MB/sn) ve tepe bellek kullanimi.
+
+    Tepe bellek vault boyutundan bagimsiz kalmali (chunk boyutu kadar).
+
+    Calistirma:
+        python -m benchmarks.bench_export [rows ...]
+"""
+
+import os
+import sys
+import tracemalloc
+
+from benchmarks.common import SCHEMA_PATH, open_vault, populate_accounts, temp_db_path
+from services.encryption_service import EncryptionService
+from services.export_service import ExportService
+
+DEFAULT_SIZES = [10_000, 100_000]
+PASSWORD = "benchmark-password"
+
+
+def traced(fn, *args):
+    tracemalloc.start()
+    try:
+        result = fn(*args)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def run(rows: int):
+    db_path = temp_db_path()
+    storage = open_vault(db_path)
+    encryption = EncryptionService(storage)
+    encryption.create_master_key(PASSWORD)
+    populate_accounts(storage, rows)
+
+    service = ExportService(storage, encryption)
+    archive_path = os.path.join(os.path.dirname(db_path), "vault.llbak")
+    restore_path = os.path.join(os.path.dirname(db_path), "restored.db")
+
+    export, export_peak = traced(service.export_vault, archive_path)
+    restore, restore_peak = traced(service.restore_vault, archive_path, restore_path, PASSWORD, SCHEMA_PATH)
+
+    print(
+        f"rows={rows:<7} export: {export.elapsed:6.2f}s {export.mb_per_sec:6.1f} MB/s "
+        f"archive={export.bytes_written / 1e6:6.1f}MB peak={export_peak / 1e6:5.1f}MB | "
+        f"restore: {restore.elapsed:6.2f}s {restore.mb_per_sec:6.1f} MB/s peak={restore_peak / 1e6:5.1f}MB"
+    )
+    storage.close()
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for rows in sizes:
+        run(rows)
+
+
+if __name__ == "__main__":
+    main()
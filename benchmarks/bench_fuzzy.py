@@ -0,0 +1,41 @@
+"""
+    SearchService.fuzzy_search gecikmesi (sentetik 100k hesapli vault).
+
+    Calistirma:
+        python -m benchmarks.bench_fuzzy [rows]
+"""
+
+import sys
+
+from benchmarks.common import open_vault, populate_accounts, print_row, summarize, temp_db_path, time_call
+from services.search_service import SearchService
+
+DEFAULT_ROWS = 100_000
+REPEAT = 10
+
+# Yazim hatali sorgular: eksik harf, fazla harf, yer degistirme, yanlis harf
+QUERIES = ["netflx", "githubb", "spotfy", "amazn", "linkdein", "dropbx", "maria.12", "gogle"]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    storage = open_vault(temp_db_path())
+    populate_accounts(storage, rows)
+    search = SearchService(storage)
+
+    samples = []
+    for _ in range(REPEAT):
+        for keyword in QUERIES:
+            elapsed, _results = time_call(search.fuzzy_search, keyword, 20)
+            samples.append(elapsed)
+
+    print(f"rows={rows}")
+    print_row("fuzzy_search (limit=20)", summarize(samples))
+    for keyword in QUERIES:
+        top = search.fuzzy_search(keyword, 3)
+        print(f"  {keyword:<10} -> {', '.join(acc.site for acc in top)}")
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+    Toplu import hizi (satir/sn), Chrome formatinda sentetik CSV ile.
+
+    Calistirma:
+        python -m benchmarks.bench_import [rows]
+"""
+
+import csv
+import os
+import sys
+
+from cryptography.fernet import Fernet
+
+from benchmarks.common import open_vault, synthetic_accounts, temp_db_path
+from services.encryption_service import EncryptionService
+from services.import_service import ImportService
+
+DEFAULT_ROWS = 100_000
+
+
+def write_chrome_csv(path: str, rows: int):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "url", "username", "password", "note"])
+        for i, row in enumerate(synthetic_accounts(rows, seed=7)):
+            writer.writerow([row[0], f"https://{row[0]}/login", row[1], f"pw-{i}", ""])
+        # Duplicate ve eksik satirlar
+        writer.writerow([row[0], "", row[1], "again", ""])
+        writer.writerow(["", "", "nobody", "", ""])
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    db_path = temp_db_path()
+    csv_path = os.path.join(os.path.dirname(db_path), "export.csv")
+    write_chrome_csv(csv_path, rows)
+
+    storage = open_vault(db_path)
+    encryption = EncryptionService(storage)
+    encryption.load_key(Fernet.generate_key())
+
+    report = ImportService(storage, encryption).import_file(csv_path)
+    print(
+        f"rows={report.total_rows} imported={report.imported} duplicates={report.duplicates} "
+        f"invalid={report.invalid} elapsed={report.elapsed:.2f}s rows/sec={report.rows_per_sec:.0f}"
+    )
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
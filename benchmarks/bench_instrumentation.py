@@ -0,0 +1,72 @@
+"""
+    Instrumentation maliyeti: ciplak / kapali decorator / acik decorator.
+
+    Iki olcum:
+        no-op fonksiyon: decorator'un kendi maliyeti (gurultusuz)
+        StorageService.execute: en sik cagrilan sicak yolda goreli etkisi
+            (ciplak hali decorator'un sardigi orijinal fonksiyon, __wrapped__)
+
+    Calistirma:
+        python -m benchmarks.bench_instrumentation [calls]
+"""
+
+import sys
+import time
+
+from benchmarks.common import open_vault, populate_accounts, temp_db_path
+from services.storage_service import StorageService
+from utils import instrumentation
+
+DEFAULT_CALLS = 200_000
+ROUNDS = 5
+QUERY = "SELECT id FROM accounts WHERE id = ?"
+
+
+def noop(storage, query, params):
+    return None
+
+
+def per_call_ns(fn, storage, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(storage, QUERY, (i % 1000 + 1,))
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def best_of(fn, storage, calls: int, enabled: bool) -> float:
+    # Turlar arasi gurultuyu azaltmak icin en iyi tur alinir
+    results = []
+    for _ in range(ROUNDS):
+        instrumentation.enable() if enabled else instrumentation.disable()
+        results.append(per_call_ns(fn, storage, calls // ROUNDS))
+    instrumentation.disable()
+    return min(results)
+
+
+def compare(label: str, bare, wrapped, storage, calls: int):
+    per_call_ns(bare, storage, calls // ROUNDS)
+    base = best_of(bare, storage, calls, enabled=False)
+    disabled = best_of(wrapped, storage, calls, enabled=False)
+    enabled = best_of(wrapped, storage, calls, enabled=True)
+
+    print(label)
+    print(f"  bare                {base:8.0f} ns/call")
+    print(f"  disabled decorator  {disabled:8.0f} ns/call  ({disabled - base:+.0f} ns)")
+    print(f"  enabled decorator   {enabled:8.0f} ns/call  ({enabled - base:+.0f} ns)")
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS
+    storage = open_vault(temp_db_path())
+    populate_accounts(storage, 1000)
+
+    compare("no-op", noop, instrumentation.instrumented("bench.noop")(noop), storage, calls)
+    compare("storage.execute", StorageService.execute.__wrapped__, StorageService.execute, storage, calls)
+    print()
+    print(instrumentation.format_report())
+
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+    KDF parametreleri: unlock suresi ve bu makinedeki kalibrasyon.
+
+    Olcer:
+        LEGACY (PBKDF2 200k), config.json'daki PBKDF2 ve scrypt parametreleri
+        calibrate(): hedef sureye gore secilen parametreler ve gercek sureleri
+
+    Calistirma:
+        python -m benchmarks.bench_kdf [target_ms]
+"""
+
+import os
+import sys
+
+from benchmarks.common import ROOT_DIR, print_row, summarize, time_call
+from services import kdf
+from services.kdf import KdfParams, LEGACY_PARAMS, PBKDF2, SCRYPT
+from utils.helpers import load_config
+
+RUNS = 3
+SALT = os.urandom(16)
+
+
+def measure(label: str, params: KdfParams):
+    samples = [time_call(kdf.derive, "benchmark-password", SALT, params)[0] for _ in range(RUNS)]
+    memory = f"  mem={params.memory_bytes / 1024 / 1024:.0f}MB" if params.memory_bytes else ""
+    print_row(f"{label} {params!r}{memory}", summarize(samples))
+
+
+def main():
+    settings = load_config(os.path.join(ROOT_DIR, "data", "config.json")).get("encryption", {}).get("kdf", {})
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else settings.get("calibrate", {}).get("target_ms", kdf.DEFAULT_TARGET_MS)
+
+    measure("legacy", LEGACY_PARAMS)
+    config_params = KdfParams.from_config(settings)
+    measure("config", config_params)
+    if config_params.algorithm != SCRYPT:
+        measure("config scrypt", KdfParams.from_config({**settings, "type": SCRYPT}))
+
+    for algorithm in (PBKDF2, SCRYPT):
+        params, elapsed = time_call(kdf.calibrate, algorithm, target_ms)[::-1]
+        print(f"calibrate {algorithm} target={target_ms:.0f}ms took {elapsed * 1000:.0f}ms")
+        measure("calibrated", params)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+    Ilk ekran gecikmesi ve derin sayfa maliyeti: fetchall vs keyset sayfalama.
+
+    Calistirma:
+        python -m benchmarks.bench_pagination [rows]
+"""
+
+import sys
+
+from benchmarks.common import open_vault, populate_accounts, print_row, summarize, temp_db_path, time_call
+from models.account import AccountView
+from utils.constants import DEFAULT_PAGE_SIZE
+
+DEFAULT_ROWS = 100_000
+REPEAT = 20
+
+
+def offset_page(storage, offset: int, limit: int):
+    storage.execute("SELECT * FROM accounts ORDER BY site, id LIMIT ? OFFSET ?", (limit, offset))
+    return AccountView.from_rows(storage.fetchall())
+
+
+def repeat(fn, *args) -> dict:
+    return summarize([time_call(fn, *args)[0] for _ in range(REPEAT)])
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    storage = open_vault(temp_db_path())
+    populate_accounts(storage, rows)
+    print(f"rows={rows} page={DEFAULT_PAGE_SIZE}")
+
+    print_row("first screen: get_all_accounts", repeat(storage.get_all_accounts))
+    print_row("first screen: keyset by id", repeat(storage.get_accounts_page, 0, DEFAULT_PAGE_SIZE))
+    print_row("first screen: keyset by site", repeat(storage.get_accounts_page_by_site, None, 0, DEFAULT_PAGE_SIZE))
+
+    # Listenin ortasindaki bir sayfa
+    middle = offset_page(storage, rows // 2, 1)[0]
+    print_row("middle page: OFFSET by site", repeat(offset_page, storage, rows // 2, DEFAULT_PAGE_SIZE))
+    print_row(
+        "middle page: keyset by site",
+        repeat(storage.get_accounts_page_by_site, middle.site, middle.id, DEFAULT_PAGE_SIZE)
+    )
+
+    elapsed, count = time_call(lambda: sum(1 for _ in storage.iter_accounts()))
+    print(f"iter_accounts: {count} rows streamed in {elapsed * 1000:.1f}ms")
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+    Tekrarlanan copy / reveal: cache'siz decrypt vs PlaintextCache.
+
+    Kullanici genelde ayni birkac hesabi tekrar tekrar kopyalar;
+    erisimler kucuk bir "sicak" kume uzerinden uretilir.
+
+    Calistirma:
+        python -m benchmarks.bench_plaintext_cache [reveals]
+"""
+
+import random
+import sys
+
+from cryptography.fernet import Fernet
+
+from benchmarks.common import print_row, summarize, time_call
+from services.encryption_service import EncryptionService
+from services.plaintext_cache import PlaintextCache
+
+ACCOUNTS = 1000
+HOT_ACCOUNTS = 20
+HOT_RATIO = 0.9
+DEFAULT_REVEALS = 20_000
+
+
+def access_pattern(count: int, seed: int = 3) -> list[int]:
+    rng = random.Random(seed)
+    return [
+        rng.randrange(HOT_ACCOUNTS) if rng.random() < HOT_RATIO else rng.randrange(ACCOUNTS)
+        for _ in range(count)
+    ]
+
+
+def main():
+    reveals = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REVEALS
+    encryption = EncryptionService(storage_service=None, plaintext_cache=PlaintextCache(ttl_seconds=300))
+    encryption.load_key(Fernet.generate_key())
+    ciphers = [encryption.encrypt(f"password-{i}") for i in range(ACCOUNTS)]
+    pattern = access_pattern(reveals)
+
+    uncached = [time_call(encryption.decrypt, ciphers[i])[0] for i in pattern]
+    cached = [time_call(encryption.decrypt_cached, i, ciphers[i])[0] for i in pattern]
+
+    print_row("decrypt (no cache)", summarize(uncached))
+    print_row("decrypt_cached", summarize(cached))
+    print(f"total: {sum(uncached) * 1000:.1f}ms -> {sum(cached) * 1000:.1f}ms  cache={encryption.plaintext_cache.stats()}")
+
+    encryption.clear_key()
+    print(f"after clear_key: entries={len(encryption.plaintext_cache)}")
+
+
+if __name__ == "__main__":
+    main()
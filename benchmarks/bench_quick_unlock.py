@@ -0,0 +1,88 @@
+"""
+    Auto-lock sonrasi unlock: tam KDF vs SessionKeyCache (quick unlock), uctan uca.
+
+    AppController / AuthController / VaultController main.py'deki gibi baglanir
+    (index_builder yok: index kurulumu senkron, yani olculen surenin icinde).
+
+    Olcer:
+        auto_lock (pencere kapali) + derive + complete_login
+            (index lock'ta birakilir, unlock'ta yeniden kurulur)
+        auto_lock (pencere acik) + quick_login
+            (key sarili, index tutulur; KDF ve index kurulumu yok)
+        quick_login'de yanlis password'un hizli yolda reddedilmesi
+
+    Calistirma:
+        python -m benchmarks.bench_quick_unlock [accounts] [runs]
+"""
+
+import sys
+
+from benchmarks.common import open_vault, populate_accounts, print_row, summarize, temp_db_path, time_call
+from controller.app_controller import AppController
+from controller.auth_controller import AuthController
+from controller.vault_controller import VaultController
+from services.encryption_service import EncryptionService
+from services.log_service import LogService
+from services.search_service import SearchService
+from services.session_key_cache import SessionKeyCache
+
+PASSWORD = "benchmark-password"
+DEFAULT_ACCOUNTS = 10_000
+DEFAULT_RUNS = 20
+
+
+def main():
+    accounts = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RUNS
+
+    storage = open_vault(temp_db_path())
+    encryption = EncryptionService(storage)
+    encryption.create_master_key(PASSWORD)
+    populate_accounts(storage, accounts, encrypt=encryption.encrypt)
+    salt, params = encryption.get_stored_salt(), encryption.get_stored_kdf()
+
+    logger = LogService(storage)
+    vault = VaultController(storage, encryption, SearchService(storage), logger)
+    cache = SessionKeyCache(window_seconds=60)
+    auth = AuthController(encryption, storage, None, cache)
+    app = AppController(auth, vault)
+
+    def full_login():
+        # Quick unlock kapaliyken auto-lock: key ve index birakilir
+        window, cache.window_seconds = cache.window_seconds, 0
+        app.auto_lock()
+        cache.window_seconds = window
+        return app.complete_login(encryption.derive_key(PASSWORD, salt, params), salt, False)
+
+    def quick_login():
+        app.auto_lock()
+        return app.quick_login(PASSWORD)
+
+    def rejected():
+        app.auto_lock()
+        result = app.quick_login("wrong-password")
+        app.quick_login(PASSWORD)
+        return result
+
+    app.complete_login(encryption.derive_key(PASSWORD, salt, params), salt, False)
+    auth.remember_session(PASSWORD)
+
+    full = [time_call(full_login)[0] for _ in range(max(1, runs // 4))]
+    auth.remember_session(PASSWORD)
+    quick = [time_call(quick_login)[0] for _ in range(runs)]
+    wrong = [time_call(rejected)[0] for _ in range(runs)]
+
+    print(f"accounts={accounts} kdf={params!r}")
+    print_row("auto_lock + full login", summarize(full))
+    print_row("auto_lock + quick_login", summarize(quick))
+    print_row("quick_login, wrong password", summarize(wrong))
+    print(f"cache={cache.stats()} index_built={vault.search_index.is_built}")
+
+    app.logout()
+    print(f"after logout: holding={cache.holding} index_built={vault.search_index.is_built}")
+    logger.close()
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
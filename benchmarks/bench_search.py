@@ -0,0 +1,58 @@
+"""
+    Arama gecikmesi: LIKE '%kw%' tablo taramasi vs accounts_fts (FTS5 trigram).
+
+    Calistirma:
+        python -m benchmarks.bench_search            # 1k ve 100k satir
+        python -m benchmarks.bench_search --full     # + 1M satir
+"""
+
+import sys
+
+from benchmarks.common import open_vault, populate_accounts, print_row, summarize, temp_db_path, time_call
+from services.search_service import SearchService
+
+QUERIES = ["git", "netflix", "maria.1", "twitch42", "zzzz"]
+REPEAT = 20
+
+LIKE_QUERY = """
+    SELECT * FROM accounts
+    WHERE site LIKE ?
+    OR username LIKE ?
+"""
+
+
+def like_search(storage, keyword):
+    storage.execute(LIKE_QUERY, (f"%{keyword}%", f"%{keyword}%"))
+    return storage.fetchall()
+
+
+def bench_size(rows: int):
+    storage = open_vault(temp_db_path())
+    populate_accounts(storage, rows)
+    search = SearchService(storage)
+
+    like_samples, fts_samples = [], []
+    for _ in range(REPEAT):
+        for keyword in QUERIES:
+            elapsed, like_rows = time_call(like_search, storage, keyword)
+            like_samples.append(elapsed)
+            elapsed, fts_rows = time_call(search.global_search, keyword)
+            fts_samples.append(elapsed)
+            assert len(like_rows) == len(fts_rows), keyword
+
+    print(f"rows={rows}")
+    print_row("  LIKE scan", summarize(like_samples))
+    print_row("  FTS5 trigram", summarize(fts_samples))
+    storage.close()
+
+
+def main():
+    sizes = [1_000, 100_000]
+    if "--full" in sys.argv:
+        sizes.append(1_000_000)
+    for rows in sizes:
+        bench_size(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+    SQL profiler: tipik dashboard / arama is yukunde statement raporu ve maliyeti.
+
+    Ayni is yuku profiler kapali ve acik calistirilir; acik turda
+    statement tablosu ve slow-query log'a dusen kayitlar yazdirilir.
+
+    Calistirma:
+        python -m benchmarks.bench_sql_profiler [accounts] [slow_query_ms]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.common import open_vault, populate_accounts, temp_db_path
+from services.search_service import SearchService
+from services.sql_profiler import SqlProfiler
+
+DEFAULT_ACCOUNTS = 20_000
+DEFAULT_SLOW_QUERY_MS = 5.0
+KEYWORDS = ["git", "net", "zz", "john", "mail.com", "a"]
+
+
+def workload(storage, search: SearchService):
+    after_id = 0
+    for _ in range(20):
+        page = storage.get_accounts_page(after_id, 200)
+        if not page:
+            break
+        after_id = page[-1].id
+    storage.get_categories_with_stats()
+    for category_id in range(1, 7):
+        storage.get_accounts_page(0, 200, category_id)
+    for keyword in KEYWORDS:
+        search.global_search(keyword, limit=200)
+        search.search_in_category(2, keyword)
+    storage.get_all_accounts()
+
+
+def timed_workload(storage, search: SearchService, rounds: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        workload(storage, search)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    accounts = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+    slow_query_ms = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_SLOW_QUERY_MS
+
+    db_path = temp_db_path()
+    storage = open_vault(db_path)
+    populate_accounts(storage, accounts)
+    search = SearchService(storage)
+    timed_workload(storage, search, rounds=1)
+
+    disabled = timed_workload(storage, search)
+
+    slow_log = os.path.join(os.path.dirname(db_path), "slow-queries.log")
+    profiler = SqlProfiler(slow_query_ms=slow_query_ms, slow_log_path=slow_log)
+    storage.set_profiler(profiler)
+    enabled = timed_workload(storage, search)
+    storage.set_profiler(None)
+
+    print(f"accounts={accounts}  workload: disabled={disabled * 1000:.1f}ms enabled={enabled * 1000:.1f}ms "
+          f"({(enabled / disabled - 1) * 100:+.1f}%)")
+    print()
+    print(profiler.format_report())
+
+    if os.path.exists(slow_log):
+        with open(slow_log, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        print(f"\nslow-query log ({len(lines)} entries, >= {slow_query_ms}ms): {slow_log}")
+        for line in lines[:3]:
+            print("  " + line.strip()[:300])
+
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+    Uygulama acilisinda veritabani hazirlama suresi:
+    eski yol (her aciliste executescript + tek tek commit'li seed) vs MigrationService.
+
+    Calistirma:
+        python -m benchmarks.bench_startup [rows]
+"""
+
+import os
+import sys
+from datetime import datetime
+
+from benchmarks.common import (
+    DEFAULT_CATEGORIES, SCHEMA_PATH, open_vault, populate_accounts, print_row, summarize, temp_db_path, time_call
+)
+from services.migration_service import MigrationService
+from services.search_service import SEARCH_INDEX_VERSION
+from services.storage_service import StorageService
+from utils.helpers import get_storage_profile, load_config
+
+DEFAULT_ROWS = 10_000
+REPEAT = 20
+
+
+def legacy_startup(storage: StorageService):
+    # Migration runner'dan onceki main.py akisi
+    with open(SCHEMA_PATH, "r") as f:
+        storage.conn.executescript(f.read())
+    storage.ensure_column("accounts", "key_generation", "INTEGER NOT NULL DEFAULT 0")
+    storage.execute("SELECT count(*) FROM categories")
+    if storage.fetchone()[0] == 0:
+        for name in DEFAULT_CATEGORIES:
+            storage.execute(
+                "INSERT INTO categories (name, created_at) VALUES (?, ?)",
+                (name, datetime.now().isoformat()), commit=True
+            )
+    # Eski SearchService.ensure_index (artik 4. migration)
+    if storage.get_meta("search_index_version") != SEARCH_INDEX_VERSION:
+        storage.begin_transaction()
+        storage.execute("INSERT INTO accounts_fts (accounts_fts) VALUES ('rebuild')")
+        storage.set_meta("search_index_version", SEARCH_INDEX_VERSION)
+        storage.commit()
+
+
+def migrated_startup(storage: StorageService):
+    MigrationService(storage, SCHEMA_PATH).migrate()
+
+
+def measure(startup, db_path: str | None, pragmas: dict) -> dict:
+    samples = []
+    for _ in range(REPEAT):
+        path = db_path or temp_db_path()
+        storage = StorageService(path, pragmas=pragmas)
+        storage.connect()
+        samples.append(time_call(startup, storage)[0])
+        storage.close()
+    return summarize(samples)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    pragmas = get_storage_profile(load_config(os.path.join("data", "config.json")))
+
+    # Warm: mevcut, dolu ve guncel bir vault
+    warm_path = temp_db_path()
+    storage = open_vault(warm_path, pragmas)
+    populate_accounts(storage, rows)
+    storage.close()
+
+    print(f"rows={rows} pragmas={pragmas or 'default'}")
+    print_row("cold: legacy", measure(legacy_startup, None, pragmas))
+    print_row("cold: migrations", measure(migrated_startup, None, pragmas))
+    print_row("warm: legacy", measure(legacy_startup, warm_path, pragmas))
+    print_row("warm: migrations", measure(migrated_startup, warm_path, pragmas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+    config.json -> database.profiles icindeki her profil icin
+    insert / update / search throughput.
+
+    Her profil ayri gecici veritabaninda calisir. Insert ve update
+    uygulamadaki gibi satir basina bir commit yapar (save_account / update_account).
+
+    Calistirma:
+        python -m benchmarks.bench_storage_profiles [rows]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.common import ROOT_DIR, open_vault, synthetic_accounts, temp_db_path
+from models.account import Account
+from services.search_service import SearchService
+from services.storage_service import StorageService
+from utils.helpers import get_storage_profile, load_config
+
+DEFAULT_ROWS = 2_000
+SEARCHES = 500
+
+
+def ops_per_sec(count: int, elapsed: float) -> float:
+    return count / elapsed if elapsed else 0.0
+
+
+def bench_profile(name: str, pragmas: dict, rows: int):
+    db_path = temp_db_path()
+    open_vault(db_path).close()
+
+    storage = StorageService(db_path, pragmas=pragmas)
+    storage.connect()
+    search = SearchService(storage)
+
+    accounts = [
+        Account(site=row[0], username=row[1], encrypted_password=row[2], category_id=row[3])
+        for row in synthetic_accounts(rows)
+    ]
+
+    start = time.perf_counter()
+    for account in accounts:
+        account.id = storage.save_account(account)
+    insert_rate = ops_per_sec(rows, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for account in accounts:
+        account.username = account.username + ".x"
+        storage.update_account(account)
+    update_rate = ops_per_sec(rows, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(SEARCHES):
+        search.global_search(accounts[i % rows].site[:6])
+    search_rate = ops_per_sec(SEARCHES, time.perf_counter() - start)
+
+    storage.execute("PRAGMA journal_mode")
+    journal = storage.fetchone()[0]
+    print(
+        f"{name:<12} journal={journal:<8} insert={insert_rate:9.0f}/s "
+        f"update={update_rate:9.0f}/s search={search_rate:9.0f}/s"
+    )
+    storage.close()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    config = load_config(os.path.join(ROOT_DIR, "data", "config.json"))
+    profiles = config.get("database", {}).get("profiles", {"default": {}})
+
+    print(f"rows={rows}")
+    for name in profiles:
+        bench_profile(name, get_storage_profile(config, name), rows)
+
+
+if __name__ == "__main__":
+    main()
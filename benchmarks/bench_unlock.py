@@ -0,0 +1,99 @@
+"""
+    Unlock latency: senkron derivation vs UnlockWorker.
+
+    Olcer:
+        key derivation suresi (login latency)
+        derivation sirasinda GUI event loop'un en uzun bloklanma suresi
+
+    Calistirma:
+        QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_unlock
+"""
+
+import sys
+import time
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.common import print_row, summarize
+from services.encryption_service import EncryptionService
+from ui.unlock_worker import UnlockWorker
+
+RUNS = 5
+TICK_MS = 5
+
+
+class StallProbe:
+    # Event loop'un kac ms boyunca tick atamadigini olcer
+    def __init__(self):
+        self.timer = QTimer()
+        self.timer.setInterval(TICK_MS)
+        self.timer.timeout.connect(self._tick)
+        self.max_gap = 0.0
+        self._last = None
+
+    def start(self):
+        self.max_gap = 0.0
+        self._last = time.perf_counter()
+        self.timer.start()
+
+    def stop(self):
+        self._tick()
+        self.timer.stop()
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.max_gap = max(self.max_gap, now - self._last)
+        self._last = now
+
+
+def run_sync(app, encryption, salt, probe):
+    latencies, stalls = [], []
+    for _ in range(RUNS):
+        probe.start()
+        app.processEvents()
+        start = time.perf_counter()
+        encryption.derive_key("benchmark-password", salt, encryption.kdf_params)
+        latencies.append(time.perf_counter() - start)
+        app.processEvents()
+        probe.stop()
+        stalls.append(probe.max_gap)
+    return latencies, stalls
+
+
+def run_worker(encryption, salt, probe):
+    latencies, stalls = [], []
+    for _ in range(RUNS):
+        loop = QEventLoop()
+        worker = UnlockWorker(
+            lambda pw, s: encryption.derive_key(pw, s, encryption.kdf_params), "benchmark-password", salt
+        )
+        worker.key_derived.connect(lambda _key: loop.quit())
+        probe.start()
+        start = time.perf_counter()
+        worker.start()
+        loop.exec_()
+        latencies.append(time.perf_counter() - start)
+        probe.stop()
+        stalls.append(probe.max_gap)
+        worker.wait()
+    return latencies, stalls
+
+
+def main():
+    app = QApplication(sys.argv)
+    encryption = EncryptionService(storage_service=None)
+    salt = encryption.new_salt()
+    probe = StallProbe()
+
+    sync_latency, sync_stall = run_sync(app, encryption, salt, probe)
+    worker_latency, worker_stall = run_worker(encryption, salt, probe)
+
+    print_row("sync derive latency", summarize(sync_latency))
+    print_row("sync event loop stall", summarize(sync_stall))
+    print_row("worker unlock latency", summarize(worker_latency))
+    print_row("worker event loop stall", summarize(worker_stall))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+    Sicak sorgularin query plan kontrolu (tests/test_query_plans.py) icin kisayol.
+
+    Calistirma:
+        python -m benchmarks.check_query_plans
+"""
+
+import os
+import sys
+
+import pytest
+
+from benchmarks.common import ROOT_DIR
+
+
+def main():
+    return pytest.main(["-q", os.path.join(ROOT_DIR, "tests", "test_query_plans.py")])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+    Benchmark scriptleri icin ortak yardimcilar.
+
+    Scriptler repo kokunden modul olarak calistirilir:
+        python -m benchmarks.bench_unlock
+"""
+
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from services.migration_service import DEFAULT_CATEGORIES, MigrationService
+from services.storage_service import StorageService
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(ROOT_DIR, "data", "schema.sql")
+
+SITE_WORDS = [
+    "google", "github", "netflix", "spotify", "amazon", "twitter", "facebook",
+    "linkedin", "dropbox", "slack", "discord", "steam", "paypal", "reddit",
+    "youtube", "instagram", "gitlab", "notion", "figma", "trello", "zoom",
+    "apple", "microsoft", "adobe", "ebay", "etsy", "twitch", "binance",
+]
+USER_WORDS = ["john", "maria", "ahmet", "ayse", "mehmet", "alex", "sam", "kim", "lee", "zeynep"]
+
+
+def temp_db_path(prefix: str = "locklock-bench-") -> str:
+    directory = tempfile.mkdtemp(prefix=prefix)
+    return os.path.join(directory, "bench.db")
+
+
+def open_vault(db_path: str, pragmas: dict | None = None) -> StorageService:
+    # main.py ile ayni yol: migration'lar schema + varsayilan kategorileri kurar
+    storage = StorageService(db_path, pragmas=pragmas)
+    storage.connect()
+    MigrationService(storage, SCHEMA_PATH).migrate()
+    return storage
+
+
+def synthetic_accounts(count: int, seed: int = 42, encrypt=None):
+    # (site, username, encrypted_password, category_id, created_at, updated_at) uretir
+    rng = random.Random(seed)
+    now = datetime.now().isoformat()
+    for i in range(count):
+        site = f"{rng.choice(SITE_WORDS)}{rng.randint(0, 9999)}.com"
+        username = f"{rng.choice(USER_WORDS)}.{rng.randint(0, 99999)}@mail.com"
+        password = encrypt(f"pw-{i}") if encrypt else "gAAAAA-benchmark-placeholder"
+        yield (site, username, password, rng.randint(1, len(DEFAULT_CATEGORIES)), now, now)
+
+
+def populate_accounts(storage: StorageService, count: int, seed: int = 42, encrypt=None, batch: int = 10_000):
+    query = """
+        INSERT INTO accounts
+        (site, username, encrypted_password, category_id, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    rows = []
+    for row in synthetic_accounts(count, seed=seed, encrypt=encrypt):
+        rows.append(row)
+        if len(rows) >= batch:
+            storage.executemany(query, rows, commit=True)
+            rows = []
+    if rows:
+        storage.executemany(query, rows, commit=True)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: list[float]) -> dict:
+    return {
+        "n": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples) * 1000 if samples else 0.0,
+    }
+
+
+def time_call(fn, *args, **kwargs) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def print_row(label: str, stats: dict):
+    print(
+        f"{label:<36} n={stats['n']:<6} "
+        f"p50={stats['p50_ms']:9.3f}ms p95={stats['p95_ms']:9.3f}ms max={stats['max_ms']:9.3f}ms"
+    )
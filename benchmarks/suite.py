@@ -0,0 +1,192 @@
+"""
+    Headless benchmark suite: servis katmaninin sicak yollari, UI olmadan.
+
+    Her vault boyutu icin gecici bir SQLite dosyasinda sentetik vault kurar,
+    gercek servisleri (EncryptionService, StorageService, SearchService,
+    LogService, VaultController) main.py'deki gibi baglar ve olcer:
+        unlock, add, update, delete, list, list_page, category_stats,
+        search (index / SQL / fuzzy), key_rotation
+
+    Her islem icin p50 / p95 / p99 / max ve ops/sec raporlar,
+    sonuclari JSON olarak yazar ve istenirse onceki bir sonucla karsilastirir.
+
+    Calistirma:
+        python -m benchmarks.suite --accounts 1000 10000
+        python -m benchmarks.suite --accounts 10000 --compare benchmarks/results/suite-....json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import sys
+import time
+from datetime import datetime
+
+from benchmarks.common import ROOT_DIR, open_vault, populate_accounts, summarize, temp_db_path
+from controller.vault_controller import VaultController
+from services.encryption_service import EncryptionService
+from services.key_rotation_service import KeyRotationService
+from services.log_service import LogService
+from services.search_service import SearchService
+from utils.helpers import get_storage_profile, load_config
+
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+PASSWORD = "benchmark-password"
+NEW_PASSWORD = "benchmark-password-2"
+SEARCH_KEYWORDS = ["git", "net", "john", "mail.com", "zz", "spotify12"]
+DEFAULT_REGRESSION_THRESHOLD = 1.20
+
+
+def timed(samples: list[float], fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    samples.append(time.perf_counter() - start)
+    return result
+
+
+def report(samples: list[float]) -> dict:
+    stats = summarize(samples)
+    stats["ops_per_sec"] = 1000 / stats["mean_ms"] if stats["mean_ms"] else 0.0
+    return stats
+
+
+def build_vault(accounts: int, pragmas: dict):
+    storage = open_vault(temp_db_path(), pragmas)
+    encryption = EncryptionService(storage)
+    encryption.create_master_key(PASSWORD)
+    populate_accounts(storage, accounts, encrypt=None)
+
+    # Sentetik satirlar gercek ciphertext ile (rotation decrypt edebilsin)
+    rows = storage.get_accounts_page(0, accounts)
+    ciphers = encryption.encrypt_many([f"pw-{account.id}" for account in rows])
+    storage.executemany(
+        "UPDATE accounts SET encrypted_password = ? WHERE id = ?",
+        [(cipher, account.id) for cipher, account in zip(ciphers, rows)],
+        commit=True
+    )
+    encryption.clear_key()
+
+    logger = LogService(storage)
+    search = SearchService(storage)
+    controller = VaultController(storage, encryption, search, logger, KeyRotationService(storage))
+    return storage, encryption, search, logger, controller
+
+
+def run_suite(accounts: int, repeat: int, pragmas: dict) -> dict:
+    storage, encryption, search, logger, controller = build_vault(accounts, pragmas)
+    samples: dict[str, list[float]] = {}
+
+    def bucket(name: str) -> list[float]:
+        return samples.setdefault(name, [])
+
+    # Unlock = key derivation + hash kontrolu + arama indexinin kurulmasi
+    for _ in range(max(1, repeat // 10)):
+        controller.lock_vault()
+        timed(bucket("unlock"), lambda: (encryption.verify_master_key(PASSWORD), controller.unlock_vault()))
+
+    added = []
+    for i in range(repeat):
+        added.append(timed(bucket("add"), controller.add_account, f"bench-{i}.example", f"user{i}", f"secret-{i}", 1))
+
+    for i, account_id in enumerate(added):
+        timed(bucket("update"), controller.update_account, account_id, f"bench-{i}.example", f"user{i}", f"new-{i}", 2)
+
+    for _ in range(max(1, repeat // 10)):
+        timed(bucket("list_all"), controller.list_accounts)
+    for _ in range(repeat):
+        timed(bucket("list_page"), controller.list_accounts_page, 0)
+        timed(bucket("category_stats"), controller.get_categories_for_dashboard)
+
+    for i in range(repeat):
+        keyword = SEARCH_KEYWORDS[i % len(SEARCH_KEYWORDS)]
+        timed(bucket("search_index"), controller.search_accounts, keyword)
+        timed(bucket("search_sql"), search.global_search, keyword)
+        timed(bucket("search_fuzzy"), search.fuzzy_search, keyword)
+
+    first = controller.list_accounts_page(0, 1)[0]
+    for _ in range(repeat):
+        timed(bucket("reveal_password"), controller.reveal_password, first)
+
+    for account_id in added:
+        timed(bucket("delete"), controller.delete_account, account_id)
+
+    # Key rotation pahali: tek olcum
+    salt = encryption.get_stored_salt()
+    old_key = encryption.derive_key(PASSWORD, salt, encryption.get_stored_kdf())
+    new_key = encryption.derive_key(NEW_PASSWORD, salt, encryption.kdf_params)
+    timed(bucket("key_rotation"), controller.change_master_key_in_chunks, old_key, new_key)
+
+    controller.cleanup()
+    return {name: report(values) for name, values in samples.items()}
+
+
+def environment(pragmas: dict) -> dict:
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "pragmas": pragmas,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> int:
+    regressions = 0
+    print(f"\ncompare (p50, threshold x{threshold:.2f})")
+    for size, ops in current["runs"].items():
+        base_ops = baseline.get("runs", {}).get(size)
+        if not base_ops:
+            print(f"  accounts={size}: baseline'da yok")
+            continue
+        for name, stats in ops.items():
+            base = base_ops.get(name)
+            if not base or not base["p50_ms"]:
+                continue
+            ratio = stats["p50_ms"] / base["p50_ms"]
+            flag = "REGRESSION" if ratio > threshold else ""
+            regressions += bool(flag)
+            print(f"  accounts={size:<7} {name:<16} {base['p50_ms']:9.3f}ms -> {stats['p50_ms']:9.3f}ms  x{ratio:5.2f} {flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LockLock headless benchmark suite")
+    parser.add_argument("--accounts", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--profile", default=None, help="config.json database profile (default: config'teki)")
+    parser.add_argument("--output", default=None, help="JSON dosyasi (default: benchmarks/results/suite-<zaman>.json)")
+    parser.add_argument("--compare", default=None, help="karsilastirilacak onceki JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    pragmas = get_storage_profile(load_config(os.path.join(ROOT_DIR, "data", "config.json")), args.profile)
+    result = {"environment": environment(pragmas), "repeat": args.repeat, "runs": {}}
+
+    for accounts in args.accounts:
+        print(f"\naccounts={accounts}")
+        ops = run_suite(accounts, args.repeat, pragmas)
+        result["runs"][str(accounts)] = ops
+        for name, stats in ops.items():
+            print(
+                f"  {name:<16} n={stats['n']:<5} p50={stats['p50_ms']:9.3f}ms p95={stats['p95_ms']:9.3f}ms "
+                f"p99={stats['p99_ms']:9.3f}ms ops/s={stats['ops_per_sec']:10.1f}"
+            )
+
+    output = args.output or os.path.join(RESULTS_DIR, f"suite-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"\nresults: {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(result, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,10 +23,44 @@ class AppController:
 
         return False
 
+    def complete_login(self, key: bytes, salt: bytes, first_run: bool, kdf_params=None) -> bool:
+        if not self.auth_controller.finish_unlock(key, salt, first_run, kdf_params):
+            return False
+
+        self.vault_unlocked = True
+        self.vault_controller.unlock_vault()
+        return True
+
+    def quick_login(self, master_password: str) -> bool:
+        # Auto-lock penceresi icindeyse KDF calismadan acilir
+        if not self.auth_controller.quick_unlock(master_password):
+            return False
+
+        self.vault_unlocked = True
+        self.vault_controller.unlock_vault()
+        return True
+
+    def auto_lock(self) -> bool:
+        # Key sarilip saklanir (quick unlock aciksa), sonra vault kilitlenir
+        held = self.auth_controller.suspend_session()
+        self.vault_unlocked = False
+        # Quick unlock aciksa arama indexi tutulur, unlock'ta yeniden kurulmaz
+        self.vault_controller.lock_vault(keep_index=held)
+        return held
+
+    def expire_session(self) -> bool:
+        # Pencere doldu: sarili key ile birlikte tutulan index de birakilir
+        expired = self.auth_controller.expire_session()
+        if expired and not self.vault_unlocked:
+            self.vault_controller.lock_vault()
+        return expired
+
     def logout(self):
         self.current_user = None
         self.vault_unlocked = False
+        self.auth_controller.end_session()
         self.vault_controller.lock_vault()
 
     def shutdown(self):
+        self.auth_controller.end_session()
         self.vault_controller.cleanup()
\ No newline at end of file
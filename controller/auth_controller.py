@@ -10,18 +10,27 @@ auth_controller.py
         encryption_service
         storage_service
         validators
+        session_cache (auto-lock sonrasi hizli unlock)
 
     Asla:
         UI cizmez
         SQL yazmaz
 
     """
+from utils.constants import MIN_MASTER_PASSWORD_LENGTH
+from services import kdf
+from services.kdf import KdfParams
+from services.session_key_cache import SessionKeyCache
+
+
 class AuthController:
 
-    def __init__(self, encryption_service, storage_service, validators):
+    def __init__(self, encryption_service, storage_service, validators, session_cache: SessionKeyCache | None = None):
         self.encryption_service = encryption_service
         self.storage_service = storage_service
         self.validators = validators
+        # window_seconds = 0: hizli unlock kapali
+        self.session_cache = session_cache or SessionKeyCache(window_seconds=0)
 
     def is_first_run(self) -> bool:
         return not self.storage_service.has_master_key()
@@ -35,3 +44,57 @@ class AuthController:
             return False
 
         return self.encryption_service.verify_master_key(master_password)
+
+    # Async unlock: key derivation UnlockWorker'da, geri kalani GUI thread'de
+    # Worker'a salt ile birlikte KDF parametreleri de gider (ilk giriste config'teki hedef)
+    def begin_unlock(self, master_password: str) -> tuple[bytes, KdfParams, bool]:
+        self.validators.validate_master_password(master_password)
+
+        if self.is_first_run():
+            if len(master_password) < MIN_MASTER_PASSWORD_LENGTH:
+                raise ValueError(f"Master password must be at least {MIN_MASTER_PASSWORD_LENGTH} chars")
+            return self.encryption_service.new_salt(), self.encryption_service.kdf_params, True
+
+        salt = self.encryption_service.get_stored_salt()
+        if salt is None:
+            raise ValueError("Master key bilgisi okunamadı.")
+        return salt, self.encryption_service.get_stored_kdf(), False
+
+    def finish_unlock(self, key: bytes, salt: bytes, first_run: bool, kdf_params: KdfParams | None = None) -> bool:
+        if first_run:
+            self.encryption_service.store_master_key(salt, key, kdf_params)
+            return True
+
+        return self.encryption_service.accept_key(key)
+
+    # Quick unlock: auto-lock sonrasi pencere icinde KDF'siz unlock
+    def remember_session(self, master_password: str):
+        # Dogrulayici o an yuklu key'e baglanir; key degisince (rotation / KDF yukseltmesi) tekrar cagrilir
+        self.session_cache.arm(master_password, self.encryption_service.session_key())
+
+    def suspend_session(self) -> bool:
+        return self.session_cache.hold(self.encryption_service.session_key())
+
+    def quick_unlock(self, master_password: str) -> bool:
+        key = self.session_cache.unlock(master_password)
+        if key is None:
+            return False
+        # Sarili key rotation / KDF yukseltmesinden once alinmis olabilir: hash yine kontrol edilir
+        return self.encryption_service.accept_key(key)
+
+    def expire_session(self) -> bool:
+        return self.session_cache.expire()
+
+    def end_session(self):
+        self.session_cache.wipe()
+
+    # Basarili login sonrasi: saklanan KDF hedeften zayifsa yukseltilecek parametreler
+    def kdf_upgrade_params(self) -> KdfParams | None:
+        # Yarim kalmis rotation (KDF yukseltmesi dahil) once kendi checkpoint'inden devam eder
+        if self.storage_service.get_key_rotation_checkpoint():
+            return None
+
+        target = self.encryption_service.kdf_params
+        if kdf.needs_upgrade(self.encryption_service.get_stored_kdf(), target):
+            return target
+        return None
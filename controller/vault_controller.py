@@ -1,29 +1,105 @@
 import hashlib
 from models.account import Account
 from models.category import Category
+from models.change_event import AccountChange
+from services.key_rotation_service import KeyRotationService
+from services.search_index import SearchIndex
+from services.import_service import ImportService
+from services.export_service import ExportService
+from utils.constants import DEFAULT_PAGE_SIZE
+from utils.instrumentation import instrumented
 
 class VaultController:
 
-    def __init__(self, storage_service, encryption_service, search_service, logger):
+    def __init__(self, storage_service, encryption_service, search_service, logger, key_rotation=None, importer=None, exporter=None,
+                 index_builder=None):
         self.storage = storage_service
         self.encryption = encryption_service
         self.search = search_service
         self.logger = logger
+        self.key_rotation = key_rotation or KeyRotationService(storage_service)
+        self.importer = importer or ImportService(storage_service, encryption_service)
+        self.exporter = exporter or ExportService(storage_service, encryption_service)
+        # As-you-type arama SQLite'a gitmesin diye unlock'ta bir kez kurulur
+        self.search_index = SearchIndex()
+        # None: index burada senkron kurulur. GUI'de main arka plan kurucusu verir:
+        # index_builder(generation) -> sonra install_search_index(generation, index)
+        self.index_builder = index_builder
+        self._index_generation = 0
+        # Arka planda kurulurken gelen degisiklikler, yeni index'e uygulanmak uzere
+        self._index_backlog: list[AccountChange] | None = None
+        self._change_listeners = []
         self.is_locked = True
 
+    # Change events
+    def subscribe(self, listener):
+        self._change_listeners.append(listener)
+
+    def _emit_change(self, change: AccountChange):
+        if self._index_backlog is not None:
+            self._index_backlog.append(change)
+        for listener in self._change_listeners:
+            listener(change)
+
+    @instrumented("vault.unlock_vault")
     def unlock_vault(self):
         self.is_locked = False
+        # Quick unlock: auto-lock'ta tutulan index gecerli, yeniden kurulmaz
+        if not self.search_index.is_built:
+            self.rebuild_search_index()
 
-    def lock_vault(self):
+    def lock_vault(self, keep_index: bool = False):
         self.is_locked = True
+        # keep_index: sadece site / username + ciphertext tutar, key ve plaintext degil
+        if not keep_index:
+            self._drop_search_index()
+        # Key ve cache'teki plaintext'ler bellekte kalmasin
+        self.encryption.clear_key()
+
+    # Search index
+    def rebuild_search_index(self):
+        if self.index_builder is None:
+            self.search_index.build(self.storage.get_all_accounts())
+            return
+
+        # Hazir olana kadar is_built False: arama sayfali FTS'e (search_accounts_page) duser
+        self._drop_search_index()
+        self._index_backlog = []
+        self.index_builder(self._index_generation)
+
+    def install_search_index(self, generation: int, index) -> bool:
+        # Kilitlendiyse veya bu arada yeni kurulum istendiyse sonuc atilir
+        if self.is_locked or generation != self._index_generation:
+            return False
+
+        for change in self._index_backlog or []:
+            if change.kind == AccountChange.DELETED:
+                index.remove(change.account_id)
+            else:
+                index.update(change.account)
+        self._index_backlog = None
+        self.search_index = index
+        return True
+
+    def _drop_search_index(self):
+        # Yoldaki arka plan kurulumlari gecersiz olur
+        self._index_generation += 1
+        self._index_backlog = None
+        self.search_index.clear()
 
     def cleanup(self):
+        # Buffer'daki audit loglar connection kapanmadan yazilsin
+        self.logger.close()
         self.storage.close()
 
+    @instrumented("vault.add_account")
     def add_account(self, site, username, raw_password, category_id):
         if self.is_locked:
             raise PermissionError("Vault is locked")
 
+        if self.storage.account_exists(site, username):
+            raise ValueError("Aynı site ve kullanıcı adıyla ikinci hesap eklenemez")
+
         encrypted = self.encryption.encrypt(raw_password)
         
         account = Account(
@@ -34,10 +110,17 @@ class VaultController:
         )
 
         account_id = self.storage.save_account(account)
+        account.id = account_id
+        self.search_index.add(account)
         self.logger.info("ACCOUNT_ADDED", f"id={account_id}")
+        self._emit_change(AccountChange(
+            AccountChange.ADDED, account_id, account,
+            new_category_id=category_id
+        ))
 
         return account_id
 
+    @instrumented("vault.update_account")
     def update_account(self, account_id, site, username, raw_password, category_id):
         if self.is_locked:
             raise PermissionError("Vault is locked")
@@ -45,6 +128,8 @@ class VaultController:
         existing_account = self.storage.get_account_by_id(account_id)
         if not existing_account:
             raise ValueError("Hesap bulunamadı!")
+        if self.storage.account_exists(site, username, exclude_id=account_id):
+            raise ValueError("Aynı site ve kullanıcı adıyla ikinci hesap eklenemez")
 
         if raw_password and raw_password.strip():
             final_encrypted_password = self.encryption.encrypt(raw_password)
@@ -62,20 +147,82 @@ class VaultController:
 
         success = self.storage.update_account(updated_account)
         if success:
+            self.search_index.update(updated_account)
+            self.encryption.plaintext_cache.invalidate(account_id)
             self.logger.info("ACCOUNT_UPDATED", f"id={account_id}")
+            self._emit_change(AccountChange(
+                AccountChange.UPDATED, account_id, updated_account,
+                old_category_id=existing_account.category_id,
+                new_category_id=category_id
+            ))
         return success
 
+    @instrumented("vault.delete_account")
     def delete_account(self, account_id: int) -> bool:
         if self.is_locked:
             raise PermissionError("Vault is locked")
 
+        existing_account = self.storage.get_account_by_id(account_id)
         success = self.storage.delete_account_by_id(account_id)
 
         if success:
+            self.search_index.remove(account_id)
+            self.encryption.plaintext_cache.invalidate(account_id)
             self.logger.info("ACCOUNT_DELETED", f"id={account_id}")
+            self._emit_change(AccountChange(
+                AccountChange.DELETED, account_id,
+                old_category_id=existing_account.category_id if existing_account else None
+            ))
 
         return success
 
+    def import_accounts(self, path: str, progress=None):
+        if self.is_locked:
+            raise PermissionError("Vault is locked")
+
+        report = self.importer.import_file(path, progress=progress)
+        self.finish_import(report)
+        return report
+
+    def export_vault(self, path: str, progress=None):
+        if self.is_locked:
+            raise PermissionError("Vault is locked")
+
+        report = self.exporter.export_vault(path, progress=progress)
+        self.finish_export(report)
+        return report
+
+    # Import / export adimlari: GUI'de satirlar ImportWorker / ExportWorker'da (kendi connection'i ile)
+    # islenir, key burada verilir, bitis burada, GUI thread'inde
+    def transfer_key(self) -> bytes:
+        if self.is_locked:
+            raise PermissionError("Vault is locked")
+        return self.encryption.session_key()
+
+    def finish_import(self, report):
+        # Vault bu arada kilitlendiyse (auto-lock'ta tutulan) index birakilir, unlock'ta yeniden kurulur
+        if report.imported:
+            if self.is_locked:
+                self._drop_search_index()
+            else:
+                self.rebuild_search_index()
+
+        self.logger.info(
+            "ACCOUNTS_IMPORTED",
+            f"imported={report.imported} duplicates={report.duplicates} invalid={report.invalid}"
+        )
+
+    def finish_export(self, report):
+        self.logger.security(
+            "VAULT_EXPORTED",
+            f"accounts={report.rows['accounts']} bytes={report.bytes_written}"
+        )
+
+    def reveal_password(self, account) -> str:
+        if self.is_locked:
+            raise PermissionError("Vault is locked")
+        return self.encryption.decrypt_cached(account.id, account.encrypted_password)
+
     def list_accounts(self):
         if self.is_locked:
             raise PermissionError("Vault is locked")
@@ -86,6 +233,37 @@ class VaultController:
             raise PermissionError("Vault is locked")
         return self.storage.get_accounts_by_category_id(category_id)
 
+    # Keyset pagination: dashboard ilk ekrani hemen alir, gerisini scroll'da ceker
+    @instrumented("vault.list_accounts_page")
+    def list_accounts_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE, category_id: int | None = None):
+        if self.is_locked:
+            raise PermissionError("Vault is locked")
+        return self.storage.get_accounts_page(after_id, limit, category_id)
+
+    def list_accounts_page_by_site(
+        self,
+        after_site: str | None = None,
+        after_id: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        category_id: int | None = None
+    ):
+        if self.is_locked:
+            raise PermissionError("Vault is locked")
+        return self.storage.get_accounts_page_by_site(after_site, after_id, limit, category_id)
+
+    def iter_accounts(self, category_id: int | None = None, batch_size: int = DEFAULT_PAGE_SIZE):
+        if self.is_locked:
+            raise PermissionError("Vault is locked")
+        return self.storage.iter_accounts(category_id, batch_size)
+
+    def search_accounts_page(self, keyword: str, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE, category_id: int | None = None):
+        if self.is_locked:
+            raise PermissionError("Vault is locked")
+        if category_id is None:
+            return self.search.global_search(keyword, after_id, limit)
+        return self.search.search_in_category(category_id, keyword, after_id, limit)
+
+    @instrumented("vault.get_categories_for_dashboard")
     def get_categories_for_dashboard(self):
         rows = self.storage.get_categories_with_stats()
         total_count = self.storage.get_total_account_count()
@@ -98,14 +276,20 @@ class VaultController:
 
         return total_count, categories
 
+    @instrumented("vault.search_accounts")
     def search_accounts(self, keyword: str):
         if self.is_locked:
             raise PermissionError("Vault is locked")
-            
-        results = self.search.global_search(keyword) 
-        return results
 
-    def change_master_key_and_reencrypt(self, old_key: bytes, new_key: bytes):
+        # SearchPipeline bunu pool thread'inde cagirir: SQLite connection'i GUI thread'ine bagli,
+        # index yokken SQL'e dusulmez (search_accounts_page GUI thread'inden kullanilir)
+        if not self.search_index.is_built:
+            raise RuntimeError("Arama indeksi hazır değil")
+        return self.search_index.search(keyword)
+
+    # Master key degisimleri: yeni key'in turetildigi KDF (verilmezse config hedefi) hash ile birlikte
+    # yazilir, yoksa sonraki login saklanan eski KDF ile turetir ve yeni password reddedilir
+    def change_master_key_and_reencrypt(self, old_key: bytes, new_key: bytes, progress=None, kdf_params=None):
         if self.is_locked:
             raise PermissionError("Vault locked")
 
@@ -113,27 +297,85 @@ class VaultController:
             self.logger.security("MASTER_KEY_CHANGE_START", "Re-encryption started")
             self.storage.begin_transaction()
 
-            self.encryption.load_key(old_key)
-            accounts = self.storage.get_all_accounts()
-            decrypted = []
-
-            for acc in accounts:
-                plain = self.encryption.decrypt(acc.encrypted_password)
-                decrypted.append((acc.id, plain))
-
-            self.encryption.load_key(new_key)
-            for acc_id, plain in decrypted:
-                new_encrypted = self.encryption.encrypt(plain)
-                self.storage.update_encrypted_password(acc_id, new_encrypted)
+            # Batch batch okunur, worker havuzunda yeniden sifrelenir, executemany ile yazilir
+            count = self.key_rotation.rotate(old_key, new_key, progress=progress)
 
             key_hash = hashlib.sha256(new_key).hexdigest()
             self.storage.update_master_key_hash(key_hash)
-            
+            self.storage.set_meta("master_key_kdf", (kdf_params or self.encryption.kdf_params).to_json())
+
             self.storage.commit()
-            self.logger.security("MASTER_KEY_CHANGE_SUCCESS", "All passwords re-encrypted")
+            self.encryption.load_key(new_key)
+            # Indexteki Account nesneleri eski ciphertext'i tutuyor
+            self.rebuild_search_index()
+            self.logger.security("MASTER_KEY_CHANGE_SUCCESS", f"{count} passwords re-encrypted")
 
         except Exception as e:
             self.storage.rollback()
             self.logger.error("MASTER_KEY_CHANGE_FAILED", str(e))
-            self.encryption.load_key(old_key) 
-            raise
\ No newline at end of file
+            self.encryption.load_key(old_key)
+            raise
+
+    def change_master_key_in_chunks(self, old_key: bytes, new_key: bytes, progress=None, kdf_params=None):
+        # Kaldigi yerden devam edebilen mod: her batch ayri commit, checkpoint meta'da
+        self.begin_key_rotation(old_key, new_key, kdf_params)
+        try:
+            count = self.key_rotation.rotate_in_chunks(old_key, new_key, progress=progress)
+        except Exception as e:
+            self.fail_key_rotation(str(e))
+            raise
+        self.finish_key_rotation(new_key, count)
+
+    # Rotation adimlari: GUI'de satirlar RotationWorker'da (kendi connection'i ile) tasinir,
+    # baslangic ve bitis burada, GUI thread'inde
+    def begin_key_rotation(self, old_key: bytes, new_key: bytes, kdf_params=None):
+        if self.is_locked:
+            raise PermissionError("Vault locked")
+
+        self.key_rotation.check_resumable(new_key)
+        checkpoint = self.key_rotation.pending_checkpoint()
+        if checkpoint:
+            self.logger.security("MASTER_KEY_CHANGE_RESUME", f"Resuming after id={checkpoint['last_id']}")
+        else:
+            # Yeni KDF checkpoint'te bekler, rotation'in son transaction'inda yeni hash ile yazilir
+            self.key_rotation.start(old_key, new_key, finish_meta={
+                "master_key_kdf": (kdf_params or self.encryption.kdf_params).to_json(),
+            })
+            self.logger.security("MASTER_KEY_CHANGE_START", "Chunked re-encryption started")
+
+        # Rotation boyunca (ve yarida kalirsa) iki key ile de okunabilsin, yazilanlar yeni key ile
+        self.encryption.load_keys(new_key, old_key)
+
+    def finish_key_rotation(self, new_key: bytes, count: int):
+        self.encryption.load_key(new_key)
+        # Indexteki Account nesneleri eski ciphertext'i tutuyor
+        self.rebuild_search_index()
+        self.logger.security("MASTER_KEY_CHANGE_SUCCESS", f"{count} passwords re-encrypted")
+
+    def fail_key_rotation(self, message: str):
+        # Checkpoint kalir; iki key yuklu oldugu icin vault kullanilmaya devam eder
+        if not self.is_locked:
+            self.rebuild_search_index()
+        self.logger.error("MASTER_KEY_CHANGE_FAILED", message)
+
+    def pending_key_rotation(self) -> dict | None:
+        return self.key_rotation.pending_checkpoint()
+
+    def resumable_key_rotation(self) -> tuple[bytes, bytes] | None:
+        # Unlock'ta checkpoint varsa iki key de yuklenir (accept_key): (eski, yeni) ile devam edilir
+        if self.is_locked or not self.pending_key_rotation():
+            return None
+        keys = self.encryption.rotation_keys()
+        if keys is None:
+            return None
+        new_key, old_key = keys
+        return old_key, new_key
+
+    def upgrade_kdf(self, old_key: bytes, new_key: bytes, kdf_params, progress=None):
+        # KDF degisince key de degisir: hesaplar rotation motoru ile yeni key'e tasinir
+        self.change_master_key_in_chunks(old_key, new_key, progress=progress, kdf_params=kdf_params)
+        self.logger.security("KDF_UPGRADED", repr(kdf_params))
+
+    def begin_kdf_upgrade(self, old_key: bytes, new_key: bytes, kdf_params):
+        # GUI yolu: satirlar RotationWorker'da tasinir, bitince finish_key_rotation
+        self.begin_key_rotation(old_key, new_key, kdf_params)
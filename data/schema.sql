@@ -20,10 +20,46 @@ CREATE TABLE IF NOT EXISTS accounts (
     category_id INTEGER,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
+    key_generation INTEGER NOT NULL DEFAULT 0,
     FOREIGN KEY (category_id) REFERENCES categories(id)
         ON DELETE SET NULL
 );
 
+-- site'a gore keyset sayfalama: (site, rowid) sirasi index'ten okunur
+CREATE INDEX IF NOT EXISTS idx_accounts_site ON accounts(site);
+
+-- Kategori filtresi ve kategori sayaclari (LEFT JOIN / GROUP BY)
+CREATE INDEX IF NOT EXISTS idx_accounts_category ON accounts(category_id);
+
+-- (site, username) UNIQUE index'i burada degil: eski veritabaninda duplicate
+-- olabilir, MigrationService'teki 5. migration kontrol ederek kurar
+
+-- site/username uzerinde substring arama icin (LIKE '%kw%' yerine)
+CREATE VIRTUAL TABLE IF NOT EXISTS accounts_fts USING fts5(
+    site,
+    username,
+    content='accounts',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS accounts_fts_insert AFTER INSERT ON accounts BEGIN
+    INSERT INTO accounts_fts (rowid, site, username)
+    VALUES (new.id, new.site, new.username);
+END;
+
+CREATE TRIGGER IF NOT EXISTS accounts_fts_delete AFTER DELETE ON accounts BEGIN
+    INSERT INTO accounts_fts (accounts_fts, rowid, site, username)
+    VALUES ('delete', old.id, old.site, old.username);
+END;
+
+CREATE TRIGGER IF NOT EXISTS accounts_fts_update AFTER UPDATE OF site, username ON accounts BEGIN
+    INSERT INTO accounts_fts (accounts_fts, rowid, site, username)
+    VALUES ('delete', old.id, old.site, old.username);
+    INSERT INTO accounts_fts (rowid, site, username)
+    VALUES (new.id, new.site, new.username);
+END;
+
 CREATE TABLE IF NOT EXISTS logs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     action TEXT NOT NULL,
@@ -32,4 +68,8 @@ CREATE TABLE IF NOT EXISTS logs (
     created_at TEXT NOT NULL
 );
 
+-- Log sorgulari: zamana gore ve seviye + zamana gore
+CREATE INDEX IF NOT EXISTS idx_logs_created_at ON logs(created_at);
+CREATE INDEX IF NOT EXISTS idx_logs_level ON logs(level, created_at);
+
 COMMIT;
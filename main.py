@@ -1,14 +1,24 @@
 import sys
 import os
+import multiprocessing
 from datetime import datetime
-from PyQt5.QtWidgets import QApplication, QMessageBox, QDialog, QVBoxLayout, QDialogButtonBox
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import (
+    QApplication, QMessageBox, QDialog, QVBoxLayout, QDialogButtonBox, QFileDialog, QShortcut, QProgressDialog
+)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QIcon, QKeySequence
 
 from services.storage_service import StorageService
 from services.encryption_service import EncryptionService
 from services.log_service import LogService
 from services.search_service import SearchService
+from services.key_rotation_service import KeyRotationService
+from services.backup_service import BackupService
+from services.plaintext_cache import PlaintextCache
+from services.session_key_cache import SessionKeyCache
+from services.migration_service import MigrationService
+from services.sql_profiler import SqlProfiler
+from services import kdf
 
 from controller.auth_controller import AuthController
 from controller.vault_controller import VaultController
@@ -17,6 +27,14 @@ from controller.app_controller import AppController
 from ui.login_screen import LoginScreen
 from ui.dashboard import Dashboard
 from ui.account_form import AccountForm
+from ui.unlock_worker import UnlockWorker
+from ui.rotation_worker import RotationWorker
+from ui.transfer_worker import ImportWorker, ExportWorker
+from ui.index_worker import IndexWorker
+from ui.idle_watcher import IdleWatcher
+from ui.search_pipeline import SearchPipeline
+from utils.helpers import load_config, get_storage_profile
+from utils import instrumentation
 
 class SimpleValidator:
     def validate_master_password(self, password: str) -> bool:
@@ -51,28 +69,102 @@ def main():
     
     db_path = os.path.join(user_data_dir, "app.db")
 
-    storage = StorageService(db_path)
+    config_path = os.path.join(base_dir, "data", "config.json")
+    config = load_config(config_path)
+
+    # Sayac + latency histogramlari: config.json -> diagnostics (kapaliyken maliyeti yok denecek kadar az)
+    diagnostics_config = config.get("diagnostics", {})
+    if diagnostics_config.get("instrumentation", False):
+        instrumentation.enable()
+
+    # WAL, synchronous, cache/mmap vb. config.json -> database.profile'dan gelir
+    storage = StorageService(db_path, pragmas=get_storage_profile(config))
     storage.connect()
+
+    # SQL profiler: config.json -> database.profiler, uygulama acikken de acilip kapatilabilir
+    diagnostics_dir = diagnostics_config.get("dump_directory") or os.path.join(user_data_dir, "diagnostics")
+    slow_log_path = os.path.join(diagnostics_dir, "slow-queries.log")
+
+    def apply_profiler_config(settings: dict):
+        if not settings.get("enabled", False):
+            storage.set_profiler(None)
+        elif storage.profiler is None:
+            storage.set_profiler(SqlProfiler.from_config(settings, slow_log_path))
+        else:
+            storage.profiler.configure(settings, slow_log_path)
+
+    apply_profiler_config(config.get("database", {}).get("profiler", {}))
+
+    config_state = {"mtime": os.path.getmtime(config_path) if os.path.exists(config_path) else None}
+
+    def reload_profiler_config():
+        try:
+            mtime = os.path.getmtime(config_path)
+        except OSError:
+            return
+        if mtime == config_state["mtime"]:
+            return
+        config_state["mtime"] = mtime
+        apply_profiler_config(load_config(config_path).get("database", {}).get("profiler", {}))
+
+    config_watcher = QTimer()
+    config_watcher.timeout.connect(reload_profiler_config)
+    config_watcher.start(2000)
     
+    # Sadece bekleyen migration'lar calisir; guncel veritabaninda tek PRAGMA okunur
     schema_path = os.path.join(base_dir, "data", "schema.sql")
-    if os.path.exists(schema_path):
-        with open(schema_path, "r") as f:
-            storage.conn.executescript(f.read())
-
-    storage.execute("SELECT count(*) FROM categories")
-    if storage.fetchone()[0] == 0:
-        defaults = ["Social", "Work", "Finance", "Other", "Shopping", "Gaming"]
-        for name in defaults:
-            storage.execute("INSERT INTO categories (name, created_at) VALUES (?, ?)", 
-                            (name, datetime.now().isoformat()), commit=True)
+    migration_report = MigrationService(storage, schema_path).migrate()
+    if migration_report.deferred:
+        print(f"Uyarı: '{migration_report.deferred}' migration'ı uygulanamadı "
+              "(aynı site/username ile birden fazla hesap var).")
 
     logger = LogService(storage)
-    encryption = EncryptionService(storage)
+
+    # Online snapshot yedegi: config.json -> backup
+    backup_config = config.get("backup", {})
+    backup = None
+    if backup_config.get("enabled", True):
+        backup = BackupService(
+            storage,
+            backup_config.get("directory") or os.path.join(user_data_dir, "backups"),
+            interval_seconds=backup_config.get("interval_minutes", 60) * 60,
+            keep=backup_config.get("keep", 5),
+            pages_per_step=backup_config.get("pages_per_step", 256),
+            step_pause_ms=backup_config.get("step_pause_ms", 10)
+        )
+        backup.start()
+    security_config = config.get("security", {})
+    cache_config = security_config.get("plaintext_cache", {})
+    # Yeni / yukseltilen key'lerin KDF'i: config.json -> encryption.kdf (calibrate aciksa bu makinede olculur)
+    kdf_params = kdf.target_params(config.get("encryption", {}).get("kdf", {}), storage)
+    encryption = EncryptionService(storage, PlaintextCache(
+        ttl_seconds=cache_config.get("ttl_seconds", 30),
+        max_entries=cache_config.get("max_entries", 64)
+    ), kdf_params)
     search = SearchService(storage)
     validator = SimpleValidator()
 
-    auth_controller = AuthController(encryption, storage, validator)
-    vault_controller = VaultController(storage, encryption, search, logger)
+    # Auto-lock sonrasi quick unlock: config.json -> security.quick_unlock
+    quick_config = security_config.get("quick_unlock", {})
+    session_cache = SessionKeyCache(
+        window_seconds=quick_config.get("window_seconds", 900) if quick_config.get("enabled", True) else 0,
+        max_attempts=quick_config.get("max_attempts", 3)
+    )
+    auth_controller = AuthController(encryption, storage, validator, session_cache)
+    key_rotation = KeyRotationService(storage)
+    # Arama indexi IndexWorker'da kurulur (unlock / import / rotation sonrasi), GUI donmaz
+    index_workers = []
+
+    def build_search_index(generation):
+        worker = IndexWorker(db_path, storage.pragmas, generation)
+        worker.built.connect(vault_controller.install_search_index)
+        worker.failed.connect(lambda msg: logger.error("SEARCH_INDEX_FAILED", msg))
+        worker.finished.connect(lambda: index_workers.remove(worker))
+        worker.finished.connect(worker.deleteLater)
+        index_workers.append(worker)
+        worker.start()
+
+    vault_controller = VaultController(storage, encryption, search, logger, key_rotation, index_builder=build_search_index)
     app_controller = AppController(auth_controller, vault_controller)
 
     login_window = LoginScreen()
@@ -80,46 +172,268 @@ def main():
     
     def load_dashboard_data():
         try:
-            total, cats = vault_controller.get_categories_for_dashboard()
-            dashboard.update_categories(cats, total)
-            
-            accounts = vault_controller.list_accounts()
-            dashboard.update_account_list(accounts)
+            with instrumentation.span("ui.load_dashboard_data"):
+                total, cats = vault_controller.get_categories_for_dashboard()
+                dashboard.update_categories(cats, total)
+
+                dashboard.load_account_pages(vault_controller.list_accounts_page)
 
         except Exception as e:
-            print(f"Veri yükleme hatası: {e}")
+            logger.error("DASHBOARD_LOAD_FAILED", str(e))
+
+    # Key derivation UnlockWorker'da calisir, login ekrani donmaz
+    unlock_state = {"worker": None}
 
     def handle_login(password):
+        if unlock_state["worker"] is not None:
+            return
+
         try:
-            if auth_controller.is_first_run():
-                auth_controller.setup_master_password(password)
-                QMessageBox.information(login_window, "Başarılı", "Master Password oluşturuldu!")
-            
-            if app_controller.login(password):
-                login_window.hide()
-                load_dashboard_data()
-                dashboard.show()
+            salt, params, first_run = auth_controller.begin_unlock(password)
+        except ValueError as ve:
+            login_window.show_error(str(ve))
+            return
+        except Exception as e:
+            login_window.show_error(f"Beklenmeyen hata: {e}")
+            return
+
+        # Auto-lock penceresi icindeyse KDF calismaz; yanlis password tam yola duser
+        if not first_run and app_controller.quick_login(password):
+            show_dashboard()
+            resume_key_rotation()
+            return
+
+        worker = UnlockWorker(lambda pw, s: encryption.derive_key(pw, s, params), password, salt)
+        worker.key_derived.connect(lambda key: on_key_derived(worker, key, salt, first_run, params, password))
+        worker.failed.connect(lambda msg: on_unlock_failed(worker, msg))
+        worker.finished.connect(worker.deleteLater)
+        unlock_state["worker"] = worker
+
+        login_window.set_busy(True)
+        worker.start()
+
+    def _finish_unlock(worker) -> bool:
+        # Iptal edilmis veya eski bir worker'dan gelen sonucu yok say
+        if unlock_state["worker"] is not worker:
+            return False
+        unlock_state["worker"] = None
+        login_window.set_busy(False)
+        return True
+
+    def on_key_derived(worker, key, salt, first_run, params, password):
+        if not _finish_unlock(worker):
+            return
+
+        try:
+            if app_controller.complete_login(key, salt, first_run, params):
+                auth_controller.remember_session(password)
+                if first_run:
+                    QMessageBox.information(login_window, "Başarılı", "Master Password oluşturuldu!")
+                show_dashboard()
+                if not resume_key_rotation():
+                    start_kdf_upgrade(password, key, salt)
             else:
                 login_window.show_error("Hatalı Master Password!")
-        
+
         except ValueError as ve:
             login_window.show_error(str(ve))
         except Exception as e:
             login_window.show_error(f"Beklenmeyen hata: {e}")
 
+    def show_dashboard():
+        login_window.hide()
+        login_window.clear()
+        load_dashboard_data()
+        dashboard.show()
+
+    def on_unlock_failed(worker, message):
+        if not _finish_unlock(worker):
+            return
+        login_window.show_error(f"Beklenmeyen hata: {message}")
+
+    def cancel_unlock():
+        worker = unlock_state["worker"]
+        if worker is None:
+            return
+        unlock_state["worker"] = None
+        worker.cancel()
+
+    # Key rotation satirlari RotationWorker'da tasinir; bu sirada vault iki key ile kullanilir
+    rotation_state = {"worker": None}
+
+    def start_rotation(old_key, new_key, on_done=None):
+        worker = RotationWorker(db_path, storage.pragmas, old_key, new_key)
+        worker.rotated.connect(lambda count: on_rotated(worker, new_key, count, on_done))
+        worker.failed.connect(lambda msg: on_rotation_failed(worker, msg))
+        worker.finished.connect(worker.deleteLater)
+        rotation_state["worker"] = worker
+        worker.start()
+
+    def resume_key_rotation() -> bool:
+        # Yarim kalmis rotation (crash / auto-lock / kapatma) unlock'tan sonra kaldigi yerden devam eder
+        if rotation_state["worker"] is not None:
+            return True
+        keys = vault_controller.resumable_key_rotation()
+        if keys is None:
+            return False
+        try:
+            vault_controller.begin_key_rotation(*keys)
+        except Exception as e:
+            logger.error("MASTER_KEY_CHANGE_FAILED", str(e))
+            return False
+        start_rotation(*keys)
+        return True
+
+    def on_rotated(worker, new_key, count, on_done):
+        if rotation_state["worker"] is not worker:
+            return
+        rotation_state["worker"] = None
+        vault_controller.finish_key_rotation(new_key, count)
+        if on_done is not None:
+            on_done()
+        # Listedeki Account nesneleri eski ciphertext'i tutuyor
+        if dashboard.search_input.text():
+            refresh_search()
+        else:
+            load_dashboard_data()
+
+    def on_rotation_failed(worker, message):
+        if rotation_state["worker"] is not worker:
+            return
+        rotation_state["worker"] = None
+        vault_controller.fail_key_rotation(message)
+
+    def cancel_rotation():
+        worker = rotation_state["worker"]
+        if worker is None:
+            return
+        rotation_state["worker"] = None
+        worker.cancel()
+
+    # Saklanan KDF config'tekinden zayifsa: yeni key arka planda turetilir, hesaplar RotationWorker ile tasinir
+    upgrade_state = {"worker": None}
+
+    def start_kdf_upgrade(password, old_key, salt):
+        if rotation_state["worker"] is not None:
+            return
+        params = auth_controller.kdf_upgrade_params()
+        if params is None:
+            return
+
+        worker = UnlockWorker(lambda pw, s: encryption.derive_key(pw, s, params), password, salt)
+        worker.key_derived.connect(lambda new_key: on_upgrade_key_derived(worker, password, old_key, new_key, params))
+        worker.failed.connect(lambda msg: on_upgrade_failed(worker, msg))
+        worker.finished.connect(worker.deleteLater)
+        upgrade_state["worker"] = worker
+        worker.start()
+
+    def on_upgrade_key_derived(worker, password, old_key, new_key, params):
+        if upgrade_state["worker"] is not worker:
+            return
+        upgrade_state["worker"] = None
+
+        try:
+            vault_controller.begin_kdf_upgrade(old_key, new_key, params)
+        except Exception as e:
+            # Login bozulmaz; baslamadiysa sonraki login'de tekrar denenir
+            logger.error("KDF_UPGRADE_FAILED", str(e))
+            return
+        # Yuklu key degisti: quick unlock dogrulayicisi yeni key'e baglanir
+        auth_controller.remember_session(password)
+        start_rotation(old_key, new_key, on_done=lambda: logger.security("KDF_UPGRADED", repr(params)))
+
+    def on_upgrade_failed(worker, message):
+        if upgrade_state["worker"] is worker:
+            upgrade_state["worker"] = None
+        logger.error("KDF_UPGRADE_FAILED", message)
+
+    def cancel_kdf_upgrade():
+        worker = upgrade_state["worker"]
+        if worker is None:
+            return
+        upgrade_state["worker"] = None
+        worker.cancel()
+
+    # Idle auto-lock: config.json -> security.lock_timeout_seconds
+    idle_watcher = IdleWatcher(app, security_config.get("lock_timeout_seconds", 300))
+    session_expiry = QTimer()
+    session_expiry.setSingleShot(True)
+    # Pencere dolunca sarili key beklemeden silinir
+    session_expiry.timeout.connect(app_controller.expire_session)
+
+    def on_idle():
+        if not app_controller.vault_unlocked:
+            return
+
+        # Acik form / onay penceresi kilitli vault uzerinde kalmasin
+        modal = QApplication.activeModalWidget()
+        if isinstance(modal, QDialog):
+            modal.reject()
+        # Yarida kalan KDF yukseltmesi / rotation sonraki login'de devam eder
+        cancel_kdf_upgrade()
+        cancel_rotation()
+        search_pipeline.cancel()
+
+        held = app_controller.auto_lock()
+        logger.security("VAULT_AUTO_LOCKED", "quick unlock" if held else "")
+        dashboard.hide()
+        login_window.clear()
+        login_window.set_unlock_mode()
+        login_window.show()
+        if held:
+            session_expiry.start(int(session_cache.window_seconds * 1000))
+
+    idle_watcher.idle.connect(on_idle)
+
+    # Debounce + arka plan thread'i; eski sorgularin sonuclari atilir
+    search_pipeline = SearchPipeline(vault_controller.search_accounts)
+
     def on_search(keyword):
         if not keyword:
+            search_pipeline.cancel()
             load_dashboard_data()
             return
-        results = vault_controller.search_accounts(keyword)
+        if vault_controller.search_index.is_built:
+            search_pipeline.submit(keyword)
+        else:
+            search_with_fts(keyword)
+
+    def search_with_fts(keyword):
+        # Index arka planda kuruluyor: sayfali FTS (GUI thread'inde, connection orada)
+        search_pipeline.cancel()
+        dashboard.load_account_pages(
+            lambda after_id, limit: vault_controller.search_accounts_page(keyword, after_id, limit)
+        )
+
+    def refresh_search():
+        # Veri degisti: ayni aramayi index hazirsa pipeline'dan, degilse FTS ile tekrarla
+        keyword = dashboard.search_input.text()
+        if vault_controller.search_index.is_built:
+            search_pipeline.refresh(keyword)
+        else:
+            search_with_fts(keyword)
+
+    def on_search_results(keyword, results):
         dashboard.update_account_list(results)
 
+    def on_search_failed(message):
+        logger.error("SEARCH_FAILED", message)
+        dashboard.show_search_error(message)
+
+    # Ekle / guncelle / sil sonrasi tum dashboard yerine sadece etkilenen satir ve sayac
+    def on_account_changed(change):
+        searching = bool(dashboard.search_input.text())
+        dashboard.apply_account_change(change, patch_rows=not searching)
+        if searching:
+            refresh_search()
+
     def on_category_selected(cat_id):
         if cat_id == 0:
             load_dashboard_data()
         else:
-            results = vault_controller.list_by_category(cat_id)
-            dashboard.update_account_list(results)
+            dashboard.load_account_pages(
+                lambda after_id, limit: vault_controller.list_accounts_page(after_id, limit, cat_id)
+            )
 
     def on_delete_account(acc_id):
         confirm = QMessageBox.question(
@@ -128,12 +442,11 @@ def main():
             QMessageBox.Yes | QMessageBox.No
         )
         if confirm == QMessageBox.Yes:
-            if vault_controller.delete_account(acc_id):
-                load_dashboard_data()
+            vault_controller.delete_account(acc_id)
 
-    def on_copy_password(encrypted_pass):
+    def on_copy_password(account):
         try:
-            plain = encryption.decrypt(encrypted_pass)
+            plain = vault_controller.reveal_password(account)
             clipboard = QApplication.clipboard()
             clipboard.setText(plain)
         except Exception as e:
@@ -171,11 +484,104 @@ def main():
                     raw_password=data["password"],
                     category_id=data["category_id"]
                 )
-                load_dashboard_data()
 
         except Exception as e:
             QMessageBox.critical(dashboard, "Hata", str(e))
 
+    # Import / export TransferWorker'da (kendi connection'i ile) calisir, ilerleme modal olmayan pencerede
+    transfer_state = {"worker": None, "dialog": None}
+
+    def start_transfer(worker_cls, path, title, on_done):
+        if transfer_state["worker"] is not None:
+            QMessageBox.information(dashboard, title, "Devam eden bir aktarım var, lütfen bitmesini bekleyin.")
+            return
+        try:
+            key = vault_controller.transfer_key()
+        except Exception as e:
+            QMessageBox.critical(dashboard, "Hata", str(e))
+            return
+
+        dialog = QProgressDialog(f"{title} başladı...", None, 0, 0, dashboard)
+        dialog.setWindowTitle(title)
+        dialog.setWindowModality(Qt.NonModal)
+        dialog.setCancelButton(None)
+        # Kisa isler pencere acmadan biter
+        QTimer.singleShot(500, lambda: dialog.show() if transfer_state["dialog"] is dialog else None)
+
+        worker = worker_cls(db_path, storage.pragmas, key, path)
+        worker.progress.connect(lambda done, total: dialog.setLabelText(f"{title}: {done} / {total} satır işlendi..."))
+        worker.done.connect(lambda report: on_transfer_done(worker, report, on_done))
+        worker.failed.connect(lambda msg: on_transfer_failed(worker, title, msg))
+        worker.finished.connect(worker.deleteLater)
+        transfer_state.update(worker=worker, dialog=dialog)
+        worker.start()
+
+    def _end_transfer(worker) -> bool:
+        if transfer_state["worker"] is not worker:
+            return False
+        transfer_state["dialog"].close()
+        transfer_state["dialog"].deleteLater()
+        transfer_state.update(worker=None, dialog=None)
+        return True
+
+    def on_transfer_done(worker, report, on_done):
+        if _end_transfer(worker):
+            on_done(report)
+
+    def on_transfer_failed(worker, title, message):
+        if _end_transfer(worker):
+            QMessageBox.critical(dashboard, "Hata", f"{title} başarısız: {message}")
+
+    def wait_for_transfer():
+        # Kapanista yarim import / export birakilmaz (iki is de kesilemez)
+        worker = transfer_state["worker"]
+        if worker is not None:
+            worker.wait()
+
+    # --- TOPLU İÇE AKTARMA ---
+    def on_import_clicked():
+        path, _ = QFileDialog.getOpenFileName(
+            dashboard, "Import Passwords", "",
+            "Password exports (*.csv *.json *.jsonl)"
+        )
+        if not path:
+            return
+        start_transfer(ImportWorker, path, "İçe Aktarma", on_import_done)
+
+    def on_import_done(report):
+        vault_controller.finish_import(report)
+        # Bu arada auto-lock olduysa sonuc audit log'da kalir, kilitli ekranda gosterilmez
+        if not app_controller.vault_unlocked:
+            return
+        # Toplu degisiklik: burada tam yenileme daha ucuz
+        load_dashboard_data()
+        QMessageBox.information(
+            dashboard, "İçe Aktarma",
+            f"{report.imported} hesap eklendi, {report.duplicates} tekrar ve "
+            f"{report.invalid} geçersiz satır atlandı ({report.rows_per_sec:.0f} satır/sn)."
+        )
+
+    # --- ŞİFRELİ DIŞA AKTARMA ---
+    def on_export_clicked():
+        default_name = f"locklock-{datetime.now():%Y%m%d-%H%M}.llbak"
+        path, _ = QFileDialog.getSaveFileName(
+            dashboard, "Export Vault", os.path.join(user_data_dir, default_name),
+            "LockLock backup (*.llbak)"
+        )
+        if not path:
+            return
+        start_transfer(ExportWorker, path, "Dışa Aktarma", on_export_done)
+
+    def on_export_done(report):
+        vault_controller.finish_export(report)
+        if not app_controller.vault_unlocked:
+            return
+        QMessageBox.information(
+            dashboard, "Dışa Aktarma",
+            f"{report.rows['accounts']} hesap şifreli olarak kaydedildi "
+            f"({report.bytes_written / 1024:.0f} KB). Arşiv master password ile açılır."
+        )
+
     # --- YENİ HESAP GÜNCELLEME FONSİYONU ---
     def on_edit_account_clicked(account):
         try:
@@ -211,7 +617,6 @@ def main():
                     raw_password=data["password"], # Boşsa controller halledecek
                     category_id=data["category_id"]
                 )
-                load_dashboard_data()
                 print("Hesap güncellendi.")
 
         except Exception as e:
@@ -245,14 +650,34 @@ def main():
         """
 
     login_window.login_requested.connect(handle_login)
+    login_window.closing.connect(cancel_unlock)
     dashboard.search_changed.connect(on_search)
+    search_pipeline.results_ready.connect(on_search_results)
+    search_pipeline.search_failed.connect(on_search_failed)
+    vault_controller.subscribe(on_account_changed)
     dashboard.category_selected.connect(on_category_selected)
     dashboard.delete_account_requested.connect(on_delete_account)
     dashboard.copy_password_requested.connect(on_copy_password)
     dashboard.add_account_clicked.connect(on_add_account_clicked)
+    dashboard.import_clicked.connect(on_import_clicked)
+    dashboard.export_clicked.connect(on_export_clicked)
     # Yeni sinyali bağla
     dashboard.edit_account_requested.connect(on_edit_account_clicked)
 
+    # Debug paneli: Ctrl+Shift+I ile anlik zamanlama ve SQL profiler raporu
+    def show_instrumentation_report():
+        report = instrumentation.format_report()
+        if storage.profiler is not None:
+            storage.profiler.finish()
+            report += "\n\nSQL:\n" + storage.profiler.format_report()
+        box = QMessageBox(dashboard)
+        box.setWindowTitle("Instrumentation")
+        box.setText("Toplam süreye göre en pahalı çağrılar:")
+        box.setDetailedText(report)
+        box.exec_()
+
+    QShortcut(QKeySequence("Ctrl+Shift+I"), dashboard, activated=show_instrumentation_report)
+
     if auth_controller.is_first_run():
         login_window.setWindowTitle("LockLock - Setup")
         login_window.login_button.setText("Create Master Key")
@@ -261,9 +686,29 @@ def main():
     else:
         login_window.show()
     
+    idle_watcher.start()
     exit_code = app.exec_()
+    idle_watcher.stop()
+    session_expiry.stop()
+    cancel_unlock()
+    cancel_kdf_upgrade()
+    cancel_rotation()
+    wait_for_transfer()
+    for worker in list(index_workers):
+        worker.wait()
+    search_pipeline.shutdown()
+    if backup is not None:
+        backup.stop()
+    config_watcher.stop()
+    if storage.profiler is not None and diagnostics_config.get("dump_on_exit", True):
+        storage.profiler.finish()
+        storage.profiler.dump(os.path.join(diagnostics_dir, f"sql-profile-{datetime.now():%Y%m%d-%H%M%S}.json"))
     app_controller.shutdown()
+    if instrumentation.is_enabled() and diagnostics_config.get("dump_on_exit", True):
+        instrumentation.dump(os.path.join(diagnostics_dir, f"instrumentation-{datetime.now():%Y%m%d-%H%M%S}.json"))
     sys.exit(exit_code)
 
 if __name__ == "__main__":
+    # Key rotation worker process'leri paketlenmis (frozen) uygulamada da calissin
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
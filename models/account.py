@@ -14,9 +14,12 @@
         SQL baglantisi
         encryption
 
+    DB'den okunan satirlar icin AccountView (tuple tabanli, validate'siz) kullanilir.
+
     """
 
 from datetime import datetime
+from operator import itemgetter
 
 class Account:
     def __init__(
@@ -83,4 +86,62 @@ class Account:
             self.category_id,
             self.created_at.isoformat(),
             self.updated_at.isoformat()
-        )
\ No newline at end of file
+        )
+
+
+def _parse_timestamp(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+class AccountView(tuple):
+    """
+        DB'den okunan satir icin salt-okunur, tuple tabanli hesap gorunumu.
+
+        SELECT * satirini kopyasiz sarar (instance basina __dict__ yok),
+        validate() cagirmaz (satir DB'ye girerken zaten dogrulandi),
+        created_at / updated_at sadece erisildiginde parse edilir.
+        Account ile ayni alanlari ve to_dict / to_db_params'i sunar.
+    """
+
+    __slots__ = ()
+
+    id = property(itemgetter(0))
+    site = property(itemgetter(1))
+    username = property(itemgetter(2))
+    encrypted_password = property(itemgetter(3))
+    category_id = property(itemgetter(4))
+
+    @property
+    def created_at(self) -> datetime:
+        return _parse_timestamp(self[5])
+
+    @property
+    def updated_at(self) -> datetime:
+        return _parse_timestamp(self[6])
+
+    @classmethod
+    def from_rows(cls, rows) -> list["AccountView"]:
+        return list(map(cls, rows))
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "site": self.site,
+            "username": self.username,
+            "category_id": self.category_id,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+    def to_db_params(self) -> tuple:
+        return (
+            self.site,
+            self.username,
+            self.encrypted_password,
+            self.category_id,
+            self.created_at.isoformat(),
+            self.updated_at.isoformat()
+        )
+
+    def __repr__(self) -> str:
+        return f"AccountView(id={self.id!r}, site={self.site!r}, username={self.username!r})"
@@ -0,0 +1,36 @@
+"""
+    VaultController'in yayinladigi hesap degisikligi olayi.
+
+    Icermeli:
+        kind (ADDED / UPDATED / DELETED)
+        account_id
+        account (DELETED icin None)
+        eski / yeni kategori (sayaclari guncellemek icin)
+
+    Bu sayede UI her degisiklikte tum dashboard'u yeniden yuklemez,
+    sadece etkilenen satiri ve kategori sayacini gunceller.
+"""
+
+
+class AccountChange:
+    ADDED = "ADDED"
+    UPDATED = "UPDATED"
+    DELETED = "DELETED"
+
+    def __init__(
+        self,
+        kind: str,
+        account_id: int,
+        account=None,
+        old_category_id: int | None = None,
+        new_category_id: int | None = None
+    ):
+        self.kind = kind
+        self.account_id = account_id
+        self.account = account
+        self.old_category_id = old_category_id
+        self.new_category_id = new_category_id
+
+    @property
+    def category_changed(self) -> bool:
+        return self.old_category_id != self.new_category_id
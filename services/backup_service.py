@@ -0,0 +1,244 @@
+"""
+    app.db'nin periyodik, online snapshot yedegi (sqlite3 backup API).
+
+    Yapar:
+        arka plan thread'inde kendi connection'i ile Connection.backup calistirir
+        kopyayi pages_per_step sayfalik adimlarla yapar, adimlar arasinda bekler
+        WAL modunda kopya boyunca tek bir read snapshot tutar
+            (WAL'da okuyucu yaziciyi bloklamaz, app yazdikca backup bastan baslamaz)
+        rollback journal modunda lock'u adimlar arasinda birakir
+            (yazmalar araya girebilir; cok kez bastan baslarsa tek adimda kopyalar)
+        her snapshot'i PRAGMA integrity_check ile dogrular, bozuksa siler
+        en yeni `keep` snapshot'i tutar, eskileri siler
+        adim basina lock suresini, toplam sureyi ve integrity check suresini olcer
+
+    Yapmaz:
+        restore (snapshot zaten calisir durumda bir SQLite dosyasidir)
+        sifreleme (account sifreleri DB'de zaten sifreli)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+DEFAULT_INTERVAL_SECONDS = 3600
+DEFAULT_KEEP = 5
+DEFAULT_PAGES_PER_STEP = 256
+DEFAULT_STEP_PAUSE_MS = 10
+# Rollback journal modunda kaynak DB baska connection'dan yazildikca backup bastan baslar
+MAX_RESTARTS = 5
+
+SNAPSHOT_PREFIX = "app-"
+SNAPSHOT_SUFFIX = ".db"
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+class BackupRun:
+
+    def __init__(self, path: str):
+        self.path = path
+        self.started_at = datetime.now()
+        self.pages = 0
+        self.steps = 0
+        self.restarts = 0
+        self.snapshot_pinned = False
+        self.single_step_fallback = False
+        self.step_times: list[float] = []
+        self.total_time = 0.0
+        self.integrity_time = 0.0
+        self.ok = False
+        self.error: str | None = None
+
+    @property
+    def max_step_ms(self) -> float:
+        return max(self.step_times) * 1000 if self.step_times else 0.0
+
+    @property
+    def p95_step_ms(self) -> float:
+        if not self.step_times:
+            return 0.0
+        ordered = sorted(self.step_times)
+        return ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))] * 1000
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "started_at": self.started_at.isoformat(),
+            "pages": self.pages,
+            "steps": self.steps,
+            "restarts": self.restarts,
+            "snapshot_pinned": self.snapshot_pinned,
+            "single_step_fallback": self.single_step_fallback,
+            "max_step_ms": self.max_step_ms,
+            "p95_step_ms": self.p95_step_ms,
+            "total_ms": self.total_time * 1000,
+            "integrity_ms": self.integrity_time * 1000,
+            "ok": self.ok,
+            "error": self.error,
+        }
+
+
+class BackupService:
+
+    def __init__(
+        self,
+        storage_service,
+        backup_dir: str,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        keep: int = DEFAULT_KEEP,
+        pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+        step_pause_ms: int = DEFAULT_STEP_PAUSE_MS
+    ):
+        self.storage = storage_service
+        self.backup_dir = backup_dir
+        self.interval_seconds = interval_seconds
+        self.keep = max(1, keep)
+        self.pages_per_step = pages_per_step
+        self.step_pause_ms = step_pause_ms
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+        # Son calismalarin olculeri
+        self.history: deque[BackupRun] = deque(maxlen=20)
+
+    # Scheduling
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="VaultBackup", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            # Calisan adim biter, kalan adimlar iptal edilir
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        delay = self._initial_delay()
+        while not self._stop.wait(delay):
+            self.backup_now()
+            delay = self.interval_seconds
+
+    def _initial_delay(self) -> float:
+        # Uygulama sik kapanip aciliyorsa her aciliste yedek alinmasin
+        snapshots = self.list_snapshots()
+        if not snapshots:
+            return 0.0
+        age = time.time() - os.path.getmtime(snapshots[-1])
+        return max(0.0, self.interval_seconds - age)
+
+    # Snapshots
+    def list_snapshots(self) -> list[str]:
+        if not os.path.isdir(self.backup_dir):
+            return []
+        names = sorted(
+            name for name in os.listdir(self.backup_dir)
+            if name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX)
+        )
+        return [os.path.join(self.backup_dir, name) for name in names]
+
+    def backup_now(self) -> BackupRun:
+        with self._lock:
+            os.makedirs(self.backup_dir, exist_ok=True)
+            name = f"{SNAPSHOT_PREFIX}{datetime.now():%Y%m%d-%H%M%S-%f}{SNAPSHOT_SUFFIX}"
+            run = BackupRun(os.path.join(self.backup_dir, name))
+            temp_path = run.path + ".part"
+
+            start = time.perf_counter()
+            try:
+                self._copy(temp_path, run)
+                run.ok = self._verify(temp_path, run)
+                if run.ok:
+                    os.replace(temp_path, run.path)
+                    self._prune()
+                else:
+                    run.error = "integrity_check failed"
+            except Exception as e:
+                run.error = str(e)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+            run.total_time = time.perf_counter() - start
+            self.history.append(run)
+            return run
+
+    def _copy(self, temp_path: str, run: BackupRun):
+        source = self.storage.open_connection()
+        try:
+            if source.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal":
+                # Read transaction'i ac ve snapshot'i sabitle; backup adimlari bunu kullanir
+                source.execute("BEGIN")
+                source.execute("SELECT count(*) FROM sqlite_master").fetchone()
+                run.snapshot_pinned = True
+
+            try:
+                self._copy_steps(source, temp_path, run, self.pages_per_step)
+            except _TooManyRestarts:
+                run.single_step_fallback = True
+                self._copy_steps(source, temp_path, run, -1)
+        finally:
+            source.close()
+
+    def _copy_steps(self, source: sqlite3.Connection, temp_path: str, run: BackupRun, pages: int):
+        target = sqlite3.connect(temp_path)
+        pause = self.step_pause_ms / 1000
+        state = {"step_start": time.perf_counter(), "remaining": None}
+
+        def on_progress(status, remaining, total):
+            # Adim suresi = kaynakta lock tutulan sure
+            run.step_times.append(time.perf_counter() - state["step_start"])
+            run.steps += 1
+            run.pages = total
+
+            if state["remaining"] is not None and remaining >= state["remaining"]:
+                run.restarts += 1
+                if pages > 0 and run.restarts > MAX_RESTARTS:
+                    raise _TooManyRestarts()
+            state["remaining"] = remaining
+
+            if self._stop.is_set():
+                raise RuntimeError("Backup iptal edildi")
+            if remaining and pause:
+                time.sleep(pause)
+            state["step_start"] = time.perf_counter()
+
+        try:
+            source.backup(target, pages=pages, progress=on_progress)
+        finally:
+            target.close()
+
+    def _verify(self, path: str, run: BackupRun) -> bool:
+        start = time.perf_counter()
+        conn = sqlite3.connect(path)
+        try:
+            result = conn.execute("PRAGMA integrity_check").fetchall()
+        finally:
+            conn.close()
+        run.integrity_time = time.perf_counter() - start
+        return result == [("ok",)]
+
+    def _prune(self):
+        for path in self.list_snapshots()[:-self.keep]:
+            os.remove(path)
+
+    # Metrics
+    def stats(self) -> dict:
+        runs = list(self.history)
+        return {
+            "runs": len(runs),
+            "failed": sum(1 for run in runs if not run.ok),
+            "last": runs[-1].to_dict() if runs else None,
+            "max_step_ms": max((run.max_step_ms for run in runs), default=0.0),
+        }
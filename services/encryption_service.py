@@ -1,91 +1,217 @@
 import os
-import base64
 import hashlib
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+from utils.constants import MIN_MASTER_PASSWORD_LENGTH
+from services import kdf
+from services.kdf import KdfParams
+from services.plaintext_cache import PlaintextCache
+from utils.instrumentation import instrumented
 
 class EncryptionService:
 
-    def __init__(self, storage_service):
+    def __init__(self, storage_service, plaintext_cache: PlaintextCache | None = None, kdf_params: KdfParams | None = None):
         self._key: bytes | None = None
+        # Fernet her unlock'ta bir kez kurulur, clear_key ile silinir
+        self._fernet: Fernet | MultiFernet | None = None
+        # Yarim kalmis rotation'da primary disinda decrypt eden key'ler
+        self._fallback_keys: tuple[bytes, ...] = ()
         self.storage = storage_service
+        # Copy / reveal tekrarlarinda Fernet HMAC + AES tekrar odenmesin
+        self.plaintext_cache = plaintext_cache or PlaintextCache()
+        # Yeni key'ler bu parametrelerle turetilir (config.json -> encryption.kdf)
+        self.kdf_params = kdf_params or KdfParams()
 
     # Key derivation
-    def _derive_key(self, password: str, salt: bytes) -> bytes:
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=200_000,
-            backend=default_backend()
-        )
-        return base64.urlsafe_b64encode(
-            kdf.derive(password.encode())
-        )
+    @instrumented("encryption.derive_key")
+    def _derive_key(self, password: str, salt: bytes, params: KdfParams) -> bytes:
+        return kdf.derive(password, salt, params)
+
+    def derive_key(self, password: str, salt: bytes, params: KdfParams) -> bytes:
+        # Storage'a dokunmaz, UnlockWorker bunu GUI thread disinda cagirir.
+        # params acik verilir: unlock'ta get_stored_kdf(), yeni key'de kdf_params
+        return self._derive_key(password, salt, params)
+
+    def new_salt(self) -> bytes:
+        return os.urandom(16)
+
+    def get_stored_salt(self) -> bytes | None:
+        meta = self.storage.get_master_key_meta()
+        if not meta or "master_key_salt" not in meta:
+            return None
+        return bytes.fromhex(meta["master_key_salt"])
+
+    def get_stored_kdf(self) -> KdfParams:
+        # Mevcut master key'in turetildigi parametreler
+        meta = self.storage.get_master_key_meta() or {}
+        return KdfParams.from_json(meta.get("master_key_kdf"))
 
     # First run
     def create_master_key(self, password: str):
-        if len(password) < 8:
-            raise ValueError("Master password must be at least 8 chars")
+        if len(password) < MIN_MASTER_PASSWORD_LENGTH:
+            raise ValueError(f"Master password must be at least {MIN_MASTER_PASSWORD_LENGTH} chars")
 
-        salt = os.urandom(16)
-        key = self._derive_key(password, salt)
+        salt = self.new_salt()
+        key = self._derive_key(password, salt, self.kdf_params)
+        self.store_master_key(salt, key)
 
+    def store_master_key(self, salt: bytes, key: bytes, params: KdfParams | None = None):
         key_hash = hashlib.sha256(key).hexdigest()
 
         self.storage.save_master_key_meta(
             salt=salt.hex(),
-            key_hash=key_hash
+            key_hash=key_hash,
+            kdf=(params or self.kdf_params).to_json()
         )
 
-        self._key = key
+        self._set_key(key)
 
-    # Login - HATA BURADAYDI, DÜZELTİLDİ
+    # Login
     def verify_master_key(self, password: str) -> bool:
-        meta = self.storage.get_master_key_meta()
-        if not meta:
+        salt = self.get_stored_salt()
+        if salt is None:
             return False
 
-        # Veritabanından gelen anahtarlar 'master_key_salt' ve 'master_key_hash'
-        try:
-            salt_hex = meta["master_key_salt"]
-            salt = bytes.fromhex(salt_hex)
-            expected_hash = meta["master_key_hash"]
-        except KeyError:
-            # Eğer anahtarlar eksikse false dön
+        key = self._derive_key(password, salt, self.get_stored_kdf())
+        return self.accept_key(key)
+
+    def accept_key(self, key: bytes) -> bool:
+        meta = self.storage.get_master_key_meta()
+        if not meta or "master_key_hash" not in meta:
             return False
 
-        key = self._derive_key(password, salt)
         key_hash = hashlib.sha256(key).hexdigest()
-
-        if key_hash != expected_hash:
+        checkpoint = self.storage.get_key_rotation_checkpoint()
+        if checkpoint:
+            # Yarim kalmis rotation: satirlarin bir kismi yeni key ile, ikisi birden yuklenir
+            keys = self._rotation_keys(key, key_hash, meta["master_key_hash"], checkpoint)
+            if keys is None:
+                return False
+            self.load_keys(*keys)
+            return True
+
+        if key_hash != meta["master_key_hash"]:
             return False
 
-        self._key = key
+        self._set_key(key)
         return True
 
+    @staticmethod
+    def _rotation_keys(key: bytes, key_hash: str, master_hash: str, checkpoint: dict) -> tuple[bytes, ...] | None:
+        # (yeni, eski): eski veya yeni password ile acilabilir, diger key checkpoint'te sarili
+        try:
+            if key_hash == master_hash:
+                if "wrapped_new_key" not in checkpoint:
+                    # Sarili key'lerden onceki checkpoint: sadece eski key
+                    return (key,)
+                return Fernet(key).decrypt(checkpoint["wrapped_new_key"].encode()), key
+            if key_hash == checkpoint["new_key_hash"]:
+                return key, Fernet(key).decrypt(checkpoint["wrapped_old_key"].encode())
+        except (KeyError, InvalidToken):
+            raise ValueError("Yarım kalmış key rotation kaydı okunamadı.")
+        return None
+
     # Runtime usage
     def load_key(self, key: bytes):
         if not key:
             raise ValueError("Key cannot be empty")
+        self._set_key(key)
+
+    def load_keys(self, primary: bytes, *fallbacks: bytes):
+        # Yarim kalmis key rotation'da iki key de decrypt edebilsin, encrypt hep primary ile
+        if not primary:
+            raise ValueError("Key cannot be empty")
+        self._fernet = MultiFernet([Fernet(primary)] + [Fernet(key) for key in fallbacks])
+        self._key = primary
+        self._fallback_keys = fallbacks
+        self.plaintext_cache.clear()
+
+    def rotation_keys(self) -> tuple[bytes, bytes] | None:
+        # Yarim kalmis rotation'i devam ettirmek icin (yeni, eski); tek key yukluyse None
+        if not self._key or not self._fallback_keys:
+            return None
+        return self._key, self._fallback_keys[0]
+
+    def _set_key(self, key: bytes):
+        # Key degisti (unlock / rotation): eski ciphertext'lere ait plaintext'ler atilir
+        self._fernet = Fernet(key)
         self._key = key
+        self._fallback_keys = ()
+        self.plaintext_cache.clear()
 
-    def encrypt(self, plain_text: str) -> str:
-        if not self._key:
+    def _cipher(self) -> Fernet | MultiFernet:
+        if not self._fernet:
             raise RuntimeError("Vault is locked")
+        return self._fernet
 
-        fernet = Fernet(self._key)
-        return fernet.encrypt(plain_text.encode()).decode()
+    @instrumented("encryption.encrypt")
+    def encrypt(self, plain_text: str) -> str:
+        return self._cipher().encrypt(plain_text.encode()).decode()
 
+    @instrumented("encryption.decrypt")
     def decrypt(self, cipher_text: str) -> str:
+        return self._cipher().decrypt(cipher_text.encode()).decode()
+
+    def decrypt_cached(self, account_id: int, cipher_text: str) -> str:
+        self._cipher()
+        plain_text = self.plaintext_cache.get(account_id, cipher_text)
+        if plain_text is None:
+            plain_text = self.decrypt(cipher_text)
+            self.plaintext_cache.put(account_id, cipher_text, plain_text)
+        return plain_text
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        return self._cipher().encrypt(data)
+
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        return self._cipher().decrypt(token)
+
+    # Batch
+    def encrypt_many(self, plain_texts: list[str]) -> list[str]:
+        encrypt = self._cipher().encrypt
+        return [encrypt(text.encode()).decode() for text in plain_texts]
+
+    def decrypt_many(self, cipher_texts: list[str]) -> list[str]:
+        decrypt = self._cipher().decrypt
+        return [decrypt(text.encode()).decode() for text in cipher_texts]
+
+    def encrypt_many_parallel(self, plain_texts: list[str], pool, workers: int) -> list[str]:
+        # pool: ProcessPoolExecutor; key process'lere sadece bu cagri boyunca gider
+        if pool is None or workers <= 1:
+            return self.encrypt_many(plain_texts)
         if not self._key:
             raise RuntimeError("Vault is locked")
 
-        fernet = Fernet(self._key)
-        return fernet.decrypt(cipher_text.encode()).decode()
+        chunk_size = max(1, -(-len(plain_texts) // workers))
+        futures = [
+            pool.submit(EncryptionService.encrypt_many_with_key, plain_texts[i:i + chunk_size], self._key)
+            for i in range(0, len(plain_texts), chunk_size)
+        ]
+        encrypted = []
+        for future in futures:
+            encrypted.extend(future.result())
+        return encrypted
+
+    @staticmethod
+    def encrypt_many_with_key(plain_texts: list[str], key: bytes) -> list[str]:
+        fernet = Fernet(key)
+        return [fernet.encrypt(text.encode()).decode() for text in plain_texts]
+
+    # Key rotation (worker process'lerde de calisir, instance state kullanmaz)
+    @staticmethod
+    def reencrypt_many(cipher_texts: list[str], old_key: bytes, new_key: bytes) -> list[str]:
+        # rotate: eski veya yeni key ile cozer, yeni key ile sifreler
+        # (rotation sirasinda yeni key ile yazilmis satirlar da guvenle islenir)
+        multi = MultiFernet([Fernet(new_key), Fernet(old_key)])
+        return [multi.rotate(text.encode()).decode() for text in cipher_texts]
 
     # Utils
+    def session_key(self) -> bytes | None:
+        # Auto-lock'ta SessionKeyCache'e sarilmak uzere; kilitliyse None
+        return self._key
+
     def clear_key(self):
-        self._key = None
\ No newline at end of file
+        self._fernet = None
+        self._key = None
+        self._fallback_keys = ()
+        self.plaintext_cache.clear()
@@ -0,0 +1,251 @@
+"""
+    Vault'un sifreli, sikistirilmis export / restore islemi.
+
+    Arsiv formati:
+        MAGIC satiri
+        JSON header satiri (format, kdf_salt, kdf, chunk_size, created_at)
+            kdf: master key'in KDF parametreleri (yoksa eski arsiv: LEGACY_PARAMS)
+        frame'ler: 4 byte uzunluk (big-endian) + Fernet(zlib(payload))
+            payload = JSON satirlari: ["meta" | "categories" | "accounts", row]
+        son frame: ["end", {tablo: satir sayisi}] (yarim kalmis arsivi yakalar)
+
+    Yapar:
+        meta, categories, accounts tablolarini cursor ile satir satir okur
+        sabit boyutlu chunk'lar halinde yazar, bellek kullanimi vault boyutundan bagimsiz
+        arsivi master key ile sifreler (salt header'da, master password ile acilir)
+        restore'u frame frame, tek transaction icinde yeni bir veritabanina yapar
+            (hedef MigrationService ile kurulur: user_version ve unique index dahil;
+            FTS indexi satir satir degil, sonda tek rebuild ile kurulur)
+
+    Yapmaz:
+        logs tablosunu
+        yarim kalmis key rotation / KDF yukseltmesi sirasinda export
+            (frame'ler primary = yeni key ile sifrelenir, header'daki salt / KDF ise eski key'in)
+        calisan app.db'nin ustune yazmak (restore hedefi yeni bir dosyadir;
+            restore_vault sadece API'dir, UI'dan cagrilmaz)
+"""
+
+import json
+import os
+import struct
+import time
+import zlib
+from datetime import datetime
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from services.kdf import KdfParams, LEGACY_PARAMS
+from services.migration_service import MigrationService
+from services.storage_service import StorageService, EXPORT_TABLES
+
+MAGIC = b"LOCKLOCK-EXPORT\n"
+FORMAT_VERSION = 1
+DEFAULT_CHUNK_SIZE = 256 * 1024
+COMPRESSION_LEVEL = 6
+
+FRAME_HEADER = struct.Struct(">I")
+END_MARKER = "end"
+
+
+class ExportReport:
+
+    def __init__(self):
+        self.rows = {table: 0 for table in EXPORT_TABLES}
+        self.frames = 0
+        self.raw_bytes = 0
+        self.bytes_written = 0
+        self.elapsed = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+    @property
+    def mb_per_sec(self) -> float:
+        return self.raw_bytes / 1_000_000 / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": dict(self.rows),
+            "frames": self.frames,
+            "raw_bytes": self.raw_bytes,
+            "bytes_written": self.bytes_written,
+            "elapsed": self.elapsed,
+            "mb_per_sec": self.mb_per_sec,
+        }
+
+
+def read_header(f) -> dict:
+    if f.readline() != MAGIC:
+        raise ValueError("Geçersiz export dosyası")
+    header = json.loads(f.readline())
+    if header.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Desteklenmeyen export formatı: {header.get('format')}")
+    return header
+
+
+def _iter_frames(f):
+    while True:
+        prefix = f.read(FRAME_HEADER.size)
+        if not prefix:
+            return
+        if len(prefix) < FRAME_HEADER.size:
+            raise ValueError("Export dosyası yarım kalmış")
+        (length,) = FRAME_HEADER.unpack(prefix)
+        token = f.read(length)
+        if len(token) < length:
+            raise ValueError("Export dosyası yarım kalmış")
+        yield token
+
+
+class ExportService:
+
+    def __init__(self, storage_service, encryption_service, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.storage = storage_service
+        self.encryption = encryption_service
+        self.chunk_size = chunk_size
+
+    # Export
+    def export_vault(self, path: str, progress=None) -> ExportReport:
+        meta = self.storage.get_master_key_meta()
+        if not meta or "master_key_salt" not in meta:
+            raise RuntimeError("Master key bulunamadı")
+        if self.storage.get_key_rotation_checkpoint():
+            raise RuntimeError("Key rotation tamamlanmadan dışa aktarma yapılamaz, lütfen bitmesini bekleyin.")
+
+        report = ExportReport()
+        start = time.perf_counter()
+        header = {
+            "format": FORMAT_VERSION,
+            "kdf_salt": meta["master_key_salt"],
+            "kdf": KdfParams.from_json(meta.get("master_key_kdf")).to_dict(),
+            "chunk_size": self.chunk_size,
+            "created_at": datetime.now().isoformat(),
+        }
+
+        # Yarim arsiv hedef dosyada kalmasin
+        temp_path = path + ".part"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(MAGIC)
+                f.write(json.dumps(header).encode() + b"\n")
+                report.bytes_written = f.tell()
+
+                # Tek read transaction: uc tablo ayni anin goruntusu
+                self.storage.begin_transaction()
+                try:
+                    self._write_tables(f, report, progress)
+                finally:
+                    self.storage.commit()
+
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _write_tables(self, f, report: ExportReport, progress):
+        buffer = bytearray()
+
+        for table in EXPORT_TABLES:
+            for row in self.storage.iter_export_rows(table):
+                buffer += json.dumps([table, row], separators=(",", ":")).encode()
+                buffer += b"\n"
+                report.rows[table] += 1
+
+                if len(buffer) >= self.chunk_size:
+                    self._write_frame(f, buffer, report)
+                    buffer = bytearray()
+                    if progress:
+                        progress(report.total_rows)
+
+        buffer += json.dumps([END_MARKER, report.rows]).encode() + b"\n"
+        self._write_frame(f, buffer, report)
+        if progress:
+            progress(report.total_rows)
+
+    def _write_frame(self, f, payload: bytearray, report: ExportReport):
+        token = self.encryption.encrypt_bytes(zlib.compress(bytes(payload), COMPRESSION_LEVEL))
+        f.write(FRAME_HEADER.pack(len(token)))
+        f.write(token)
+        report.frames += 1
+        report.raw_bytes += len(payload)
+        report.bytes_written += FRAME_HEADER.size + len(token)
+
+    # Restore
+    def restore_vault(self, archive_path: str, db_path: str, password: str, schema_path: str, progress=None) -> ExportReport:
+        if os.path.exists(db_path):
+            raise FileExistsError(f"Hedef veritabanı zaten var: {db_path}")
+
+        report = ExportReport()
+        start = time.perf_counter()
+
+        with open(archive_path, "rb") as f:
+            header = read_header(f)
+            # Arsiv, export eden vault'un master key'i ile sifreli
+            params = KdfParams.from_dict(header["kdf"]) if "kdf" in header else LEGACY_PARAMS
+            key = self.encryption.derive_key(password, bytes.fromhex(header["kdf_salt"]), params)
+            fernet = Fernet(key)
+
+            target = StorageService(db_path, pragmas=self.storage.pragmas)
+            target.connect()
+            try:
+                # Acilista calisan ayni migration'lar: restore edilen vault guncel versiyonda baslar
+                MigrationService(target, schema_path).migrate()
+
+                target.begin_transaction()
+                target.clear_categories()
+                trigger_sql = target.pause_search_index_sync()
+                expected = self._read_frames(f, fernet, target, report, progress)
+                if expected is None:
+                    raise ValueError("Export dosyası yarım kalmış")
+                if expected != report.rows:
+                    raise ValueError("Export dosyasındaki satır sayıları tutmuyor")
+                target.resume_search_index_sync(trigger_sql)
+                target.commit()
+            except BaseException:
+                target.rollback()
+                target.close()
+                os.remove(db_path)
+                raise
+            target.close()
+
+        report.bytes_written = os.path.getsize(db_path)
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _read_frames(self, f, fernet: Fernet, target: StorageService, report: ExportReport, progress) -> dict | None:
+        for token in _iter_frames(f):
+            try:
+                payload = zlib.decompress(fernet.decrypt(token))
+            except InvalidToken:
+                raise ValueError("Master password yanlış veya export dosyası bozuk")
+
+            report.frames += 1
+            report.raw_bytes += len(payload)
+
+            batches = {table: [] for table in EXPORT_TABLES}
+            expected = None
+            for line in payload.splitlines():
+                table, row = json.loads(line)
+                if table == END_MARKER:
+                    expected = row
+                    continue
+                batches[table].append(row)
+
+            # Tablo sirasi korunur: categories, accounts'tan once yazilir
+            for table, rows in batches.items():
+                if rows:
+                    target.insert_export_rows(table, rows)
+                    report.rows[table] += len(rows)
+
+            if progress:
+                progress(report.total_rows)
+            if expected is not None:
+                return expected
+        return None
@@ -0,0 +1,217 @@
+"""
+    Tarayici / parola yoneticisi export'larini vault'a toplu aktarir.
+
+    Desteklenen formatlar:
+        CSV  - Chrome / Edge, Firefox, Safari, Bitwarden, LastPass, 1Password
+               (kolon adlari basliktan taninir)
+        JSON - Bitwarden export ({"items": [...]}) veya duz obje listesi
+        JSONL - satir basina bir obje
+
+    Yapar:
+        satirlari lazy okur (CSV / JSONL tamamen bellege alinmaz)
+        batch batch sifreler (buyuk dosyalarda process havuzunda)
+        her batch'i executemany ile kendi transaction'inda yazar
+        kategori adlarini categories.id'ye cevirir, yoksa olusturur
+        (site, username) ciftine gore duplicate'leri atlar
+
+    Yapmaz:
+        UI
+        arama indexini guncellemez (VaultController yeniden kurar)
+"""
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from urllib.parse import urlparse
+
+DEFAULT_BATCH_SIZE = 2000
+DEFAULT_CATEGORY = "Other"
+
+SITE_COLUMNS = ("name", "title", "site", "website")
+URL_COLUMNS = ("url", "login_uri", "uri")
+USERNAME_COLUMNS = ("username", "login_username", "login", "email", "user")
+PASSWORD_COLUMNS = ("password", "login_password")
+CATEGORY_COLUMNS = ("grouping", "folder", "category", "group")
+
+
+class ImportReport:
+
+    def __init__(self):
+        self.total_rows = 0
+        self.imported = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.total_rows / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "total_rows": self.total_rows,
+            "imported": self.imported,
+            "duplicates": self.duplicates,
+            "invalid": self.invalid,
+            "elapsed": self.elapsed,
+            "rows_per_sec": self.rows_per_sec,
+        }
+
+
+def _first(record: dict, columns: tuple) -> str:
+    for column in columns:
+        value = record.get(column)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def _normalize(record: dict) -> dict:
+    record = {str(key).strip().lower(): value for key, value in record.items() if key}
+
+    site = _first(record, SITE_COLUMNS)
+    if not site:
+        url = _first(record, URL_COLUMNS)
+        site = (urlparse(url).hostname or url) if url else ""
+
+    return {
+        "site": site,
+        "username": _first(record, USERNAME_COLUMNS),
+        "password": _first(record, PASSWORD_COLUMNS),
+        "category": _first(record, CATEGORY_COLUMNS),
+    }
+
+
+def _bitwarden_records(data: dict):
+    folders = {folder.get("id"): folder.get("name") for folder in data.get("folders", [])}
+    for item in data.get("items", []):
+        login = item.get("login") or {}
+        uris = login.get("uris") or []
+        yield {
+            "name": item.get("name"),
+            "url": uris[0].get("uri") if uris else "",
+            "username": login.get("username"),
+            "password": login.get("password"),
+            "folder": folders.get(item.get("folderId")),
+        }
+
+
+def iter_records(path: str):
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for record in csv.DictReader(f):
+                yield _normalize(record)
+
+    elif extension == ".jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield _normalize(json.loads(line))
+
+    elif extension == ".json":
+        # Duz JSON akis halinde parse edilemiyor, dosya bir kez okunur
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        records = _bitwarden_records(data) if isinstance(data, dict) else data
+        for record in records:
+            yield _normalize(record)
+
+    else:
+        raise ValueError(f"Desteklenmeyen dosya türü: {extension}")
+
+
+class ImportService:
+
+    def __init__(self, storage_service, encryption_service, batch_size: int = DEFAULT_BATCH_SIZE, workers: int | None = None):
+        self.storage = storage_service
+        self.encryption = encryption_service
+        self.batch_size = batch_size
+        self.workers = workers or os.cpu_count() or 1
+
+    def import_file(self, path: str, progress=None) -> ImportReport:
+        report = ImportReport()
+        start = time.perf_counter()
+
+        seen = set(self.storage.iter_account_keys())
+        categories = {name.lower(): category_id for name, category_id in self.storage.get_category_ids().items()}
+
+        pool = None
+        if self.workers > 1 and os.path.getsize(path) > 1_000_000:
+            pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        try:
+            batch = []
+            for record in iter_records(path):
+                report.total_rows += 1
+
+                if not (record["site"] and record["username"] and record["password"]):
+                    report.invalid += 1
+                    continue
+
+                key = (record["site"], record["username"])
+                if key in seen:
+                    report.duplicates += 1
+                    continue
+                seen.add(key)
+
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    self._write_batch(batch, categories, pool, report)
+                    batch = []
+                    if progress:
+                        progress(report.imported, report.total_rows)
+
+            if batch:
+                self._write_batch(batch, categories, pool, report)
+                if progress:
+                    progress(report.imported, report.total_rows)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _write_batch(self, batch: list[dict], categories: dict, pool, report: ImportReport):
+        encrypted = self.encryption.encrypt_many_parallel(
+            [record["password"] for record in batch], pool, self.workers
+        )
+        now = datetime.now().isoformat()
+
+        self.storage.begin_transaction()
+        try:
+            rows = [
+                (
+                    record["site"],
+                    record["username"],
+                    cipher,
+                    self._resolve_category(record["category"], categories),
+                    now,
+                    now
+                )
+                for record, cipher in zip(batch, encrypted)
+            ]
+            self.storage.insert_accounts(rows)
+            self.storage.commit()
+        except Exception:
+            self.storage.rollback()
+            raise
+
+        report.imported += len(batch)
+
+    def _resolve_category(self, name: str, categories: dict) -> int:
+        # Bos veya gecersiz (2 karakterden kisa) kategori adlari "Other"a gider
+        name = name.strip() if name else ""
+        if len(name) < 2:
+            name = DEFAULT_CATEGORY
+
+        category_id = categories.get(name.lower())
+        if category_id is None:
+            category_id = self.storage.create_category(name)
+            categories[name.lower()] = category_id
+        return category_id
@@ -0,0 +1,191 @@
+"""
+    Master password -> Fernet key turetme (KDF) parametreleri.
+
+    Yapar:
+        PBKDF2-HMAC-SHA256 ve scrypt (memory-hard) ile key turetir
+        parametreleri config.json -> encryption.kdf'ten okur
+        parametreleri meta'da salt'in yaninda JSON olarak saklar
+            (master_key_kdf; yoksa eski vault: PBKDF2 200k = LEGACY_PARAMS)
+        calibrate(): bu makinede hedef unlock suresine ulasan parametreleri bulur
+            (sonuc meta'da makine adiyla cache'lenir, her aciliste olculmez)
+        needs_upgrade(): saklanan parametreler hedeften zayif mi
+
+    Yapmaz:
+        key'i saklamak / hash kontrolu (EncryptionService)
+        yukseltmenin kendisi (VaultController.upgrade_kdf, rotation motoru ile)
+"""
+
+import base64
+import json
+import platform
+import time
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+PBKDF2 = "pbkdf2-sha256"
+SCRYPT = "scrypt"
+# config.json'daki eski isimler de kabul edilir
+ALGORITHM_ALIASES = {"pbkdf2hmac": PBKDF2, "pbkdf2": PBKDF2, PBKDF2: PBKDF2, SCRYPT: SCRYPT}
+
+KEY_LENGTH = 32
+DEFAULT_PBKDF2_ITERATIONS = 390_000
+MIN_PBKDF2_ITERATIONS = 100_000
+DEFAULT_SCRYPT_N = 2 ** 16
+DEFAULT_SCRYPT_R = 8
+DEFAULT_SCRYPT_P = 1
+MIN_SCRYPT_N = 2 ** 14
+
+DEFAULT_TARGET_MS = 500
+DEFAULT_MAX_MEMORY_MB = 128
+CALIBRATION_META_KEY = "kdf_calibration"
+
+
+class KdfParams:
+
+    def __init__(self, algorithm: str = PBKDF2, iterations: int = DEFAULT_PBKDF2_ITERATIONS,
+                 n: int = DEFAULT_SCRYPT_N, r: int = DEFAULT_SCRYPT_R, p: int = DEFAULT_SCRYPT_P):
+        name = ALGORITHM_ALIASES.get(str(algorithm).lower())
+        if name is None:
+            raise ValueError(f"Desteklenmeyen KDF: {algorithm}")
+        self.algorithm = name
+        self.iterations = int(iterations)
+        self.n = int(n)
+        self.r = int(r)
+        self.p = int(p)
+
+        if self.algorithm == PBKDF2 and self.iterations < 1:
+            raise ValueError("PBKDF2 iterations pozitif olmali")
+        if self.algorithm == SCRYPT and (self.n < 2 or self.n & (self.n - 1)):
+            raise ValueError("scrypt n 2'nin kuvveti olmali")
+
+    # Serialization
+    def to_dict(self) -> dict:
+        if self.algorithm == SCRYPT:
+            return {"algorithm": SCRYPT, "n": self.n, "r": self.r, "p": self.p}
+        return {"algorithm": PBKDF2, "iterations": self.iterations}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KdfParams":
+        return cls(
+            algorithm=data.get("algorithm", PBKDF2),
+            iterations=data.get("iterations", DEFAULT_PBKDF2_ITERATIONS),
+            n=data.get("n", DEFAULT_SCRYPT_N),
+            r=data.get("r", DEFAULT_SCRYPT_R),
+            p=data.get("p", DEFAULT_SCRYPT_P)
+        )
+
+    @classmethod
+    def from_json(cls, text: str | None) -> "KdfParams":
+        # Parametresi saklanmamis vault'lar 200k PBKDF2 ile olusturuldu
+        return cls.from_dict(json.loads(text)) if text else LEGACY_PARAMS
+
+    @classmethod
+    def from_config(cls, settings: dict) -> "KdfParams":
+        # config.json -> encryption.kdf
+        scrypt = settings.get("scrypt", {})
+        return cls(
+            algorithm=settings.get("type", PBKDF2),
+            iterations=settings.get("iterations", DEFAULT_PBKDF2_ITERATIONS),
+            n=scrypt.get("n", DEFAULT_SCRYPT_N),
+            r=scrypt.get("r", DEFAULT_SCRYPT_R),
+            p=scrypt.get("p", DEFAULT_SCRYPT_P)
+        )
+
+    # Cost
+    @property
+    def cost(self) -> int:
+        # Ayni algoritma icinde karsilastirma icin
+        return self.n * self.r * self.p if self.algorithm == SCRYPT else self.iterations
+
+    @property
+    def memory_bytes(self) -> int:
+        return 128 * self.n * self.r if self.algorithm == SCRYPT else 0
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, KdfParams) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        if self.algorithm == SCRYPT:
+            return f"KdfParams(scrypt n={self.n} r={self.r} p={self.p})"
+        return f"KdfParams(pbkdf2-sha256 iterations={self.iterations})"
+
+
+LEGACY_PARAMS = KdfParams(PBKDF2, iterations=200_000)
+
+
+def derive(password: str, salt: bytes, params: KdfParams) -> bytes:
+    if params.algorithm == SCRYPT:
+        kdf = Scrypt(salt=salt, length=KEY_LENGTH, n=params.n, r=params.r, p=params.p)
+    else:
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=KEY_LENGTH, salt=salt, iterations=params.iterations)
+    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+
+
+def needs_upgrade(stored: KdfParams, target: KdfParams) -> bool:
+    # Algoritma degistiyse veya ayni algoritmada hedef daha pahaliysa; dusurme yapilmaz
+    if stored.algorithm != target.algorithm:
+        return True
+    return target.cost > stored.cost
+
+
+# Calibration
+def _time_derive(params: KdfParams) -> float:
+    start = time.perf_counter()
+    derive("calibration", b"\0" * 16, params)
+    return time.perf_counter() - start
+
+
+def calibrate(algorithm: str = PBKDF2, target_ms: float = DEFAULT_TARGET_MS,
+              max_memory_mb: int = DEFAULT_MAX_MEMORY_MB) -> KdfParams:
+    algorithm = KdfParams(algorithm).algorithm
+    target = target_ms / 1000
+
+    if algorithm == SCRYPT:
+        # n iki katina cikinca sure de ~iki katina cikar; hedefe en yakin n (bellek sinirini asmadan)
+        params = KdfParams(SCRYPT, n=MIN_SCRYPT_N)
+        while True:
+            candidate = KdfParams(SCRYPT, n=params.n * 2, r=params.r, p=params.p)
+            if candidate.memory_bytes > max_memory_mb * 1024 * 1024:
+                return params
+            elapsed = _time_derive(params)
+            if elapsed * 2 - target > target - elapsed:
+                return params
+            params = candidate
+
+    # PBKDF2 suresi iterasyonla dogrusal: kisa bir olcumden olcekle
+    sample = KdfParams(PBKDF2, iterations=MIN_PBKDF2_ITERATIONS)
+    elapsed = min(_time_derive(sample) for _ in range(3))
+    iterations = int(MIN_PBKDF2_ITERATIONS * target / elapsed) if elapsed else MIN_PBKDF2_ITERATIONS
+    # Yuvarlak sayi, asagi dogru; tabanin altina inmez
+    iterations = max(MIN_PBKDF2_ITERATIONS, iterations // 10_000 * 10_000)
+    return KdfParams(PBKDF2, iterations=iterations)
+
+
+def target_params(settings: dict, storage=None) -> KdfParams:
+    # calibrate.enabled ise bu makine icin olculen parametreler, degilse config'teki sabitler
+    calibration = settings.get("calibrate", {})
+    if not calibration.get("enabled", False):
+        return KdfParams.from_config(settings)
+
+    algorithm = KdfParams(settings.get("type", PBKDF2)).algorithm
+    target_ms = calibration.get("target_ms", DEFAULT_TARGET_MS)
+    max_memory_mb = calibration.get("max_memory_mb", DEFAULT_MAX_MEMORY_MB)
+    key = {"host": platform.node(), "algorithm": algorithm, "target_ms": target_ms, "max_memory_mb": max_memory_mb}
+
+    if storage is not None:
+        cached = storage.get_meta(CALIBRATION_META_KEY)
+        if cached:
+            data = json.loads(cached)
+            if data.get("key") == key:
+                return KdfParams.from_dict(data["params"])
+
+    params = calibrate(algorithm, target_ms, max_memory_mb)
+    if storage is not None:
+        storage.set_meta(CALIBRATION_META_KEY, json.dumps({"key": key, "params": params.to_dict()}))
+        storage.commit()
+    return params
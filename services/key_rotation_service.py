@@ -0,0 +1,184 @@
+"""
+    Master key degisiminde hesaplari yeni key ile yeniden sifreler.
+
+    Yapar:
+        accounts tablosunu id sirasiyla batch batch okur
+        her batch'i worker process havuzunda decrypt/encrypt eder
+        batch'i executemany ile yazar
+        ilerlemeyi callback ile bildirir
+
+    Iki mod:
+        rotate: tek transaction, VaultController acar/kapatir
+        rotate_in_chunks: her batch kendi transaction'inda commit edilir,
+            ilerleme meta tablosunda checkpoint olarak tutulur,
+            yarida kalirsa ayni key'lerle tekrar cagrilinca kaldigi yerden devam eder
+            checkpoint iki key'i birbiriyle sarili tutar (yeni key eskiyle, eski key yeniyle):
+            yarim rotation'da hangi password girilirse girilsin iki key de yuklenebilir
+            (EncryptionService.accept_key); bitince checkpoint ile birlikte silinir
+            okunduktan sonra degisen satirin (kullanici duzenlemesi) ustune yazmaz
+
+    Yapmaz:
+        key turetme / master password kontrolu
+
+    Bellek kullanimi batch_size ile sinirlidir, tum vault hic bir anda RAM'de olmaz.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from cryptography.fernet import Fernet
+
+from services.encryption_service import EncryptionService
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _reencrypt_chunk(rows: list[tuple], old_key: bytes, new_key: bytes) -> list[tuple[str, int]]:
+    encrypted = EncryptionService.reencrypt_many([row[1] for row in rows], old_key, new_key)
+    return [(text, row[0]) for text, row in zip(encrypted, rows)]
+
+
+def _key_hash(key: bytes) -> str:
+    return hashlib.sha256(key).hexdigest()
+
+
+class KeyRotationService:
+
+    def __init__(self, storage_service, batch_size: int = DEFAULT_BATCH_SIZE, workers: int | None = None):
+        self.storage = storage_service
+        self.batch_size = batch_size
+        self.workers = workers or os.cpu_count() or 1
+
+    def rotate(self, old_key: bytes, new_key: bytes, progress=None) -> int:
+        total = self.storage.get_total_account_count()
+        pool = self._create_pool(total)
+
+        done = 0
+        last_id = 0
+        try:
+            while True:
+                rows = self.storage.get_encrypted_passwords_after(last_id, self.batch_size)
+                if not rows:
+                    break
+
+                updates = self._reencrypt_batch(pool, rows, old_key, new_key)
+                self.storage.update_encrypted_passwords(updates)
+
+                last_id = rows[-1][0]
+                done += len(rows)
+                if progress:
+                    progress(done, total)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        return done
+
+    def rotate_in_chunks(self, old_key: bytes, new_key: bytes, progress=None, finish_meta: dict | None = None,
+                         should_stop=None) -> int | None:
+        # finish_meta: yeni hash ile ayni transaction'da yazilacak meta (None deger = sil);
+        # checkpoint'e yazilir, devam eden cagri ayni meta ile bitirir.
+        # should_stop() True donerse batch arasinda durur ve None doner (checkpoint kalir)
+        checkpoint = self.start(old_key, new_key, finish_meta)
+        target = checkpoint["target_generation"]
+        total = checkpoint["done"] + self.storage.count_rows_for_rotation(target)
+        pool = self._create_pool(total - checkpoint["done"])
+
+        try:
+            while True:
+                if should_stop is not None and should_stop():
+                    return None
+                rows = self.storage.get_rows_for_rotation(target, checkpoint["last_id"], self.batch_size)
+                if not rows:
+                    break
+
+                updates = self._reencrypt_batch(pool, rows, old_key, new_key)
+
+                # Batch + checkpoint ayni kisa transaction'da: crash olursa en fazla bir batch kaybolur
+                self.storage.begin_transaction()
+                try:
+                    self.storage.update_rotated_passwords([
+                        (text, target, account_id, row[1])
+                        for (text, account_id), row in zip(updates, rows)
+                    ])
+                    checkpoint["last_id"] = rows[-1][0]
+                    checkpoint["done"] += len(rows)
+                    self.storage.save_key_rotation_checkpoint(checkpoint)
+                    self.storage.commit()
+                except Exception:
+                    self.storage.rollback()
+                    raise
+
+                if progress:
+                    progress(checkpoint["done"], total)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        self._finish_checkpoint(new_key, target, checkpoint.get("finish_meta"))
+        return checkpoint["done"]
+
+    def pending_checkpoint(self) -> dict | None:
+        return self.storage.get_key_rotation_checkpoint()
+
+    def check_resumable(self, new_key: bytes):
+        checkpoint = self.storage.get_key_rotation_checkpoint()
+        if checkpoint and checkpoint["new_key_hash"] != _key_hash(new_key):
+            raise ValueError("Yarım kalmış key rotation farklı bir key ile başlatılmış.")
+
+    def start(self, old_key: bytes, new_key: bytes, finish_meta: dict | None = None) -> dict:
+        # Checkpoint'i yazar (varsa aynen doner); satirlara dokunmaz
+        self.check_resumable(new_key)
+        checkpoint = self.storage.get_key_rotation_checkpoint()
+        if checkpoint:
+            return checkpoint
+
+        checkpoint = {
+            "target_generation": self.storage.get_key_generation() + 1,
+            "new_key_hash": _key_hash(new_key),
+            "wrapped_new_key": Fernet(old_key).encrypt(new_key).decode(),
+            "wrapped_old_key": Fernet(new_key).encrypt(old_key).decode(),
+            "finish_meta": finish_meta or {},
+            "last_id": 0,
+            "done": 0,
+        }
+        self.storage.begin_transaction()
+        self.storage.save_key_rotation_checkpoint(checkpoint)
+        self.storage.commit()
+        return checkpoint
+
+    def _finish_checkpoint(self, new_key: bytes, target: int, finish_meta: dict | None = None):
+        self.storage.begin_transaction()
+        try:
+            self.storage.update_master_key_hash(_key_hash(new_key))
+            self.storage.set_meta("key_generation", target)
+            for key, value in (finish_meta or {}).items():
+                if value is None:
+                    self.storage.delete_meta(key)
+                else:
+                    self.storage.set_meta(key, value)
+            self.storage.clear_key_rotation_checkpoint()
+            self.storage.commit()
+        except Exception:
+            self.storage.rollback()
+            raise
+
+    def _create_pool(self, total: int) -> ProcessPoolExecutor | None:
+        # Tek batch'lik vault icin process baslatma maliyetine girmiyoruz
+        if self.workers <= 1 or total <= self.batch_size:
+            return None
+        return ProcessPoolExecutor(max_workers=self.workers)
+
+    def _reencrypt_batch(self, pool, rows, old_key, new_key) -> list[tuple[str, int]]:
+        if pool is None:
+            return _reencrypt_chunk(rows, old_key, new_key)
+
+        chunk_size = max(1, -(-len(rows) // self.workers))
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        futures = [pool.submit(_reencrypt_chunk, chunk, old_key, new_key) for chunk in chunks]
+
+        updates = []
+        for future in futures:
+            updates.extend(future.result())
+        return updates
@@ -1,9 +1,61 @@
+"""
+    Audit log yazici.
+
+    Yapar:
+        Log kayitlarini bellekte biriktirir
+        arka plan thread'inde executemany + tek commit ile yazar
+            (flush_size kayda ulasinca veya flush_interval saniyede bir)
+        SECURITY seviyesindeki kayitlari beklemeden, senkron olarak diske indirir
+            (en fazla flush_timeout saniye bekler)
+        yazilamayan batch'i buffer'in basina geri koyar, flush_interval sonra tekrar dener
+        close() ile kalan her seyi yazip thread'i durdurur
+
+    Arka plan thread'i kendi SQLite connection'ini kullanir
+    (StorageService.open_connection, ayni PRAGMA profili).
+"""
+
+import threading
+
 from models.log import Log
 
+DEFAULT_FLUSH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 2.0
+DEFAULT_FLUSH_TIMEOUT = 5.0
+
+INSERT_LOG = """
+INSERT INTO logs (action, detail, level, created_at)
+VALUES (?, ?, ?, ?)
+"""
+
+
 class LogService:
 
-    def __init__(self, storage_service):
+    def __init__(
+        self,
+        storage_service,
+        buffered: bool = True,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_timeout: float = DEFAULT_FLUSH_TIMEOUT
+    ):
         self.storage = storage_service
+        self.buffered = buffered
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.flush_timeout = flush_timeout
+
+        self._buffer: list[tuple] = []
+        self._cond = threading.Condition()
+        self._enqueued = 0
+        self._written = 0
+        self._flush_requested = False
+        self._closed = False
+        self._error: Exception | None = None
+        self._thread: threading.Thread | None = None
+
+        # Olculer: kac commit ile kac kayit yazildi
+        self.commits = 0
+        self.records_written = 0
 
     def info(self, action: str, detail: str = ""):
         self._write(Log(id=None, level="INFO", action=action, message=detail))
@@ -16,10 +68,119 @@ class LogService:
 
     def security(self, action: str, detail: str = ""):
         self._write(Log(id=None, level="SECURITY", action=action, message=detail))
+        # Guvenlik olaylari buffer'da beklemez
+        self.flush()
 
     def _write(self, log: Log):
-        query = """
-        INSERT INTO logs (action, detail, level, created_at)
-        VALUES (?, ?, ?, ?)
-        """
-        self.storage.execute(query, log.to_db_params(), commit=True)
\ No newline at end of file
+        if not self.buffered:
+            self.storage.execute(INSERT_LOG, log.to_db_params(), commit=True)
+            self.commits += 1
+            self.records_written += 1
+            return
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("LogService is closed")
+            self._ensure_thread()
+            self._buffer.append(log.to_db_params())
+            self._enqueued += 1
+            if len(self._buffer) >= self.flush_size:
+                self._cond.notify_all()
+
+    def recent(self, level: str | None = None, since: str | None = None, limit: int = 100) -> list[Log]:
+        # Buffer'da bekleyenler de sonuca girsin
+        self.flush()
+        return self.storage.get_logs(level, since, limit)
+
+    def flush(self):
+        if not self.buffered:
+            return
+
+        with self._cond:
+            target = self._enqueued
+            if self._written >= target:
+                return
+            # Onceki bir denemenin hatasi bu flush'a ait degil; writer olduyse yeniden baslar
+            self._error = None
+            self._ensure_thread()
+            self._flush_requested = True
+            self._cond.notify_all()
+            done = self._cond.wait_for(
+                lambda: self._written >= target or self._error is not None,
+                timeout=self.flush_timeout
+            )
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            if not done:
+                raise TimeoutError(f"Log flush timed out after {self.flush_timeout}s")
+
+    def close(self):
+        if not self.buffered:
+            return
+
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join()
+
+    # Background writer
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        try:
+            conn = self.storage.open_connection()
+        except Exception as e:
+            # Buffer korunur; sonraki _write / flush thread'i yeniden baslatir
+            with self._cond:
+                self._error = e
+                self._thread = None
+                self._cond.notify_all()
+            return
+
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self._closed or self._flush_requested or len(self._buffer) >= self.flush_size,
+                        timeout=self.flush_interval
+                    )
+                    batch, self._buffer = self._buffer, []
+                    self._flush_requested = False
+                    closing = self._closed
+
+                failed = False
+                if batch:
+                    try:
+                        conn.executemany(INSERT_LOG, batch)
+                        conn.commit()
+                        self.commits += 1
+                        self.records_written += len(batch)
+                    except Exception as e:
+                        conn.rollback()
+                        failed = True
+                        # Batch atilmaz: sonra gelenlerin onune geri konur
+                        with self._cond:
+                            self._buffer[:0] = batch
+                            self._error = e
+
+                with self._cond:
+                    if not failed:
+                        self._written += len(batch)
+                    self._cond.notify_all()
+
+                    if closing:
+                        break
+                    if failed:
+                        # Hemen tekrar denenmez (dolu buffer'da busy loop olmasin)
+                        self._cond.wait_for(lambda: self._closed, timeout=self.flush_interval)
+        finally:
+            conn.close()
@@ -0,0 +1,153 @@
+"""
+    Numarali schema migration'lari (PRAGMA user_version ile).
+
+    Yapar:
+        veritabaninin versiyonunu PRAGMA user_version'dan okur
+        sadece bekleyen migration'lari sirayla, tek transaction icinde uygular
+        versiyon guncelse hicbir sey okumaz / calistirmaz (warm start)
+        varsayilan kategorileri tek executemany ile ekler
+
+    Migration fonksiyonu False donerse "simdilik uygulanamaz" demektir:
+    oncekiler commit edilir, versiyon orada kalir ve sonraki aciliste tekrar denenir.
+
+    Yeni migration: MIGRATIONS listesinin sonuna (versiyon, ad, fonksiyon) ekle.
+    Eski veritabanlari (user_version = 0, tablolar mevcut) icin de
+    calisacak sekilde idempotent yazilmali.
+"""
+
+import sqlite3
+import time
+from datetime import datetime
+
+from services.search_service import SEARCH_INDEX_VERSION
+
+DEFAULT_CATEGORIES = ["Social", "Work", "Finance", "Other", "Shopping", "Gaming"]
+
+# schema.sql kendi transaction'ini acip kapatir; runner'in transaction'inda atlanir
+SKIPPED_STATEMENTS = {"BEGIN TRANSACTION;", "BEGIN;", "COMMIT;"}
+
+
+def split_statements(script: str) -> list[str]:
+    # Trigger govdeleri (BEGIN ... END;) tek statement olarak kalir
+    statements, buffer = [], ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            buffer = ""
+            if statement.upper() not in SKIPPED_STATEMENTS:
+                statements.append(statement)
+    if buffer.strip():
+        raise ValueError("schema.sql yarim kalmis bir statement ile bitiyor")
+    return statements
+
+
+# Migrations
+def _create_schema(storage, schema_path: str):
+    with open(schema_path, "r") as f:
+        for statement in split_statements(f.read()):
+            storage.execute(statement)
+
+
+def _add_key_generation(storage, schema_path: str):
+    storage.ensure_column("accounts", "key_generation", "INTEGER NOT NULL DEFAULT 0", commit=False)
+
+
+def _seed_categories(storage, schema_path: str):
+    storage.execute("SELECT count(*) FROM categories")
+    if storage.fetchone()[0] == 0:
+        now = datetime.now().isoformat()
+        storage.executemany(
+            "INSERT INTO categories (name, created_at) VALUES (?, ?)",
+            [(name, now) for name in DEFAULT_CATEGORIES]
+        )
+
+
+def _build_search_index(storage, schema_path: str):
+    # accounts_fts sonradan eklendiyse mevcut hesaplar bir kez indexlenir
+    if storage.get_meta("search_index_version") != SEARCH_INDEX_VERSION:
+        storage.execute("INSERT INTO accounts_fts (accounts_fts) VALUES ('rebuild')")
+        storage.set_meta("search_index_version", SEARCH_INDEX_VERSION)
+
+
+def _unique_site_username(storage, schema_path: str):
+    # Duplicate varken UNIQUE kurulamaz: duz index ile devam, sonraki aciliste tekrar denenir
+    if storage.has_duplicate_accounts():
+        storage.execute("CREATE INDEX IF NOT EXISTS idx_accounts_site_username_dup ON accounts(site, username)")
+        return False
+
+    storage.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_accounts_site_username ON accounts(site, username)")
+    storage.execute("DROP INDEX IF EXISTS idx_accounts_site_username_dup")
+    return True
+
+
+MIGRATIONS = [
+    (1, "create schema", _create_schema),
+    (2, "accounts.key_generation", _add_key_generation),
+    (3, "seed default categories", _seed_categories),
+    (4, "build search index", _build_search_index),
+    (5, "unique (site, username)", _unique_site_username),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+class MigrationReport:
+
+    def __init__(self, from_version: int):
+        self.from_version = from_version
+        self.to_version = from_version
+        self.applied: list[str] = []
+        self.deferred: str | None = None
+        self.elapsed = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "from_version": self.from_version,
+            "to_version": self.to_version,
+            "applied": list(self.applied),
+            "deferred": self.deferred,
+            "elapsed": self.elapsed,
+        }
+
+
+class MigrationService:
+
+    def __init__(self, storage_service, schema_path: str, migrations: list | None = None):
+        self.storage = storage_service
+        self.schema_path = schema_path
+        self.migrations = migrations or MIGRATIONS
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1][0]
+
+    def pending(self, current: int) -> list:
+        return [migration for migration in self.migrations if migration[0] > current]
+
+    def migrate(self) -> MigrationReport:
+        start = time.perf_counter()
+        report = MigrationReport(self.storage.get_user_version())
+
+        pending = self.pending(report.from_version)
+        if not pending:
+            report.elapsed = time.perf_counter() - start
+            return report
+
+        self.storage.begin_transaction()
+        try:
+            for version, name, apply in pending:
+                if apply(self.storage, self.schema_path) is False:
+                    report.deferred = name
+                    break
+                report.applied.append(name)
+                report.to_version = version
+
+            if report.to_version != report.from_version:
+                self.storage.set_user_version(report.to_version)
+            self.storage.commit()
+        except Exception:
+            self.storage.rollback()
+            raise
+
+        report.elapsed = time.perf_counter() - start
+        return report
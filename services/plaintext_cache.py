@@ -0,0 +1,109 @@
+"""
+    Cozulmus sifreler icin kisa omurlu bellek cache'i (EncryptionService onunde).
+
+    Yapar:
+        (account_id, sha256(ciphertext)) -> plaintext tutar
+            (sifre degisince ciphertext de degisir, eski kayit kendiliginden kullanilmaz)
+        TTL dolan kayitlari okurken atar, max_entries asilinca LRU siler
+        plaintext'i bytearray'de tutar, silinen / temizlenen kaydin byte'larini sifirlar
+        hit / miss / eviction sayar
+
+    Yapmaz:
+        decrypt (EncryptionService.decrypt_cached cagirir)
+
+    Not: get() donen str Python tarafinda immutable bir kopyadir, sifirlanamaz;
+    cache'in garantisi sadece kendi tuttugu byte'lar icindir.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL_SECONDS = 30.0
+DEFAULT_MAX_ENTRIES = 64
+
+
+def _wipe(buffer: bytearray):
+    for i in range(len(buffer)):
+        buffer[i] = 0
+
+
+class PlaintextCache:
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[bytearray, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(account_id: int, cipher_text: str) -> tuple:
+        return account_id, hashlib.sha256(cipher_text.encode()).digest()
+
+    def get(self, account_id: int, cipher_text: str) -> str | None:
+        key = self._key(account_id, cipher_text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            buffer, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._drop(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return buffer.decode()
+
+    def put(self, account_id: int, cipher_text: str, plain_text: str):
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+
+        key = self._key(account_id, cipher_text)
+        with self._lock:
+            # Ayni hesabin eski ciphertext'e ait kaydi artik gecersiz
+            for stale in [k for k in self._entries if k[0] == account_id and k != key]:
+                self._drop(stale)
+            if key in self._entries:
+                self._drop(key)
+
+            self._entries[key] = (bytearray(plain_text.encode()), time.monotonic() + self.ttl_seconds)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, account_id: int):
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == account_id]:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            for buffer, _expires_at in self._entries.values():
+                _wipe(buffer)
+            self._entries.clear()
+
+    def _drop(self, key: tuple):
+        buffer, _expires_at = self._entries.pop(key)
+        _wipe(buffer)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,142 @@
+"""
+    Unlock sonrasi bellekte tutulan arama indexi (as-you-type arama icin).
+
+    Yapar:
+        site + username uzerinde trigram -> account id postings tutar
+        add / update / remove ile incremental guncellenir
+        sorgu bir oncekini iceriyorsa (kullanici yazmaya devam ediyorsa)
+        aramayi onceki sonuc kumesi uzerinden daraltir
+
+    Yapmaz:
+        SQL
+        decrypt
+
+    Thread-safe: SearchPipeline sorgulari arka plan thread'inde calistirir,
+    guncellemeler GUI thread'inden gelir.
+
+    Eslesme SearchService.global_search ile aynidir:
+        site veya username icinde case-insensitive substring.
+"""
+
+import threading
+
+from models.account import Account
+
+GRAM_SIZE = 3
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class SearchIndex:
+
+    def __init__(self):
+        self._accounts: dict[int, Account] = {}
+        self._texts: dict[int, tuple[str, str]] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._last_query: str | None = None
+        self._last_ids: list[int] = []
+        self._lock = threading.Lock()
+        self.is_built = False
+
+    # Build / clear
+    def build(self, accounts: list[Account]):
+        with self._lock:
+            self._reset()
+            for account in accounts:
+                self._insert(account)
+            self.is_built = True
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    # Incremental updates
+    def add(self, account: Account):
+        with self._lock:
+            self._insert(account)
+            self._forget_last()
+
+    def update(self, account: Account):
+        with self._lock:
+            self._delete(account.id)
+            self._insert(account)
+            self._forget_last()
+
+    def remove(self, account_id: int):
+        with self._lock:
+            self._delete(account_id)
+            self._forget_last()
+
+    # Query
+    def search(self, keyword: str) -> list[Account]:
+        with self._lock:
+            return self._search(keyword.lower())
+
+    def _search(self, query: str) -> list[Account]:
+        if not query:
+            return [self._accounts[i] for i in sorted(self._accounts)]
+
+        candidates = self._candidates(query)
+        ids = [
+            account_id for account_id in candidates
+            if query in self._texts[account_id][0] or query in self._texts[account_id][1]
+        ]
+
+        self._last_query = query
+        self._last_ids = ids
+        return [self._accounts[i] for i in ids]
+
+    def _candidates(self, query: str):
+        # Sorgu bir oncekini iceriyorsa sonuc onun alt kumesidir
+        if self._last_query is not None and self._last_query in query:
+            return self._last_ids
+
+        if len(query) < GRAM_SIZE:
+            return sorted(self._accounts)
+
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in _grams(query)),
+            key=len
+        )
+        matched = set(postings[0])
+        for posting in postings[1:]:
+            if not matched:
+                break
+            matched &= posting
+        return sorted(matched)
+
+    # Internal
+    def _reset(self):
+        self._accounts.clear()
+        self._texts.clear()
+        self._postings.clear()
+        self._forget_last()
+        self.is_built = False
+
+    def _insert(self, account: Account):
+        site = account.site.lower()
+        username = account.username.lower()
+        self._accounts[account.id] = account
+        self._texts[account.id] = (site, username)
+        for gram in _grams(site) | _grams(username):
+            self._postings.setdefault(gram, set()).add(account.id)
+
+    def _delete(self, account_id: int):
+        texts = self._texts.pop(account_id, None)
+        self._accounts.pop(account_id, None)
+        if texts is None:
+            return
+
+        for gram in _grams(texts[0]) | _grams(texts[1]):
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(account_id)
+            if not posting:
+                del self._postings[gram]
+
+    def _forget_last(self):
+        self._last_query = None
+        self._last_ids = []
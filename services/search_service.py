@@ -1,5 +1,5 @@
 """
-    
+
     Arama mantigi.
 
     Yapar:
@@ -7,73 +7,237 @@
         kategori + keyword
         case-insensitive arama
 
-    Avantaj:
-        Yarin fuzzy search eklersin, hicbir seyi bozmaz.
+    Index:
+        3+ karakterli aramalar accounts_fts (FTS5 trigram) uzerinden gider,
+        tablo taramasi yapmaz. Trigram 3 karakterden kisa sorgulari
+        desteklemedigi icin 1-2 karakterde LIKE'a duser.
+
+    Fuzzy:
+        fuzzy_search yazim hatalarini tolere eder. Aday satirlar once
+        accounts_fts'ten keyword'un trigram'larindan en az birini iceren
+        satirlar olarak cekilir (tum tablo puanlanmaz), sonra Python'da
+        puanlanip heap ile en iyi limit kadari dondurulur.
 
 """
 
-from models.account import Account
+import heapq
+
+from models.account import AccountView
+from utils.constants import DEFAULT_PAGE_SIZE
+from utils.instrumentation import instrumented
+
+MIN_INDEXED_KEYWORD = 3
+SEARCH_INDEX_VERSION = "1"
+FUZZY_CANDIDATES_PER_RESULT = 20
+MIN_FUZZY_CANDIDATES = 200
+
+
+def _bounded_substring_distance(query: str, text: str, max_distance: int) -> int | None:
+    # query ile text'in herhangi bir alt dizisi arasindaki en kucuk edit distance
+    # (Sellers); max_distance asilinca erken cikar
+    previous = [0] * (len(text) + 1)
+    for i, q_char in enumerate(query, start=1):
+        current = [i] + [0] * len(text)
+        for j, t_char in enumerate(text, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (q_char != t_char)
+            )
+        if min(current) > max_distance:
+            return None
+        previous = current
+
+    best = min(previous)
+    return best if best <= max_distance else None
+
+
+def _is_subsequence(query: str, text: str) -> bool:
+    chars = iter(text)
+    return all(char in chars for char in query)
+
+
+def fuzzy_score(query: str, text: str) -> float:
+    # 0 = eslesme yok; substring > edit distance > subsequence
+    if not query or not text:
+        return 0.0
+
+    position = text.find(query)
+    if position >= 0:
+        return 100.0 - min(position, 10) - min(len(text) - len(query), 10) * 0.5
+
+    max_distance = max(1, len(query) // 3)
+    distance = _bounded_substring_distance(query, text, max_distance)
+    if distance is not None:
+        return 70.0 * (1 - distance / (len(query) + 1))
+
+    if _is_subsequence(query, text):
+        return 30.0 * len(query) / len(text)
+
+    return 0.0
+
 
 class SearchService():
 
     def __init__(self, storage):
         self.storage = storage
 
-    def search_by_site(self, site_keyword: str) -> list[Account]:
-        
+    @staticmethod
+    def _limit(limit: int | None) -> int:
+        # SQLite'ta LIMIT -1 = sinirsiz
+        return -1 if limit is None else limit
+
+    @staticmethod
+    def _uses_index(keyword: str) -> bool:
+        return len(keyword) >= MIN_INDEXED_KEYWORD
+
+    @staticmethod
+    def _match(keyword: str, column: str | None = None) -> str:
+        # Keyword tek bir phrase olarak aranir, FTS5 operatorleri yorumlanmaz
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        return f"{column} : {phrase}" if column else phrase
+
+    def _fetch_accounts(self, query: str, params: tuple) -> list[AccountView]:
+        self.storage.execute(query, params)
+        # Satirlar DB'den geliyor: validate / timestamp parse yok
+        return AccountView.from_rows(self.storage.cursor.fetchall())
+
+    @instrumented("search.search_by_site")
+    def search_by_site(self, site_keyword: str) -> list[AccountView]:
+        if self._uses_index(site_keyword):
+            query = """
+                SELECT * FROM accounts
+                WHERE id IN (SELECT rowid FROM accounts_fts WHERE accounts_fts MATCH ?)
+                ORDER BY id
+            """
+            return self._fetch_accounts(query, (self._match(site_keyword, "site"),))
+
         query = """
             SELECT * FROM accounts
             WHERE site LIKE ?
         """
-        param = (f"%{site_keyword}%",)
+        return self._fetch_accounts(query, (f"%{site_keyword}%",))
+
+    @instrumented("search.search_by_username")
+    def search_by_username(self, username_keyword: str) -> list[AccountView]:
+        if self._uses_index(username_keyword):
+            query = """
+                SELECT * FROM accounts
+                WHERE id IN (SELECT rowid FROM accounts_fts WHERE accounts_fts MATCH ?)
+                ORDER BY id
+            """
+            return self._fetch_accounts(query, (self._match(username_keyword, "username"),))
 
-        self.storage.execute(query, param)
-        rows = self.storage.cursor.fetchall()
-
-        return [Account.from_row(row) for row in rows]
-
-    def search_by_username(self, username_keyword: str) -> list[Account]:
-        
         query = """
             SELECT * FROM accounts
             WHERE username LIKE ?
         """
-        param = (f"%{username_keyword}%",)
-
-        self.storage.execute(query, param)
-        rows = self.storage.cursor.fetchall()
-
-        return [Account.from_row(row) for row in rows]
-    
-    def search_in_category(self, category_id: int, keyword: str) -> list[Account]:
+        return self._fetch_accounts(query, (f"%{username_keyword}%",))
+
+    @instrumented("search.search_in_category")
+    def search_in_category(self, category_id: int, keyword: str, after_id: int = 0, limit: int | None = None) -> list[AccountView]:
+        # after_id / limit: keyset sayfalama (limit None = hepsi)
+        if self._uses_index(keyword):
+            query = """
+                SELECT * FROM accounts
+                WHERE category_id = ?
+                AND id IN (SELECT rowid FROM accounts_fts WHERE accounts_fts MATCH ?)
+                AND id > ?
+                ORDER BY id
+                LIMIT ?
+            """
+            return self._fetch_accounts(query, (category_id, self._match(keyword), after_id, self._limit(limit)))
 
         query = """
             SELECT * FROM accounts
             WHERE category_id = ?
             AND (site LIKE ? OR username LIKE ?)
+            AND id > ?
+            ORDER BY id
+            LIMIT ?
         """
 
         params = (
             category_id,
             f"%{keyword}%",
-            f"%{keyword}%"
+            f"%{keyword}%",
+            after_id,
+            self._limit(limit)
         )
+        return self._fetch_accounts(query, params)
+
+    @instrumented("search.global_search")
+    def global_search(self, keyword: str, after_id: int = 0, limit: int | None = None) -> list[AccountView]:
+        if self._uses_index(keyword):
+            query = """
+                SELECT * FROM accounts
+                WHERE id IN (SELECT rowid FROM accounts_fts WHERE accounts_fts MATCH ?)
+                AND id > ?
+                ORDER BY id
+                LIMIT ?
+            """
+            return self._fetch_accounts(query, (self._match(keyword), after_id, self._limit(limit)))
 
-        self.storage.execute(query, params)
-        rows = self.storage.cursor.fetchall()
-
-        return [Account.from_row(row) for row in rows]
-
-    def global_search(self, keyword: str) -> list[Account]:
         query = """
             SELECT * FROM accounts
-            WHERE site LIKE ?
-            OR username LIKE ?
+            WHERE (site LIKE ? OR username LIKE ?)
+            AND id > ?
+            ORDER BY id
+            LIMIT ?
         """
 
-        param = (f"%{keyword}%", f"%{keyword}%")
-
-        self.storage.execute(query, param)
-        rows = self.storage.cursor.fetchall()
-
-        return [Account.from_row(row) for row in rows]
+        param = (f"%{keyword}%", f"%{keyword}%", after_id, self._limit(limit))
+        return self._fetch_accounts(query, param)
+
+    def iter_search(self, keyword: str, category_id: int | None = None, batch_size: int = DEFAULT_PAGE_SIZE):
+        # Sonuclari sayfa sayfa uretir, tum sonuc kumesi bellege alinmaz
+        after_id = 0
+        while True:
+            if category_id is None:
+                page = self.global_search(keyword, after_id, batch_size)
+            else:
+                page = self.search_in_category(category_id, keyword, after_id, batch_size)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after_id = page[-1].id
+
+    @instrumented("search.fuzzy_search")
+    def fuzzy_search(self, keyword: str, limit: int = 20) -> list[AccountView]:
+        query = keyword.strip().lower()
+        if not query:
+            return []
+
+        candidates = self._fuzzy_candidates(query, max(limit * FUZZY_CANDIDATES_PER_RESULT, MIN_FUZZY_CANDIDATES))
+
+        scored = []
+        for account in candidates:
+            score = max(
+                fuzzy_score(query, account.site.lower()),
+                fuzzy_score(query, account.username.lower())
+            )
+            if score > 0:
+                scored.append((score, -account.id, account))
+
+        return [item[2] for item in heapq.nlargest(limit, scored, key=lambda item: (item[0], item[1]))]
+
+    def _fuzzy_candidates(self, query: str, max_candidates: int) -> list[AccountView]:
+        if not self._uses_index(query):
+            sql = """
+                SELECT * FROM accounts
+                WHERE site LIKE ? OR username LIKE ?
+                LIMIT ?
+            """
+            return self._fetch_accounts(sql, (f"%{query}%", f"%{query}%", max_candidates))
+
+        # Trigram'lardan herhangi birini iceren satirlar, cok trigram paylasanlar once (bm25)
+        grams = {query[i:i + MIN_INDEXED_KEYWORD] for i in range(len(query) - MIN_INDEXED_KEYWORD + 1)}
+        match = " OR ".join(self._match(gram) for gram in sorted(grams))
+        sql = """
+            SELECT a.* FROM accounts_fts
+            JOIN accounts a ON a.id = accounts_fts.rowid
+            WHERE accounts_fts MATCH ?
+            ORDER BY accounts_fts.rank
+            LIMIT ?
+        """
+        return self._fetch_accounts(sql, (match, max_candidates))
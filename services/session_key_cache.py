@@ -0,0 +1,172 @@
+"""
+    Auto-lock sonrasi hizli unlock icin oturum key cache'i.
+
+    Yapar:
+        login'de master password'den ucuz bir dogrulayici tutar
+            (HMAC-SHA256, process icinde rastgele secret ile; diske yazilmaz)
+        dogrulayiciyi o an yuklu key'e baglar: master key degistiyse (password degisimi,
+            rotation, KDF yukseltmesi) auto-lock'ta key tutulmaz, eski password hizli yoldan acamaz
+        auto-lock aninda turetilmis key'i process icinde rastgele uretilen
+            gecici bir key ile sarar (Fernet), duz key bellekte kalmaz
+        pencere (window_seconds) icinde dogru password ile key'i KDF calistirmadan geri verir
+        sure dolunca, max_attempts yanlis denemede, logout / shutdown'da
+            tum byte'lari sifirlayip birakir
+
+    Yapmaz:
+        master hash kontrolu (EncryptionService.accept_key)
+        zamanlayici (sure kontrolu her cagrida yapilir; expire() disaridan tetiklenebilir)
+
+    Not: yanlis password ile hizli yol basarisiz olunca login tam KDF yoluna duser,
+    yani dogrulayici brute-force'u ucuzlatmaz. Fernet / HMAC'e verilen bytes kopyalari
+    immutable'dir, sifirlanamaz; garanti sadece cache'in tuttugu byte'lar icindir.
+"""
+
+import hashlib
+import hmac
+import os
+import threading
+import time
+
+from cryptography.fernet import Fernet, InvalidToken
+
+DEFAULT_WINDOW_SECONDS = 900
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _wipe(buffer: bytearray | None):
+    if buffer is not None:
+        for i in range(len(buffer)):
+            buffer[i] = 0
+
+
+class SessionKeyCache:
+
+    def __init__(self, window_seconds: float = DEFAULT_WINDOW_SECONDS, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.window_seconds = window_seconds
+        self.max_attempts = max_attempts
+
+        self._secret: bytearray | None = None
+        self._verifier: bytearray | None = None
+        self._key_digest: bytearray | None = None
+        self._wrapping_key: bytearray | None = None
+        self._wrapped_key: bytearray | None = None
+        self._expires_at = 0.0
+        self._attempts = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_seconds > 0
+
+    def _digest(self, password: str) -> bytes:
+        return hmac.new(bytes(self._secret), password.encode(), hashlib.sha256).digest()
+
+    def _key_mac(self, key: bytes) -> bytes:
+        return hmac.new(bytes(self._secret), key, hashlib.sha256).digest()
+
+    # Session lifecycle
+    def arm(self, password: str, key: bytes):
+        # Basarili tam login (veya key degisimi): onceki oturum silinir, password + key icin
+        # yeni dogrulayici kurulur
+        with self._lock:
+            self._clear()
+            if not self.enabled or not key:
+                return
+            self._secret = bytearray(os.urandom(32))
+            self._verifier = bytearray(self._digest(password))
+            self._key_digest = bytearray(self._key_mac(key))
+
+    def hold(self, key: bytes) -> bool:
+        # Auto-lock: key sarilip pencere baslar. Arm'dan sonra key degistiyse dogrulayici
+        # artik bu key'in password'unu temsil etmez: oturum silinir, tam KDF yoluna dusulur
+        with self._lock:
+            if not self.enabled or self._verifier is None or not key:
+                self._clear()
+                return False
+            if not hmac.compare_digest(self._key_mac(key), bytes(self._key_digest)):
+                self._clear()
+                return False
+            wrapping_key = Fernet.generate_key()
+            self._wrapping_key = bytearray(wrapping_key)
+            self._wrapped_key = bytearray(Fernet(wrapping_key).encrypt(key))
+            self._expires_at = time.monotonic() + self.window_seconds
+            self._attempts = 0
+            return True
+
+    def unlock(self, password: str) -> bytes | None:
+        with self._lock:
+            if self._wrapped_key is None:
+                self.misses += 1
+                return None
+            if time.monotonic() >= self._expires_at:
+                self._clear()
+                self.misses += 1
+                return None
+
+            if not hmac.compare_digest(self._digest(password), bytes(self._verifier)):
+                self._attempts += 1
+                if self._attempts >= self.max_attempts:
+                    self._clear()
+                self.misses += 1
+                return None
+
+            try:
+                key = Fernet(bytes(self._wrapping_key)).decrypt(bytes(self._wrapped_key))
+            except InvalidToken:
+                self._clear()
+                self.misses += 1
+                return None
+
+            # Key tekrar vault'ta; sarili kopya birakilir, dogrulayici sonraki auto-lock icin kalir
+            self._drop_wrapped()
+            self.hits += 1
+            return key
+
+    def expire(self) -> bool:
+        # Pencere dolduysa temizler; zamanlayicidan cagrilir
+        with self._lock:
+            if self._wrapped_key is not None and time.monotonic() >= self._expires_at:
+                self._clear()
+                return True
+            return False
+
+    def wipe(self):
+        with self._lock:
+            self._clear()
+
+    @property
+    def holding(self) -> bool:
+        return self._wrapped_key is not None
+
+    def seconds_left(self) -> float:
+        if self._wrapped_key is None:
+            return 0.0
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def _drop_wrapped(self):
+        _wipe(self._wrapping_key)
+        _wipe(self._wrapped_key)
+        self._wrapping_key = None
+        self._wrapped_key = None
+        self._expires_at = 0.0
+        self._attempts = 0
+
+    def _clear(self):
+        self._drop_wrapped()
+        _wipe(self._secret)
+        _wipe(self._verifier)
+        _wipe(self._key_digest)
+        self._secret = None
+        self._verifier = None
+        self._key_digest = None
+
+    def stats(self) -> dict:
+        return {
+            "holding": self.holding,
+            "seconds_left": self.seconds_left(),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
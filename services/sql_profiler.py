@@ -0,0 +1,262 @@
+"""
+    StorageService.execute / executemany icin SQL profiler'i.
+
+    Yapar:
+        her statement'i normalize eder (literal'ler -> ?, IN (?, ?, ...) -> IN (?...),
+            bosluk / yorum temizligi), ayni sorgu sekli tek satirda toplanir
+        statement basina cagri sayisi, toplam / max sure ve satir sayisi tutar
+            (sure = execute + sonrasindaki fetch'ler; SQLite satirlari fetch'te uretir)
+        esigi asan statement'lari EXPLAIN QUERY PLAN ciktisi ile
+            slow-query log'a (JSON satirlari) yazar
+        config.json -> database.profiler ile calisirken acilip kapatilabilir
+
+    Yapmaz:
+        parametre degerlerini loglamak (ciphertext / kullanici verisi iceriyor)
+        conn.execute ile dogrudan calisan sorgulari (export / import cursor'lari)
+
+    Bir statement'in fetch'leri bir sonraki statement baslayana kadar surebilir;
+    bu yuzden statement sonraki begin()'de veya finish()'te kapatilir.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_SLOW_QUERY_MS = 50.0
+MAX_STATEMENTS = 1000
+# Normalize sonucu sorgu metnine gore cache'lenir (sorgular cogunlukla sabit string)
+MAX_NORMALIZE_CACHE = 2048
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(query: str) -> str:
+    text = _COMMENT.sub(" ", query)
+    text = _STRING.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _IN_LIST.sub("(?...)", text)
+    return _SPACE.sub(" ", text).strip()
+
+
+class StatementStats:
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.slow = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "sql": self.sql,
+            "calls": self.calls,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.calls * 1000 if self.calls else 0.0,
+            "max_ms": self.max * 1000,
+            "rows": self.rows,
+            "slow": self.slow,
+        }
+
+
+class _OpenStatement:
+    __slots__ = ("conn", "query", "params", "sql", "elapsed", "rows")
+
+    def __init__(self, conn, query: str, params, sql: str):
+        self.conn = conn
+        self.query = query
+        self.params = params
+        self.sql = sql
+        self.elapsed = 0.0
+        self.rows = 0
+
+
+class SqlProfiler:
+
+    def __init__(
+        self,
+        slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+        slow_log_path: str | None = None,
+        explain: bool = True,
+        max_statements: int = MAX_STATEMENTS
+    ):
+        self.slow_query_ms = slow_query_ms
+        self.slow_log_path = slow_log_path
+        self.explain = explain
+        self.max_statements = max_statements
+
+        self._statements: dict[str, StatementStats] = {}
+        self._normalized: dict[str, str] = {}
+        self._open: _OpenStatement | None = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    @classmethod
+    def from_config(cls, settings: dict, default_log_path: str) -> "SqlProfiler | None":
+        # config.json -> database.profiler; kapaliysa None
+        if not settings.get("enabled", False):
+            return None
+        profiler = cls()
+        profiler.configure(settings, default_log_path)
+        return profiler
+
+    def configure(self, settings: dict, default_log_path: str):
+        # Toplanan istatistikler korunur, sadece esik / log ayarlari degisir
+        self.slow_query_ms = float(settings.get("slow_query_ms", DEFAULT_SLOW_QUERY_MS))
+        self.explain = bool(settings.get("explain", True))
+        self.slow_log_path = settings.get("log_file") or default_log_path
+
+    # StorageService hooks
+    def begin(self, conn: sqlite3.Connection, query: str, params):
+        self.finish()
+        sql = self._normalized.get(query)
+        if sql is None:
+            if len(self._normalized) >= MAX_NORMALIZE_CACHE:
+                self._normalized.clear()
+            sql = self._normalized[query] = normalize(query)
+        self._open = _OpenStatement(conn, query, params, sql)
+
+    def executed(self, elapsed: float, rowcount: int):
+        statement = self._open
+        if statement is not None:
+            statement.elapsed += elapsed
+            # DML: etkilenen satir; SELECT'te rowcount -1, satirlar fetch'te sayilir
+            statement.rows += max(rowcount, 0)
+
+    def fetched(self, rows: int, elapsed: float):
+        statement = self._open
+        if statement is not None:
+            statement.elapsed += elapsed
+            statement.rows += rows
+
+    def finish(self):
+        statement, self._open = self._open, None
+        if statement is None:
+            return
+
+        slow = statement.elapsed * 1000 >= self.slow_query_ms
+        with self._lock:
+            stats = self._statements.get(statement.sql)
+            if stats is None and len(self._statements) < self.max_statements:
+                stats = self._statements[statement.sql] = StatementStats(statement.sql)
+            if stats is None:
+                self.dropped += 1
+            else:
+                stats.calls += 1
+                stats.total += statement.elapsed
+                stats.max = max(stats.max, statement.elapsed)
+                stats.rows += statement.rows
+                stats.slow += slow
+
+        if slow:
+            self._log_slow(statement)
+
+    # Slow-query log
+    def _log_slow(self, statement: _OpenStatement):
+        if not self.slow_log_path:
+            return
+        entry = {
+            "at": datetime.now().isoformat(),
+            "ms": round(statement.elapsed * 1000, 3),
+            "rows": statement.rows,
+            "sql": statement.sql,
+            "plan": self._explain(statement) if self.explain else None,
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.slow_log_path)), exist_ok=True)
+            with open(self.slow_log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError:
+            # Profiler log'u yazamadi diye uygulama sorgusu bozulmasin
+            pass
+
+    @staticmethod
+    def _explain(statement: _OpenStatement) -> list[str]:
+        # executemany'de parametre seti yok, plan alinmaz
+        if statement.params is None:
+            return []
+        try:
+            rows = statement.conn.execute(f"EXPLAIN QUERY PLAN {statement.query}", statement.params).fetchall()
+        except sqlite3.Error as e:
+            return [f"EXPLAIN basarisiz: {e}"]
+        return [row[3] for row in rows]
+
+    # Reporting
+    def statements(self) -> list[dict]:
+        with self._lock:
+            rows = [stats.to_dict() for stats in self._statements.values()]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def format_report(self, limit: int = 15) -> str:
+        rows = self.statements()[:limit]
+        if not rows:
+            return "Kayitli statement yok."
+        lines = [f"{'calls':>7} {'total':>10} {'max':>9} {'rows':>8} {'slow':>5}  sql"]
+        for row in rows:
+            sql = row["sql"] if len(row["sql"]) <= 90 else row["sql"][:87] + "..."
+            lines.append(
+                f"{row['calls']:>7} {row['total_ms']:>8.1f}ms {row['max_ms']:>7.2f}ms "
+                f"{row['rows']:>8} {row['slow']:>5}  {sql}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> str:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "created_at": datetime.now().isoformat(),
+                "slow_query_ms": self.slow_query_ms,
+                "dropped": self.dropped,
+                "statements": self.statements(),
+            }, f, indent=2)
+        return path
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+            self.dropped = 0
+
+
+class ProfiledCursor:
+    # sqlite3.Cursor'u sarar; fetch sureleri ve satir sayilari acik statement'a yazilir
+
+    def __init__(self, cursor: sqlite3.Cursor, profiler: SqlProfiler):
+        self._cursor = cursor
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._profiler.fetched(row is not None, time.perf_counter() - start)
+        return row
+
+    def fetchmany(self, size: int | None = None):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(size) if size is not None else self._cursor.fetchmany()
+        self._profiler.fetched(len(rows), time.perf_counter() - start)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._profiler.fetched(len(rows), time.perf_counter() - start)
+        return rows
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
@@ -1,44 +1,138 @@
+import json
 import sqlite3
+import time
 from pathlib import Path
 from datetime import datetime
 
-from models.account import Account
+from models.account import Account, AccountView
+from models.log import Log
+from services.sql_profiler import SqlProfiler, ProfiledCursor
+from utils.constants import DEFAULT_PAGE_SIZE
+from utils.instrumentation import instrumented
+
+# config.json -> database.profiles icinde izin verilen PRAGMA'lar
+ALLOWED_PRAGMAS = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+    "cache_size": int,
+    "mmap_size": int,
+    "busy_timeout": int,
+    "foreign_keys": bool,
+}
+
+# Yazilan her satir meta'daki guncel key generation ile isaretlenir: rotation'in gectigi
+# bir satir duzenlenince eski generation'a doner ve bir sonraki rotation'da tekrar islenir
+CURRENT_KEY_GENERATION = "COALESCE((SELECT CAST(value AS INTEGER) FROM meta WHERE key = 'key_generation'), 0)"
+
+# Export / restore edilen tablolar ve kolon sirasi (logs bilincli olarak disarida)
+EXPORT_TABLES = {
+    "meta": ("key", "value"),
+    "categories": ("id", "name", "icon", "created_at"),
+    "accounts": (
+        "id", "site", "username", "encrypted_password", "category_id",
+        "created_at", "updated_at", "key_generation"
+    ),
+}
+
 
 class StorageService:
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, pragmas: dict | None = None):
         self.db_path = Path(db_path)
+        self.pragmas = pragmas or {}
         self.conn: sqlite3.Connection | None = None
-        self.cursor: sqlite3.Cursor | None = None
+        self.cursor: sqlite3.Cursor | ProfiledCursor | None = None
+        # None = profiler kapali, execute'ta tek bir kontrol
+        self.profiler: SqlProfiler | None = None
 
     def connect(self):
         if not self.conn:
-            self.conn = sqlite3.connect(self.db_path)
-            self.cursor = self.conn.cursor()
+            self.conn = self.open_connection()
+            self.cursor = self._new_cursor()
+
+    def _new_cursor(self) -> sqlite3.Cursor | ProfiledCursor:
+        cursor = self.conn.cursor()
+        return ProfiledCursor(cursor, self.profiler) if self.profiler else cursor
+
+    def set_profiler(self, profiler: SqlProfiler | None):
+        # Calisirken acilip kapatilabilir (config.json -> database.profiler)
+        if self.profiler is not None:
+            self.profiler.finish()
+        self.profiler = profiler
+        if self.conn:
+            self.cursor = self._new_cursor()
+
+    def open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        self._apply_pragmas(conn)
+        return conn
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        for name, value in self.pragmas.items():
+            allowed = ALLOWED_PRAGMAS.get(name)
+            if allowed is None:
+                raise ValueError(f"Desteklenmeyen PRAGMA: {name}")
+
+            if allowed is bool:
+                value = "ON" if value else "OFF"
+            elif allowed is int:
+                value = int(value)
+            elif str(value).upper() not in allowed:
+                raise ValueError(f"Geçersiz PRAGMA değeri: {name}={value}")
+
+            conn.execute(f"PRAGMA {name} = {value}")
     
     def close(self):
+        if self.profiler is not None:
+            self.profiler.finish()
         if self.conn:
             self.conn.close()
             self.conn = None
             self.cursor = None
 
+    @instrumented("storage.execute")
     def execute(self, query, params=(), commit=False):
         try:
-            self.cursor.execute(query, params)
+            if self.profiler is None:
+                self.cursor.execute(query, params)
+            else:
+                self._profiled(self.cursor.execute, query, params, params)
+            if commit:
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    @instrumented("storage.executemany")
+    def executemany(self, query, seq_of_params, commit=False):
+        try:
+            if self.profiler is None:
+                self.cursor.executemany(query, seq_of_params)
+            else:
+                self._profiled(self.cursor.executemany, query, seq_of_params, None)
             if commit:
                 self.conn.commit()
         except Exception:
             self.conn.rollback()
             raise
 
+    def _profiled(self, run, query, params, plan_params):
+        self.profiler.begin(self.conn, query, plan_params)
+        start = time.perf_counter()
+        try:
+            run(query, params)
+        finally:
+            self.profiler.executed(time.perf_counter() - start, self.cursor.rowcount)
+
     def save_account(self, new_account: Account) -> int:
         try:
             self.begin_transaction()
 
-            query = """
+            query = f"""
                 INSERT INTO accounts
-                (site, username, encrypted_password, category_id, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (site, username, encrypted_password, category_id, created_at, updated_at, key_generation)
+                VALUES (?, ?, ?, ?, ?, ?, {CURRENT_KEY_GENERATION})
             """
             # Nesnenin kendi propertylerini kullanıyoruz
             self.execute(query, new_account.to_db_params())
@@ -64,12 +158,11 @@ class StorageService:
             self.commit()
             raise
 
-    def get_all_accounts(self) -> list[Account]:
+    def get_all_accounts(self) -> list[AccountView]:
         self.execute("SELECT * FROM accounts")
-        rows = self.cursor.fetchall()
-        return [Account.from_row(row) for row in rows]
+        return AccountView.from_rows(self.cursor.fetchall())
         
-    def get_account_by_id(self, account_id: int) -> Account | None:
+    def get_account_by_id(self, account_id: int) -> AccountView | None:
         try:
             query = "SELECT * FROM accounts WHERE id = ?"
             self.execute(query, (account_id,))
@@ -78,7 +171,7 @@ class StorageService:
             if row is None:
                 return None
 
-            return Account.from_row(row)
+            return AccountView(row)
 
         except Exception as e:
             self.log(
@@ -115,9 +208,10 @@ class StorageService:
         try:
             self.begin_transaction()
 
-            query = """
+            query = f"""
             UPDATE accounts
-            SET site = ?, username = ?, encrypted_password = ?, category_id = ?, updated_at = ?
+            SET site = ?, username = ?, encrypted_password = ?, category_id = ?, updated_at = ?,
+                key_generation = {CURRENT_KEY_GENERATION}
             WHERE id = ?
             """
             params = (
@@ -144,10 +238,57 @@ class StorageService:
             self.commit()
             raise
 
-    def get_accounts_by_category_id(self, category_id: int) -> list[Account]:
+    def get_accounts_by_category_id(self, category_id: int) -> list[AccountView]:
         self.execute("SELECT * FROM accounts WHERE category_id = ?", (category_id,))
-        rows = self.cursor.fetchall()
-        return [Account.from_row(row) for row in rows]
+        return AccountView.from_rows(self.cursor.fetchall())
+
+    def account_exists(self, site: str, username: str, exclude_id: int | None = None) -> bool:
+        self.execute(
+            "SELECT 1 FROM accounts WHERE site = ? AND username = ? AND id != ? LIMIT 1",
+            (site, username, exclude_id or 0)
+        )
+        return self.cursor.fetchone() is not None
+
+    # Keyset pagination (OFFSET yok: her sayfa son gorulen anahtardan devam eder)
+    def get_accounts_page(self, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE, category_id: int | None = None) -> list[AccountView]:
+        if category_id is None:
+            query = "SELECT * FROM accounts WHERE id > ? ORDER BY id LIMIT ?"
+            params = (after_id, limit)
+        else:
+            query = "SELECT * FROM accounts WHERE category_id = ? AND id > ? ORDER BY id LIMIT ?"
+            params = (category_id, after_id, limit)
+        self.execute(query, params)
+        return AccountView.from_rows(self.cursor.fetchall())
+
+    def get_accounts_page_by_site(
+        self,
+        after_site: str | None = None,
+        after_id: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        category_id: int | None = None
+    ) -> list[AccountView]:
+        # Ayni site'tan birden fazla hesap olabilir: anahtar (site, id)
+        conditions, params = [], []
+        if after_site is not None:
+            conditions.append("(site, id) > (?, ?)")
+            params += [after_site, after_id]
+        if category_id is not None:
+            conditions.append("category_id = ?")
+            params.append(category_id)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        self.execute(f"SELECT * FROM accounts {where} ORDER BY site, id LIMIT ?", (*params, limit))
+        return AccountView.from_rows(self.cursor.fetchall())
+
+    def iter_accounts(self, category_id: int | None = None, batch_size: int = DEFAULT_PAGE_SIZE):
+        # Sayfa sayfa okur; arada baska sorgu calissa da cursor bozulmaz
+        after_id = 0
+        while True:
+            page = self.get_accounts_page(after_id, batch_size, category_id)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after_id = page[-1].id
 
     def get_categories_with_stats(self) -> list[tuple]:
         query = """
@@ -172,6 +313,124 @@ class StorageService:
         """
         self.execute(query, (encrypted, account_id))
 
+    def get_encrypted_passwords_after(self, after_id: int, limit: int) -> list[tuple]:
+        query = """
+        SELECT id, encrypted_password FROM accounts
+        WHERE id > ?
+        ORDER BY id
+        LIMIT ?
+        """
+        self.execute(query, (after_id, limit))
+        return self.cursor.fetchall()
+
+    def update_encrypted_passwords(self, updates: list[tuple[str, int]]):
+        # updates: (encrypted, account_id) ciftleri
+        query = """
+        UPDATE accounts
+        SET encrypted_password = ?, updated_at = datetime('now')
+        WHERE id = ?
+        """
+        self.executemany(query, updates)
+
+    # Bulk import
+    def iter_account_keys(self):
+        # (site, username) ciftleri; duplicate kontrolu icin, tum satiri cekmeden
+        cursor = self.conn.execute("SELECT site, username FROM accounts")
+        yield from cursor
+
+    def get_category_ids(self) -> dict[str, int]:
+        self.execute("SELECT id, name FROM categories")
+        return {name: category_id for category_id, name in self.cursor.fetchall()}
+
+    def create_category(self, name: str) -> int:
+        self.execute(
+            "INSERT INTO categories (name, created_at) VALUES (?, ?)",
+            (name, datetime.now().isoformat())
+        )
+        return self.cursor.lastrowid
+
+    def insert_accounts(self, rows: list[tuple]):
+        # rows: Account.to_db_params() ile ayni sira
+        query = f"""
+            INSERT INTO accounts
+            (site, username, encrypted_password, category_id, created_at, updated_at, key_generation)
+            VALUES (?, ?, ?, ?, ?, ?, {CURRENT_KEY_GENERATION})
+        """
+        self.executemany(query, rows)
+
+    # Export / restore
+    def iter_export_rows(self, table: str):
+        # Satirlar cursor'dan tek tek gelir, tablo bellege alinmaz
+        columns = EXPORT_TABLES[table]
+        cursor = self.conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY rowid")
+        yield from cursor
+
+    def insert_export_rows(self, table: str, rows: list):
+        columns = EXPORT_TABLES[table]
+        placeholders = ", ".join("?" for _ in columns)
+        self.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            rows
+        )
+
+    def clear_categories(self):
+        # Restore hedefi: migration'in ekledigi varsayilan kategoriler yerine arsivdekiler yazilir
+        self.execute("DELETE FROM categories")
+
+    def pause_search_index_sync(self) -> str | None:
+        # Toplu insert'te satir basina FTS trigger'i yerine sonda tek rebuild
+        self.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'accounts_fts_insert'")
+        row = self.cursor.fetchone()
+        if row is None:
+            return None
+        self.execute("DROP TRIGGER accounts_fts_insert")
+        return row[0]
+
+    def resume_search_index_sync(self, trigger_sql: str | None):
+        if trigger_sql is None:
+            return
+        self.execute(trigger_sql)
+        self.execute("INSERT INTO accounts_fts (accounts_fts) VALUES ('rebuild')")
+
+    # Resumable key rotation
+    def get_rows_for_rotation(self, target_generation: int, after_id: int, limit: int) -> list[tuple]:
+        query = """
+        SELECT id, encrypted_password FROM accounts
+        WHERE id > ? AND key_generation < ?
+        ORDER BY id
+        LIMIT ?
+        """
+        self.execute(query, (after_id, target_generation, limit))
+        return self.cursor.fetchall()
+
+    def count_rows_for_rotation(self, target_generation: int) -> int:
+        self.execute("SELECT COUNT(*) FROM accounts WHERE key_generation < ?", (target_generation,))
+        return self.cursor.fetchone()[0]
+
+    def update_rotated_passwords(self, updates: list[tuple[str, int, int, str]]):
+        # updates: (encrypted, key_generation, account_id, okunan encrypted)
+        # Okunduktan sonra degisen satirin (kullanici duzenlemesi) ustune yazilmaz
+        query = """
+        UPDATE accounts
+        SET encrypted_password = ?, key_generation = ?, updated_at = datetime('now')
+        WHERE id = ? AND encrypted_password = ?
+        """
+        self.executemany(query, updates)
+
+    def get_key_generation(self) -> int:
+        value = self.get_meta("key_generation")
+        return int(value) if value is not None else 0
+
+    def get_key_rotation_checkpoint(self) -> dict | None:
+        value = self.get_meta("key_rotation_checkpoint")
+        return json.loads(value) if value else None
+
+    def save_key_rotation_checkpoint(self, checkpoint: dict):
+        self.set_meta("key_rotation_checkpoint", json.dumps(checkpoint))
+
+    def clear_key_rotation_checkpoint(self):
+        self.delete_meta("key_rotation_checkpoint")
+
     def update_master_key_hash(self, new_key: str):
         query = """
         INSERT OR REPLACE INTO meta (key, value)
@@ -192,19 +451,75 @@ class StorageService:
         self.execute("SELECT 1 FROM meta WHERE key = 'master_key_hash'")
         return self.cursor.fetchone() is not None
 
-    def save_master_key_meta(self, salt: str, key_hash: str):
+    def save_master_key_meta(self, salt: str, key_hash: str, kdf: str):
+        # Salt, hash ve KDF parametreleri birlikte yazilir; biri digerisiz okunmaz
         self.begin_transaction()
         self.execute(
-            "INSERT OR REPLACE INTO meta (key, value) VALUES ('master_key_salt', ?), ('master_key_hash', ?)",
-            (salt, key_hash)
+            "INSERT OR REPLACE INTO meta (key, value) VALUES "
+            "('master_key_salt', ?), ('master_key_hash', ?), ('master_key_kdf', ?)",
+            (salt, key_hash, kdf)
         )
         self.commit()
 
     def get_master_key_meta(self) -> dict | None:
-        self.execute("SELECT key, value FROM meta WHERE key IN ('master_key_salt', 'master_key_hash')")
+        self.execute("SELECT key, value FROM meta WHERE key IN ('master_key_salt', 'master_key_hash', 'master_key_kdf')")
         rows = self.cursor.fetchall()
         return {key: value for key, value in rows} if rows else None
 
+    # Meta
+    def get_meta(self, key: str) -> str | None:
+        self.execute("SELECT value FROM meta WHERE key = ?", (key,))
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        self.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def delete_meta(self, key: str):
+        self.execute("DELETE FROM meta WHERE key = ?", (key,))
+
+    # Schema upgrades
+    def ensure_column(self, table: str, column: str, definition: str, commit: bool = True):
+        # CREATE TABLE IF NOT EXISTS eski veritabanina yeni kolon eklemez
+        self.execute(f"PRAGMA table_info({table})")
+        columns = {row[1] for row in self.cursor.fetchall()}
+        if column not in columns:
+            self.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}", commit=commit)
+
+    def has_duplicate_accounts(self) -> bool:
+        # Eski veritabaninda ayni (site, username) birden fazla olabilir
+        self.execute("""
+            SELECT 1 FROM accounts
+            GROUP BY site, username
+            HAVING COUNT(*) > 1
+            LIMIT 1
+        """)
+        return self.cursor.fetchone() is not None
+
+    def get_user_version(self) -> int:
+        self.execute("PRAGMA user_version")
+        return self.cursor.fetchone()[0]
+
+    def set_user_version(self, version: int):
+        # PRAGMA parametre almaz; int() ile sadece sayi gecer
+        self.execute(f"PRAGMA user_version = {int(version)}")
+
+    def get_logs(self, level: str | None = None, since: str | None = None, limit: int = 100) -> list[Log]:
+        conditions, params = [], []
+        if level is not None:
+            conditions.append("level = ?")
+            params.append(level)
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        self.execute(
+            f"SELECT id, action, detail, level, created_at FROM logs {where} ORDER BY created_at DESC LIMIT ?",
+            (*params, limit)
+        )
+        return [Log.from_row(row) for row in self.cursor.fetchall()]
+
     def log(self, level: str, action: str, message: str):
         query = "INSERT INTO logs (action, detail, level, created_at) VALUES (?, ?, ?, ?)"
         # message parametresi 'detail' sütununa kaydediliyor
@@ -0,0 +1,79 @@
+"""
+    Sicak sorgularin index kullandigini EXPLAIN QUERY PLAN ile dogrular.
+
+    Sorgular StorageService / SearchService metotlari gercekten cagrilarak
+    yakalanir (trace callback), yani SQL degisirse test de onu gorur.
+    accounts veya logs uzerinde index'siz tam tarama (SCAN ... USING'siz)
+    gorulurse test kalir.
+
+    Calistirma:
+        python -m pytest tests/test_query_plans.py
+"""
+
+import pytest
+
+from benchmarks.common import open_vault, populate_accounts, temp_db_path
+from services.search_service import SearchService
+
+CHECKED_TABLES = ("accounts", "logs", "a")
+
+# (etiket, storage / search / ornek hesap ile sorguyu calistiran fonksiyon)
+HOT_QUERIES = [
+    ("get_account_by_id", lambda storage, search, sample: storage.get_account_by_id(sample.id)),
+    ("get_accounts_by_category_id", lambda storage, search, sample: storage.get_accounts_by_category_id(1)),
+    ("get_accounts_page (category)", lambda storage, search, sample: storage.get_accounts_page(0, 200, 1)),
+    ("get_accounts_page_by_site",
+     lambda storage, search, sample: storage.get_accounts_page_by_site(sample.site, sample.id, 200)),
+    ("get_categories_with_stats", lambda storage, search, sample: storage.get_categories_with_stats()),
+    ("account_exists", lambda storage, search, sample: storage.account_exists(sample.site, sample.username)),
+    ("get_logs (level)", lambda storage, search, sample: storage.get_logs("ERROR")),
+    ("get_logs (since)", lambda storage, search, sample: storage.get_logs(None, "2000-01-01")),
+    ("get_logs (latest)", lambda storage, search, sample: storage.get_logs()),
+    ("global_search (fts)", lambda storage, search, sample: search.global_search("git")),
+    ("search_in_category (fts)", lambda storage, search, sample: search.search_in_category(1, "git")),
+]
+
+
+def capture(storage, fn) -> list[str]:
+    statements = []
+    storage.conn.set_trace_callback(statements.append)
+    try:
+        result = fn()
+        if hasattr(result, "__next__"):
+            next(result, None)
+    finally:
+        storage.conn.set_trace_callback(None)
+    return [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+
+
+def full_scans(storage, sql: str) -> list[str]:
+    plan = [row[3] for row in storage.conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+    return [
+        detail for detail in plan
+        if detail.startswith("SCAN ")
+        and detail.split()[1] in CHECKED_TABLES
+        and "USING" not in detail
+    ]
+
+
+@pytest.fixture(scope="module")
+def vault():
+    storage = open_vault(temp_db_path())
+    populate_accounts(storage, 2000)
+    for level in ("INFO", "ERROR", "SECURITY"):
+        storage.log(level, "CHECK", "query plan")
+    storage.commit()
+    storage.execute("ANALYZE", commit=True)
+
+    yield storage, SearchService(storage), storage.get_accounts_page(0, 1)[0]
+    storage.close()
+
+
+@pytest.mark.parametrize("label, query", HOT_QUERIES, ids=[label for label, _ in HOT_QUERIES])
+def test_hot_query_uses_index(vault, label, query):
+    storage, search, sample = vault
+    statements = capture(storage, lambda: query(storage, search, sample))
+    assert statements, f"{label}: SELECT yakalanmadi"
+
+    for sql in statements:
+        assert not full_scans(storage, sql), f"{label}: tam tarama\n{sql}"
@@ -0,0 +1,269 @@
+"""
+    Hesap listesi icin model + delegate (QListView ile sanal liste).
+
+    Yapar:
+        hesaplari QAbstractListModel'de id sirasiyla tutar, widget olusturmaz
+        tek satir ekleme / guncelleme / silme (bisect ile, tum listeyi yenilemeden)
+        sayfa kaynagi verilirse ilk sayfayi yukler, gerisini scroll'da keyset ile ceker
+            (canFetchMore / fetchMore)
+        sadece gorunen satirlari delegate ile cizer
+            (hover'da sadece imlecin altindaki buton vurgulanir)
+        Copy / Edit / Delete tiklamalarini sinyal olarak disari verir
+
+    Yapmaz:
+        decrypt, SQL
+"""
+
+from bisect import bisect_left
+
+from PyQt5.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, pyqtSignal
+)
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+
+from utils.constants import DEFAULT_PAGE_SIZE
+
+ACCOUNT_ROLE = Qt.UserRole + 1
+
+CARD_HEIGHT = 90
+CARD_SPACING = 15
+CARD_RIGHT_MARGIN = 15
+DEFAULT_COLOR = "#3B82F6"
+
+# (etiket, genislik, yazi rengi, kenarlik, hover arka plan)
+BUTTONS = [
+    ("Copy", 70, "#4F46E5", "#E0E7FF", "#EEF2FF"),
+    ("Edit", 60, "#F59E0B", "#FEF3C7", "#FFFBEB"),
+    ("Delete", 70, "#EF4444", "#FEE2E2", "#FEF2F2"),
+]
+
+
+class AccountListModel(QAbstractListModel):
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._accounts = []
+        self._ids = []
+        self._fetch_page = None
+        self._page_size = DEFAULT_PAGE_SIZE
+        self._has_more = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._accounts)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        account = self._accounts[index.row()]
+        if role == Qt.DisplayRole:
+            return account.site
+        if role == ACCOUNT_ROLE:
+            return account
+        return None
+
+    def set_accounts(self, accounts: list):
+        # Storage ve arama sonuclari id sirasinda gelir
+        self.beginResetModel()
+        self._fetch_page = None
+        self._has_more = False
+        self._accounts = list(accounts)
+        self._ids = [account.id for account in self._accounts]
+        self.endResetModel()
+
+    def set_page_source(self, fetch_page, page_size: int = DEFAULT_PAGE_SIZE):
+        # fetch_page(after_id, limit) -> id sirasinda en fazla limit hesap
+        page = fetch_page(0, page_size)
+
+        self.beginResetModel()
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._has_more = len(page) == page_size
+        self._accounts = list(page)
+        self._ids = [account.id for account in self._accounts]
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+
+        after_id = self._ids[-1] if self._ids else 0
+        page = self._fetch_page(after_id, self._page_size)
+        self._has_more = len(page) == self._page_size
+        if not page:
+            return
+
+        first = len(self._accounts)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._accounts.extend(page)
+        self._ids.extend(account.id for account in page)
+        self.endInsertRows()
+
+    def _row_of(self, account_id: int) -> int:
+        row = bisect_left(self._ids, account_id)
+        if row < len(self._ids) and self._ids[row] == account_id:
+            return row
+        return -1
+
+    def upsert_account(self, account):
+        row = self._row_of(account.id)
+        if row >= 0:
+            self._accounts[row] = account
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return
+
+        # Henuz yuklenmemis sayfaya dusuyorsa o sayfa gelince zaten gelecek
+        if self._has_more and self._ids and account.id > self._ids[-1]:
+            return
+
+        row = bisect_left(self._ids, account.id)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._accounts.insert(row, account)
+        self._ids.insert(row, account.id)
+        self.endInsertRows()
+
+    def remove_account(self, account_id: int):
+        row = self._row_of(account_id)
+        if row < 0:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._accounts[row]
+        del self._ids[row]
+        self.endRemoveRows()
+
+    def account_at(self, row: int):
+        return self._accounts[row]
+
+
+class AccountCardDelegate(QStyledItemDelegate):
+    copy_requested = pyqtSignal(object)
+    edit_requested = pyqtSignal(object)
+    delete_requested = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.category_colors = {}
+        # (satir, buton sirasi): imlecin altindaki buton, yoksa None
+        self._hovered_button = None
+
+        self._site_font = QFont()
+        self._site_font.setPixelSize(17)
+        self._site_font.setBold(True)
+        self._user_font = QFont()
+        self._user_font.setPixelSize(14)
+        self._icon_font = QFont()
+        self._icon_font.setPixelSize(20)
+        self._icon_font.setWeight(QFont.Black)
+        self._button_font = QFont()
+        self._button_font.setPixelSize(13)
+        self._button_font.setWeight(QFont.DemiBold)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), CARD_HEIGHT + CARD_SPACING)
+
+    # Geometry
+    def _card_rect(self, rect: QRect) -> QRect:
+        return QRect(rect.left(), rect.top(), rect.width() - CARD_RIGHT_MARGIN, CARD_HEIGHT)
+
+    def _button_rects(self, card: QRect) -> list[QRect]:
+        rects = []
+        right = card.right() - 25
+        for _label, width, *_ in reversed(BUTTONS):
+            left = right - width
+            rects.append(QRect(left, card.center().y() - 18, width, 36))
+            right = left - 10
+        return list(reversed(rects))
+
+    # Painting
+    def paint(self, painter: QPainter, option, index):
+        account = index.data(ACCOUNT_ROLE)
+        if account is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        theme_color = QColor(self.category_colors.get(account.category_id, DEFAULT_COLOR))
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        card = self._card_rect(option.rect)
+
+        # Kart: normalde gri kenarlik, hover'da kategori renginde
+        painter.setPen(QPen(theme_color, 2) if hovered else QPen(QColor("#E2E8F0"), 1))
+        painter.setBrush(QColor("#F8FAFC") if hovered else QColor("white"))
+        painter.drawRoundedRect(card.adjusted(1, 1, -1, -1), 16, 16)
+
+        # Ikon
+        icon_rect = QRect(card.left() + 25, card.center().y() - 22, 45, 45)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(theme_color)
+        painter.drawEllipse(icon_rect)
+        painter.setPen(QColor("white"))
+        painter.setFont(self._icon_font)
+        painter.drawText(icon_rect, Qt.AlignCenter, account.site[0].upper() if account.site else "?")
+
+        # Site / username
+        button_rects = self._button_rects(card)
+        text_left = icon_rect.right() + 20
+        text_width = button_rects[0].left() - 20 - text_left
+        painter.setFont(self._site_font)
+        painter.setPen(QColor("#1E293B"))
+        painter.drawText(
+            QRect(text_left, card.center().y() - 24, text_width, 24),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            painter.fontMetrics().elidedText(account.site, Qt.ElideRight, text_width)
+        )
+        painter.setFont(self._user_font)
+        painter.setPen(QColor("#64748B"))
+        painter.drawText(
+            QRect(text_left, card.center().y() + 2, text_width, 22),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            painter.fontMetrics().elidedText(account.username, Qt.ElideRight, text_width)
+        )
+
+        # Butonlar: sadece imlecin altindaki vurgulanir
+        painter.setFont(self._button_font)
+        for position, ((label, _width, text_color, border, hover_bg), rect) in enumerate(zip(BUTTONS, button_rects)):
+            active = hovered and self._hovered_button == (index.row(), position)
+            painter.setPen(QPen(QColor(border), 1))
+            painter.setBrush(QColor(hover_bg) if active else QColor("white"))
+            painter.drawRoundedRect(rect, 8, 8)
+            painter.setPen(QColor(text_color))
+            painter.drawText(rect, Qt.AlignCenter, label)
+
+        painter.restore()
+
+    def _button_at(self, option, pos) -> int | None:
+        for position, rect in enumerate(self._button_rects(self._card_rect(option.rect))):
+            if rect.contains(pos):
+                return position
+        return None
+
+    def _track_hover(self, option, index, pos):
+        # View ayni satir icindeki hareketi yeniden cizmez: buton degisince satir elle cizdirilir
+        position = self._button_at(option, pos)
+        hovered = None if position is None else (index.row(), position)
+        if hovered != self._hovered_button:
+            self._hovered_button = hovered
+            if option.widget is not None:
+                option.widget.viewport().update(option.rect)
+
+    # Hover / clicks
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseMove:
+            self._track_hover(option, index, event.pos())
+            return False
+
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+
+        position = self._button_at(option, event.pos())
+        if position is None:
+            return False
+        signals = [self.copy_requested, self.edit_requested, self.delete_requested]
+        signals[position].emit(index.data(ACCOUNT_ROLE))
+        return True
@@ -37,6 +37,10 @@ class CategoryCard(QFrame):
         # Stili EN SON uyguluyoruz (Artık count_label var olduğu için hata vermez)
         self.update_style()
 
+    def set_count(self, count: int):
+        self.count = count
+        self.count_label.setText(str(count))
+
     def set_active(self, active: bool):
         self.is_active = active
         self.update_style()
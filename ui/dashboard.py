@@ -2,19 +2,27 @@ from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout,
     QLabel, QPushButton, QLineEdit,
     QFrame, QScrollArea, QApplication,
-    QSizePolicy, QGraphicsDropShadowEffect
+    QSizePolicy, QGraphicsDropShadowEffect,
+    QListView, QAbstractItemView
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from ui.category_card import CategoryCard
+from ui.account_list import AccountListModel, AccountCardDelegate
+from models.change_event import AccountChange
+from utils.instrumentation import instrumented
 
 class Dashboard(QWidget):
     add_account_clicked = pyqtSignal()
+    import_clicked = pyqtSignal()
+    export_clicked = pyqtSignal()
     search_changed = pyqtSignal(str)
     category_selected = pyqtSignal(int)
     delete_account_requested = pyqtSignal(int)
-    copy_password_requested = pyqtSignal(str)
+    copy_password_requested = pyqtSignal(object)
     edit_account_requested = pyqtSignal(object)
 
+    EMPTY_TEXT = "No accounts found."
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("LockLock Dashboard")
@@ -29,6 +37,7 @@ class Dashboard(QWidget):
         
         self.category_widgets = []
         self.category_colors = {} 
+        self.active_category_id = 0
         
         # --- RENK PALETİ ---
         self.COLOR_MAP = {
@@ -114,24 +123,57 @@ class Dashboard(QWidget):
             QPushButton:hover { background-color: #4338CA; }
         """)
 
+        self.import_btn = QPushButton("Import")
+        self.import_btn.setFixedHeight(50)
+        self.import_btn.setCursor(Qt.PointingHandCursor)
+        self.import_btn.clicked.connect(self.import_clicked.emit)
+        self.import_btn.setStyleSheet("""
+            QPushButton { background-color: white; color: #4F46E5; border: 1px solid #E0E7FF; border-radius: 12px; font-weight: 700; font-size: 14px; padding: 0 20px; }
+            QPushButton:hover { background-color: #EEF2FF; border: 1px solid #C7D2FE; }
+        """)
+
+        self.export_btn = QPushButton("Export")
+        self.export_btn.setFixedHeight(50)
+        self.export_btn.setCursor(Qt.PointingHandCursor)
+        self.export_btn.clicked.connect(self.export_clicked.emit)
+        self.export_btn.setStyleSheet(self.import_btn.styleSheet())
+
         header.addWidget(self.search_input)
         header.addSpacing(20)
+        header.addWidget(self.import_btn)
+        header.addSpacing(10)
+        header.addWidget(self.export_btn)
+        header.addSpacing(10)
         header.addWidget(self.add_btn)
 
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setFrameShape(QFrame.NoFrame)
-        self.scroll_area.setStyleSheet("background: transparent; border: none;")
-        self.cards_container = QWidget()
-        self.cards_container.setStyleSheet("background: transparent;")
-        self.cards_layout = QVBoxLayout(self.cards_container)
-        self.cards_layout.setSpacing(15)
-        self.cards_layout.setContentsMargins(0, 0, 15, 0)
-        self.cards_layout.addStretch()
-        self.scroll_area.setWidget(self.cards_container)
+        # Sanal liste: sadece gorunen satirlar delegate ile cizilir, satir basina widget yok
+        self.account_model = AccountListModel(self)
+        self.card_delegate = AccountCardDelegate(self)
+        self.card_delegate.copy_requested.connect(self.copy_password_requested.emit)
+        self.card_delegate.edit_requested.connect(self.edit_account_requested.emit)
+        self.card_delegate.delete_requested.connect(
+            lambda account: self.delete_account_requested.emit(account.id)
+        )
+
+        self.account_view = QListView()
+        self.account_view.setModel(self.account_model)
+        self.account_view.setItemDelegate(self.card_delegate)
+        self.account_view.setUniformItemSizes(True)
+        self.account_view.setMouseTracking(True)
+        self.account_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.account_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.account_view.setFrameShape(QFrame.NoFrame)
+        self.account_view.setFocusPolicy(Qt.NoFocus)
+        self.account_view.setStyleSheet("QListView { background: transparent; border: none; }")
+
+        self.empty_label = QLabel(self.EMPTY_TEXT)
+        self.empty_label.setStyleSheet("color: #9CA3AF; font-size: 16px; margin-top: 30px; font-weight: 500;")
+        self.empty_label.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self.empty_label.hide()
 
         content_layout.addLayout(header)
-        content_layout.addWidget(self.scroll_area)
+        content_layout.addWidget(self.empty_label)
+        content_layout.addWidget(self.account_view)
 
         main_layout.addWidget(sidebar)
         main_layout.addWidget(content)
@@ -143,6 +185,7 @@ class Dashboard(QWidget):
         
         self.category_widgets = []
         self.category_colors = {}
+        self.active_category_id = 0
 
         all_card = CategoryCard(0, "All Accounts", total_count)
         all_card.clicked.connect(self.handle_category_click)
@@ -162,112 +205,69 @@ class Dashboard(QWidget):
             
         self.cat_layout.addStretch()
 
-    def update_account_list(self, accounts: list):
-        while self.cards_layout.count() > 1:
-            item = self.cards_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
+        self.card_delegate.category_colors = self.category_colors
+        self.account_view.viewport().update()
 
-        if not accounts:
-            lbl = QLabel("No accounts found.")
-            lbl.setStyleSheet("color: #9CA3AF; font-size: 16px; margin-top: 30px; font-weight: 500;")
-            lbl.setAlignment(Qt.AlignCenter)
-            self.cards_layout.insertWidget(0, lbl)
+    @instrumented("ui.update_account_list")
+    def update_account_list(self, accounts: list):
+        self.account_model.set_accounts(accounts)
+
+        has_accounts = bool(accounts)
+        self.account_view.setVisible(has_accounts)
+        self.empty_label.setText(self.EMPTY_TEXT)
+        self.empty_label.setVisible(not has_accounts)
+
+    def show_search_error(self, message: str):
+        # Eski sonuclar hatali aramanin sonucu gibi gorunmesin
+        self.account_model.set_accounts([])
+        self.account_view.setVisible(False)
+        self.empty_label.setText(f"Search failed: {message}")
+        self.empty_label.setVisible(True)
+
+    @instrumented("ui.load_account_pages")
+    def load_account_pages(self, fetch_page):
+        # Ilk sayfa hemen gosterilir, kalanlar QListView scroll ettikce fetchMore ile gelir
+        self.account_model.set_page_source(fetch_page)
+
+        has_accounts = self.account_model.rowCount() > 0
+        self.account_view.setVisible(has_accounts)
+        self.empty_label.setText(self.EMPTY_TEXT)
+        self.empty_label.setVisible(not has_accounts)
+
+    def apply_account_change(self, change: AccountChange, patch_rows: bool = True):
+        # Sadece etkilenen satir ve kategori sayaclari guncellenir
+        if change.kind == AccountChange.ADDED:
+            self._shift_category_count(change.new_category_id, 1)
+            self._shift_category_count(0, 1)
+        elif change.kind == AccountChange.DELETED:
+            self._shift_category_count(change.old_category_id, -1)
+            self._shift_category_count(0, -1)
+        elif change.category_changed:
+            self._shift_category_count(change.old_category_id, -1)
+            self._shift_category_count(change.new_category_id, 1)
+
+        if not patch_rows:
             return
 
-        for acc in accounts:
-            card = self._create_account_card(acc)
-            self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)
-
-    def _create_account_card(self, account):
-        card = QFrame()
-        card.setFixedHeight(90)
-
-        # Rengi al
-        theme_color = self.category_colors.get(account.category_id, "#3B82F6")
-
-        # --- DÜZELTME BURADA ---
-        # Normalde: Standart gri kenarlık (Sakin görünüm)
-        # Hover: Kategori renginde kenarlık (Canlı görünüm)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 1px solid #E2E8F0;
-                border-radius: 16px;
-            }}
-            QFrame:hover {{
-                background-color: #F8FAFC;
-                border: 2px solid {theme_color};
-            }}
-        """)
+        account = change.account
+        visible = account is not None and self.active_category_id in (0, account.category_id)
+        if visible:
+            self.account_model.upsert_account(account)
+        else:
+            self.account_model.remove_account(change.account_id)
 
-        layout = QHBoxLayout(card)
-        layout.setContentsMargins(25, 0, 25, 0)
-        layout.setSpacing(20)
-
-        # İkon daima renkli kalsın ki ayırt edilebilsin
-        icon_lbl = QLabel(account.site[0].upper() if account.site else "?")
-        icon_lbl.setFixedSize(45, 45)
-        icon_lbl.setAlignment(Qt.AlignCenter)
-        icon_lbl.setStyleSheet(f"""
-            background-color: {theme_color};
-            color: white;
-            font-size: 20px;
-            font-weight: 800;
-            border-radius: 22px;
-            border: none;
-        """)
-
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(4)
-        info_layout.setAlignment(Qt.AlignVCenter)
-        site_lbl = QLabel(account.site)
-        site_lbl.setStyleSheet("border: none; background: transparent; font-size: 17px; font-weight: 700; color: #1E293B;")
-        user_lbl = QLabel(account.username)
-        user_lbl.setStyleSheet("border: none; background: transparent; font-size: 14px; font-weight: 500; color: #64748B;")
-        info_layout.addWidget(site_lbl)
-        info_layout.addWidget(user_lbl)
-
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(10)
-
-        copy_btn = QPushButton("Copy")
-        copy_btn.setFixedSize(70, 36)
-        copy_btn.setCursor(Qt.PointingHandCursor)
-        copy_btn.setStyleSheet("""
-            QPushButton { background-color: white; color: #4F46E5; border: 1px solid #E0E7FF; border-radius: 8px; font-weight: 600; font-size: 13px; }
-            QPushButton:hover { background-color: #EEF2FF; border: 1px solid #C7D2FE; }
-        """)
-        copy_btn.clicked.connect(lambda: self.copy_password_requested.emit(account.encrypted_password))
-
-        edit_btn = QPushButton("Edit")
-        edit_btn.setFixedSize(60, 36)
-        edit_btn.setCursor(Qt.PointingHandCursor)
-        edit_btn.setStyleSheet("""
-            QPushButton { background-color: white; color: #F59E0B; border: 1px solid #FEF3C7; border-radius: 8px; font-weight: 600; font-size: 13px; }
-            QPushButton:hover { background-color: #FFFBEB; border: 1px solid #FDE68A; }
-        """)
-        edit_btn.clicked.connect(lambda: self.edit_account_requested.emit(account))
-
-        del_btn = QPushButton("Delete")
-        del_btn.setFixedSize(70, 36)
-        del_btn.setCursor(Qt.PointingHandCursor)
-        del_btn.setStyleSheet("""
-            QPushButton { background-color: white; color: #EF4444; border: 1px solid #FEE2E2; border-radius: 8px; font-weight: 600; font-size: 13px; }
-            QPushButton:hover { background-color: #FEF2F2; border: 1px solid #FECACA; }
-        """)
-        del_btn.clicked.connect(lambda: self.delete_account_requested.emit(account.id))
+        has_accounts = self.account_model.rowCount() > 0
+        self.account_view.setVisible(has_accounts)
+        self.empty_label.setVisible(not has_accounts)
 
-        btn_layout.addWidget(copy_btn)
-        btn_layout.addWidget(edit_btn)
-        btn_layout.addWidget(del_btn)
-
-        layout.addWidget(icon_lbl)
-        layout.addLayout(info_layout)
-        layout.addStretch()
-        layout.addLayout(btn_layout)
-        return card
+    def _shift_category_count(self, category_id, delta: int):
+        for widget in self.category_widgets:
+            if widget.category_id == category_id:
+                widget.set_count(widget.count + delta)
+                return
 
     def handle_category_click(self, cat_id):
+        self.active_category_id = cat_id
         for widget in self.category_widgets:
             widget.set_active(widget.category_id == cat_id)
         self.category_selected.emit(cat_id)
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+    Kullanici hareketsizligini izler (auto-lock icin).
+
+    Yapar:
+        QApplication'a event filter kurar, klavye / fare / tekerlek olaylarinda
+            sayaci yeniden baslatir (saniyede en fazla bir kez, her mouse move'da degil)
+        timeout_seconds boyunca olay gelmezse idle sinyali yollar
+
+    Yapmaz:
+        vault'u kilitlemek (main.py idle sinyaline baglanir)
+"""
+
+import time
+
+from PyQt5.QtCore import QEvent, QObject, QTimer, pyqtSignal
+
+ACTIVITY_EVENTS = {
+    QEvent.KeyPress,
+    QEvent.MouseButtonPress,
+    QEvent.MouseMove,
+    QEvent.Wheel,
+    QEvent.TouchBegin,
+}
+RESTART_THROTTLE_SECONDS = 1.0
+
+
+class IdleWatcher(QObject):
+
+    idle = pyqtSignal()
+
+    def __init__(self, app, timeout_seconds: float, parent=None):
+        super().__init__(parent)
+        self._app = app
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(int(timeout_seconds * 1000))
+        self._timer.timeout.connect(self.idle.emit)
+        self._last_restart = 0.0
+
+    def start(self):
+        if self._timer.interval() <= 0:
+            return
+        self._app.installEventFilter(self)
+        self._restart()
+
+    def stop(self):
+        self._app.removeEventFilter(self)
+        self._timer.stop()
+
+    def eventFilter(self, obj, event):
+        if event.type() in ACTIVITY_EVENTS:
+            now = time.monotonic()
+            if now - self._last_restart >= RESTART_THROTTLE_SECONDS:
+                self._restart(now)
+        return False
+
+    def _restart(self, now: float | None = None):
+        self._last_restart = time.monotonic() if now is None else now
+        self._timer.start()
@@ -0,0 +1,43 @@
+"""
+Bellek ici arama indexini (SearchIndex) GUI thread disinda kurar.
+
+Yapar:
+    kendi StorageService connection'i ile hesaplari okur
+    yeni bir SearchIndex kurar ve built sinyali ile GUI thread'e verir
+        (canli index'e dokunmaz; VaultController.install_search_index degistirir)
+
+Yapmaz:
+    kurulum sirasindaki add / update / delete'leri izlemek
+        (VaultController biriktirip yeni index'e uygular)
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from services.search_index import SearchIndex
+from services.storage_service import StorageService
+
+
+class IndexWorker(QThread):
+
+    built = pyqtSignal(int, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, db_path, pragmas: dict, generation: int, parent=None):
+        super().__init__(parent)
+        self._db_path = db_path
+        self._pragmas = pragmas
+        self._generation = generation
+
+    def run(self):
+        storage = StorageService(self._db_path, pragmas=self._pragmas)
+        try:
+            storage.connect()
+            index = SearchIndex()
+            index.build(storage.get_all_accounts())
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        finally:
+            storage.close()
+
+        self.built.emit(self._generation, index)
@@ -1,12 +1,14 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QLabel,
-    QLineEdit, QPushButton, QFrame, QGraphicsDropShadowEffect
+    QLineEdit, QPushButton, QFrame, QGraphicsDropShadowEffect,
+    QProgressBar
 )
 from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QColor  # <--- EKLENDİ: Renk sınıfı buradan gelir
 
 class LoginScreen(QMainWindow):
     login_requested = pyqtSignal(str)
+    closing = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -20,6 +22,7 @@ class LoginScreen(QMainWindow):
                                           stop:0 #EEF2FF, stop:1 #E0E7FF);
             }
         """)
+        self._idle_button_text = None
         self._build_ui()
 
     def _build_ui(self):
@@ -121,6 +124,24 @@ class LoginScreen(QMainWindow):
             }
         """)
 
+        # Key derivation suresince gosterilen belirsiz ilerleme cubugu
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setFixedHeight(6)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setStyleSheet("""
+            QProgressBar {
+                background-color: #E0E7FF;
+                border: none;
+                border-radius: 3px;
+            }
+            QProgressBar::chunk {
+                background-color: #4F46E5;
+                border-radius: 3px;
+            }
+        """)
+        self.progress_bar.hide()
+
         self.error_label = QLabel("")
         self.error_label.setAlignment(Qt.AlignCenter)
         self.error_label.setWordWrap(True)
@@ -132,6 +153,7 @@ class LoginScreen(QMainWindow):
         card_layout.addWidget(subtitle)
         card_layout.addWidget(self.password_input)
         card_layout.addWidget(self.login_button)
+        card_layout.addWidget(self.progress_bar)
         card_layout.addWidget(self.error_label)
         card_layout.addStretch()
 
@@ -142,6 +164,21 @@ class LoginScreen(QMainWindow):
         if password:
             self.login_requested.emit(password)
 
+    def set_busy(self, busy: bool):
+        self.password_input.setEnabled(not busy)
+        self.login_button.setEnabled(not busy)
+        self.progress_bar.setVisible(busy)
+        if busy:
+            self._idle_button_text = self.login_button.text()
+            self.login_button.setText("Unlocking...")
+            self.error_label.hide()
+        elif self._idle_button_text is not None:
+            self.login_button.setText(self._idle_button_text)
+
+    def closeEvent(self, event):
+        self.closing.emit()
+        super().closeEvent(event)
+
     def show_error(self, message: str):
         self.error_label.setText(message)
         self.error_label.show()
@@ -149,6 +186,12 @@ class LoginScreen(QMainWindow):
         self.password_input.selectAll()
         self.password_input.setStyleSheet(self.password_input.styleSheet().replace("#4F46E5", "#EF4444"))
 
+    def set_unlock_mode(self):
+        # Auto-lock sonrasi: ilk kurulum metinleri yerine normal unlock ekrani
+        self.setWindowTitle("LockLock")
+        self.login_button.setText("Unlock")
+        self.password_input.setPlaceholderText("Master Password")
+
     def clear(self):
         self.password_input.clear()
         self.error_label.hide()
@@ -0,0 +1,56 @@
+"""
+Key rotation'da hesaplari GUI thread disinda yeni key'e tasir.
+
+Yapar:
+    kendi StorageService connection'ini acar (GUI connection'i thread'ler arasi kullanilamaz)
+    KeyRotationService.rotate_in_chunks'i calistirir, ilerlemeyi sinyal ile yollar
+    cancel'da batch arasinda durur; checkpoint kalir, sonraki unlock'ta devam edilir
+
+Yapmaz:
+    key yuklemek / search index / log (VaultController.begin/finish_key_rotation, GUI thread'de)
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from services.key_rotation_service import KeyRotationService
+from services.storage_service import StorageService
+
+
+class RotationWorker(QThread):
+
+    progress = pyqtSignal(int, int)
+    rotated = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, db_path, pragmas: dict, old_key: bytes, new_key: bytes, parent=None):
+        super().__init__(parent)
+        self._db_path = db_path
+        self._pragmas = pragmas
+        self._old_key = old_key
+        self._new_key = new_key
+
+    def run(self):
+        storage = StorageService(self._db_path, pragmas=self._pragmas)
+        try:
+            storage.connect()
+            count = KeyRotationService(storage).rotate_in_chunks(
+                self._old_key, self._new_key,
+                progress=self.progress.emit,
+                should_stop=self.isInterruptionRequested
+            )
+        except Exception as e:
+            if not self.isInterruptionRequested():
+                self.failed.emit(str(e))
+            return
+        finally:
+            storage.close()
+            self._old_key = None
+            self._new_key = None
+
+        if count is not None and not self.isInterruptionRequested():
+            self.rotated.emit(count)
+
+    def cancel(self):
+        # En fazla bir batch'in bitmesi beklenir
+        self.requestInterruption()
+        self.wait()
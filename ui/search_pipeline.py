@@ -0,0 +1,133 @@
+"""
+    Dashboard aramasi icin debounce + iptal + arka plan thread'i.
+
+    Yapar:
+        her tus vurusunda timer'i yeniden baslatir, yazma durunca tek sorgu atar
+        sorguyu QThreadPool'da calistirir, ayni anda en fazla bir sorgu calisir
+        eski sorgularin sonuclarini atar (generation sayaci)
+        tus / sorgu / atilan sonuc sayilarini tutar
+
+    Yapmaz:
+        sonucu cizmez (results_ready sinyali ile Dashboard'a gider)
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+DEFAULT_DEBOUNCE_MS = 200
+
+
+class _TaskSignals(QObject):
+    done = pyqtSignal(int, str, object)
+    failed = pyqtSignal(int, str)
+
+
+class _SearchTask(QRunnable):
+
+    def __init__(self, search_fn, keyword: str, generation: int):
+        super().__init__()
+        self.search_fn = search_fn
+        self.keyword = keyword
+        self.generation = generation
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            results = self.search_fn(self.keyword)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.done.emit(self.generation, self.keyword, results)
+
+
+class SearchPipeline(QObject):
+    results_ready = pyqtSignal(str, object)
+    search_failed = pyqtSignal(str)
+
+    def __init__(self, search_fn, debounce_ms: int = DEFAULT_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.search_fn = search_fn
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._dispatch)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._generation = 0
+        self._pending_keyword = ""
+        self._running = False
+        self._dirty = False
+        self._active_task = None
+
+        # Instrumentation
+        self.keystrokes = 0
+        self.queries_issued = 0
+        self.results_dropped = 0
+
+    def submit(self, keyword: str):
+        self.keystrokes += 1
+        self._generation += 1
+        self._pending_keyword = keyword
+        self._timer.start()
+
+    def refresh(self, keyword: str | None = None):
+        # Veri degisti: son (veya verilen) keyword'u debounce beklemeden tekrar calistir
+        if keyword is not None:
+            self._pending_keyword = keyword
+        self._generation += 1
+        self._timer.stop()
+        self._dispatch()
+
+    def cancel(self):
+        # Bekleyen ve calisan sorgularin sonuclari artik kullanilmaz
+        self._generation += 1
+        self._timer.stop()
+        self._dirty = False
+
+    def shutdown(self):
+        self.cancel()
+        self._pool.waitForDone()
+
+    def stats(self) -> dict:
+        return {
+            "keystrokes": self.keystrokes,
+            "queries_issued": self.queries_issued,
+            "results_dropped": self.results_dropped,
+        }
+
+    def _dispatch(self):
+        # Bir sorgu zaten calisiyorsa bitince en son keyword ile tekrar denenir
+        if self._running:
+            self._dirty = True
+            return
+
+        task = _SearchTask(self.search_fn, self._pending_keyword, self._generation)
+        task.signals.done.connect(self._on_done)
+        task.signals.failed.connect(self._on_failed)
+
+        self._running = True
+        self._active_task = task
+        self.queries_issued += 1
+        self._pool.start(task)
+
+    def _on_done(self, generation: int, keyword: str, results):
+        self._task_finished()
+        if generation != self._generation:
+            self.results_dropped += 1
+            return
+        self.results_ready.emit(keyword, results)
+
+    def _on_failed(self, generation: int, message: str):
+        self._task_finished()
+        if generation != self._generation:
+            return
+        self.search_failed.emit(message)
+
+    def _task_finished(self):
+        self._running = False
+        self._active_task = None
+        if self._dirty:
+            self._dirty = False
+            self._dispatch()
@@ -0,0 +1,70 @@
+"""
+Toplu import / sifreli export'u GUI thread disinda calistirir.
+
+Yapar:
+    kendi StorageService connection'ini acar (GUI connection'i thread'ler arasi kullanilamaz)
+    verilen key ile kendi EncryptionService'ini kurar, is bitince key'i birakir
+    ImportService.import_file / ExportService.export_vault'u calistirir,
+        ilerlemeyi progress callback'inden sinyal ile yollar
+    raporu done sinyali ile GUI thread'e verir
+
+Yapmaz:
+    search index / audit log / dashboard (VaultController.finish_import / finish_export, GUI thread'de)
+    yarida kesmek: import batch'leri kendi transaction'inda yazilir, vault kilitlense de is biter
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from services.encryption_service import EncryptionService
+from services.export_service import ExportService
+from services.import_service import ImportService
+from services.storage_service import StorageService
+
+
+class _TransferWorker(QThread):
+
+    # (islenen satir, okunan satir; export'ta ikisi ayni)
+    progress = pyqtSignal(int, int)
+    done = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, db_path, pragmas: dict, key: bytes, path: str, parent=None):
+        super().__init__(parent)
+        self._db_path = db_path
+        self._pragmas = pragmas
+        self._key = key
+        self._path = path
+
+    def run(self):
+        storage = StorageService(self._db_path, pragmas=self._pragmas)
+        encryption = EncryptionService(storage)
+        try:
+            storage.connect()
+            encryption.load_key(self._key)
+            report = self._transfer(storage, encryption)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        finally:
+            encryption.clear_key()
+            storage.close()
+            self._key = None
+
+        self.done.emit(report)
+
+    def _transfer(self, storage, encryption):
+        raise NotImplementedError
+
+
+class ImportWorker(_TransferWorker):
+
+    def _transfer(self, storage, encryption):
+        return ImportService(storage, encryption).import_file(self._path, progress=self.progress.emit)
+
+
+class ExportWorker(_TransferWorker):
+
+    def _transfer(self, storage, encryption):
+        return ExportService(storage, encryption).export_vault(
+            self._path, progress=lambda rows: self.progress.emit(rows, rows)
+        )
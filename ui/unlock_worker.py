@@ -0,0 +1,43 @@
+"""
+Master password'den key turetmeyi (PBKDF2 / scrypt) GUI thread disinda calistirir.
+
+Yapar:
+    derive fonksiyonunu arka planda cagirir
+    sonucu sinyal ile GUI thread'e yollar
+
+Yapmaz:
+    storage / SQLite erisimi (connection GUI thread'e bagli)
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+class UnlockWorker(QThread):
+
+    key_derived = pyqtSignal(bytes)
+    failed = pyqtSignal(str)
+
+    def __init__(self, derive_fn, password: str, salt: bytes, parent=None):
+        super().__init__(parent)
+        self._derive_fn = derive_fn
+        self._password = password
+        self._salt = salt
+
+    def run(self):
+        try:
+            key = self._derive_fn(self._password, self._salt)
+        except Exception as e:
+            if not self.isInterruptionRequested():
+                self.failed.emit(str(e))
+            return
+        finally:
+            self._password = None
+
+        # Pencere kapandiysa sonucu GUI'ye gondermiyoruz
+        if not self.isInterruptionRequested():
+            self.key_derived.emit(key)
+
+    def cancel(self):
+        # KDF tek bir C cagrisi, yarida kesilemez; sonucu atip thread'i bekliyoruz
+        self.requestInterruption()
+        self.wait()
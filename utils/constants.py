@@ -0,0 +1,4 @@
+MIN_MASTER_PASSWORD_LENGTH = 8
+
+# Keyset sayfalama icin varsayilan sayfa boyu (storage, controller ve liste modeli ayni degeri kullanir)
+DEFAULT_PAGE_SIZE = 200
@@ -0,0 +1,19 @@
+import json
+import os
+
+
+def load_config(path: str) -> dict:
+    # Config yoksa veya bozuksa uygulama varsayilanlarla acilir
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_storage_profile(config: dict, name: str | None = None) -> dict:
+    database = config.get("database", {})
+    profiles = database.get("profiles", {})
+    return dict(profiles.get(name or database.get("profile", "default"), {}))
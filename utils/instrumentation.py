@@ -0,0 +1,198 @@
+"""
+    Sicak yollar icin hafif zamanlama katmani.
+
+    Yapar:
+        @instrumented("storage.execute") decorator'u ve span("...") context manager'i
+        her isim icin sayac + hata sayaci + log2 bucket'li latency histogrami tutar
+        p50 / p95 / p99'u bucket'lardan tahmin eder (ornekler saklanmaz, bellek sabit)
+        snapshot'i JSON olarak dosyaya yazar, debug paneli icin metin rapor uretir
+
+    Kapaliyken (varsayilan) maliyet: decorator'da tek bir global bool kontrolu,
+    span() icin paylasilan no-op nesne. Acmak icin enable() veya
+    config.json -> diagnostics.instrumentation.
+
+    Yapmaz:
+        SQL bazinda kirilim (StorageService profiler'i ayri)
+        diske periyodik yazma (sadece dump() cagrildiginda)
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+
+# Bucket ust sinirlari (mikrosaniye): 1us, 2us, 4us ... ~67s
+BUCKET_BOUNDS_US = [2 ** i for i in range(27)]
+
+_enabled = False
+_lock = threading.Lock()
+_registry: dict[str, "Histogram"] = {}
+
+
+class Histogram:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        # Son bucket: en buyuk sinirdan uzun surenler
+        self.buckets = [0] * (len(BUCKET_BOUNDS_US) + 1)
+
+    def add(self, seconds: float, error: bool = False):
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect_left(BUCKET_BOUNDS_US, seconds * 1_000_000)] += 1
+
+    def percentile(self, pct: float) -> float:
+        # Hedef siranin dustugu bucket'in ust siniri; gercek max'i asmaz
+        if not self.count:
+            return 0.0
+        target = max(1, round(pct / 100 * self.count))
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                if index >= len(BUCKET_BOUNDS_US):
+                    return self.max
+                return min(BUCKET_BOUNDS_US[index] / 1_000_000, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "min_ms": self.min * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "buckets_us": {
+                (f"<={BUCKET_BOUNDS_US[i]}" if i < len(BUCKET_BOUNDS_US) else f">{BUCKET_BOUNDS_US[-1]}"): n
+                for i, n in enumerate(self.buckets) if n
+            },
+        }
+
+
+# Toggle
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+# Recording
+def record(name: str, seconds: float, error: bool = False):
+    with _lock:
+        histogram = _registry.get(name)
+        if histogram is None:
+            histogram = _registry[name] = Histogram(name)
+        histogram.add(seconds, error)
+
+
+def instrumented(name: str | None = None):
+    def decorator(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                record(label, time.perf_counter() - start, error=True)
+                raise
+            record(label, time.perf_counter() - start)
+            return result
+
+        return wrapper
+    return decorator
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter() - self.start, error=exc_type is not None)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+# Reporting
+def snapshot() -> dict:
+    with _lock:
+        return {name: histogram.to_dict() for name, histogram in _registry.items()}
+
+
+def reset():
+    with _lock:
+        _registry.clear()
+
+
+def format_report(limit: int = 20) -> str:
+    # Toplam sureye gore en pahali isimler
+    rows = sorted(snapshot().items(), key=lambda item: item[1]["total_ms"], reverse=True)[:limit]
+    if not rows:
+        return "Kayit yok (instrumentation kapali veya henuz cagri yok)."
+
+    lines = [f"{'name':<32} {'count':>7} {'err':>4} {'total':>10} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"]
+    for name, stats in rows:
+        lines.append(
+            f"{name:<32} {stats['count']:>7} {stats['errors']:>4} {stats['total_ms']:>8.1f}ms "
+            f"{stats['p50_ms']:>7.3f}ms {stats['p95_ms']:>7.3f}ms {stats['p99_ms']:>7.3f}ms {stats['max_ms']:>7.3f}ms"
+        )
+    return "\n".join(lines)
+
+
+def dump(path: str) -> str:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"created_at": datetime.now().isoformat(), "metrics": snapshot()}, f, indent=2)
+    return path